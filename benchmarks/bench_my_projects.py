@@ -0,0 +1,249 @@
+"""
+Benchmark suite for the my-projects service and endpoints.
+
+For every size tier (see datagen.py) a fresh SQLite database is seeded
+deterministically, then each case is run `--iterations` times after
+`--warmup` runs. Every call gets a fresh session, like a request. Per case
+the suite records:
+
+- latency percentiles (p50/p90/p95/p99), mean, min and max in ms
+- SQL statements executed per call (max over the timed runs)
+- peak Python memory allocated during one call (tracemalloc)
+
+Results are written as sorted, indented JSON so two runs can be diffed:
+
+    PYTHONPATH=. python -m benchmarks.bench_my_projects
+    PYTHONPATH=. python -m benchmarks.bench_my_projects --tiers small medium --output before.json
+    PYTHONPATH=. python -m benchmarks.bench_my_projects --cases click --iterations 50
+
+The shared list cache is disabled except in the `[cached]` case, so the
+other cases always reach the database.
+"""
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sqlalchemy
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from core.database import Base, get_db
+from core.security import get_current_user
+from src.campaign.my_projects.cache import ProjectsCache, projects_cache
+from src.campaign.my_projects.router import router
+from src.campaign.my_projects.service import MyProjectsService, ProjectFilters, my_projects_service
+
+from benchmarks.datagen import FOCUS_USER_ID, TIERS, SizeTier, populate
+
+PAGE_SIZE = 20
+
+
+class Case(NamedTuple):
+    name: str
+    run: Callable[[], object]
+
+
+class QueryCounter:
+    """Counts statements executed on an engine"""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+@contextmanager
+def tier_database(tier: SizeTier, seed: int) -> Iterator[tuple]:
+    """Yield (engine, sessionmaker, row counts) for a freshly seeded tier"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            connect_args={"check_same_thread": False},
+        )
+        Base.metadata.create_all(bind=engine)
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        with SessionLocal() as db:
+            rows = populate(db, tier, seed)
+        try:
+            yield engine, SessionLocal, rows
+        finally:
+            engine.dispose()
+
+
+def build_cases(tier: SizeTier, SessionLocal) -> List[Case]:
+    owned_id = "1"
+    applied_id = str(tier.owned_campaigns + 1)
+    batch_ids = [str(i) for i in range(1, 6)] + [str(tier.owned_campaigns + i) for i in range(1, 6)]
+    cached_service = MyProjectsService(cache=ProjectsCache(maxsize=16, ttl=3600))
+
+    def service_call(fn: Callable) -> Callable[[], object]:
+        def run():
+            with SessionLocal() as db:
+                return fn(db)
+        return run
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=FOCUS_USER_ID)
+    client = TestClient(app)
+
+    def endpoint_call(method: str, url: str, **kwargs) -> Callable[[], object]:
+        def run():
+            response = client.request(method, url, **kwargs)
+            assert response.status_code == 200, f"{method} {url}: {response.status_code} {response.text[:200]}"
+            return response
+        return run
+
+    svc = my_projects_service
+    return [
+        Case("service.get_user_projects[full]",
+             service_call(lambda db: svc.get_user_projects(db, FOCUS_USER_ID))),
+        Case("service.get_user_projects[card]",
+             service_call(lambda db: svc.get_user_projects(db, FOCUS_USER_ID, view="card"))),
+        Case(f"service.get_user_projects[limit={PAGE_SIZE}]",
+             service_call(lambda db: svc.get_user_projects(db, FOCUS_USER_ID, limit=PAGE_SIZE))),
+        Case("service.get_user_projects[role=applicant]",
+             service_call(lambda db: svc.get_user_projects(
+                 db, FOCUS_USER_ID, filters=ProjectFilters(role="applicant")))),
+        Case("service.get_user_projects[cached]",
+             service_call(lambda db: cached_service.get_user_projects(db, FOCUS_USER_ID))),
+        Case("service.get_project_counts",
+             service_call(lambda db: svc.get_project_counts(db, FOCUS_USER_ID))),
+        Case("service.get_campaign_click_data[owner]",
+             service_call(lambda db: svc.get_campaign_click_data(db, FOCUS_USER_ID, owned_id))),
+        Case(f"service.get_campaign_click_data[owner,limit={PAGE_SIZE}]",
+             service_call(lambda db: svc.get_campaign_click_data(db, FOCUS_USER_ID, owned_id, limit=PAGE_SIZE))),
+        Case("service.get_campaign_click_data[applicant]",
+             service_call(lambda db: svc.get_campaign_click_data(db, FOCUS_USER_ID, applied_id))),
+        Case("service._get_campaign_applicants",
+             service_call(lambda db: svc._get_campaign_applicants(db, owned_id))),
+        Case("GET /my-projects/applications",
+             endpoint_call("GET", "/my-projects/applications")),
+        Case(f"GET /my-projects/applications?view=card&limit={PAGE_SIZE}",
+             endpoint_call("GET", "/my-projects/applications", params={"view": "card", "limit": PAGE_SIZE})),
+        Case("GET /my-projects/counts",
+             endpoint_call("GET", "/my-projects/counts")),
+        Case("GET /my-projects/applications/{owned}",
+             endpoint_call("GET", f"/my-projects/applications/{owned_id}")),
+        Case("GET /my-projects/applications/{applied}",
+             endpoint_call("GET", f"/my-projects/applications/{applied_id}")),
+        Case("POST /my-projects/applications/batch[10]",
+             endpoint_call("POST", "/my-projects/applications/batch", json={"campaign_ids": batch_ids})),
+    ]
+
+
+def measure(case: Case, counter: QueryCounter, iterations: int, warmup: int) -> Dict[str, float]:
+    for _ in range(warmup):
+        case.run()
+
+    latencies = []
+    max_queries = 0
+    for _ in range(iterations):
+        before = counter.count
+        started = time.perf_counter()
+        case.run()
+        latencies.append((time.perf_counter() - started) * 1000)
+        max_queries = max(max_queries, counter.count - before)
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        case.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    return {
+        "iterations": iterations,
+        "p50_ms": round(quantiles[49], 3),
+        "p90_ms": round(quantiles[89], 3),
+        "p95_ms": round(quantiles[94], 3),
+        "p99_ms": round(quantiles[98], 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "min_ms": round(min(latencies), 3),
+        "max_ms": round(max(latencies), 3),
+        "queries": max_queries,
+        "peak_memory_kib": round(peak / 1024, 1),
+    }
+
+
+def run(tiers: List[str], seed: int, iterations: int, warmup: int, case_filter: Optional[str]) -> dict:
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+        },
+        "settings": {"seed": seed, "iterations": iterations, "warmup": warmup},
+        "tiers": {},
+    }
+
+    previous_cache_size = projects_cache.maxsize
+    projects_cache.maxsize = 0
+    try:
+        for name in tiers:
+            tier = TIERS[name]
+            print(f"== {name}: seeding", file=sys.stderr)
+            with tier_database(tier, seed) as (engine, SessionLocal, rows):
+                counter = QueryCounter(engine)
+                results = {}
+                for case in build_cases(tier, SessionLocal):
+                    if case_filter and case_filter not in case.name:
+                        continue
+                    results[case.name] = measure(case, counter, iterations, warmup)
+                    r = results[case.name]
+                    print(
+                        f"   {case.name:<60} p50={r['p50_ms']:>9.2f}ms p95={r['p95_ms']:>9.2f}ms "
+                        f"queries={r['queries']:>3} peak={r['peak_memory_kib']:>9.1f}KiB",
+                        file=sys.stderr,
+                    )
+            report["tiers"][name] = {"tier": tier._asdict(), "rows": rows, "results": results}
+    finally:
+        projects_cache.maxsize = previous_cache_size
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the my-projects service and endpoints")
+    parser.add_argument("--tiers", nargs="+", choices=sorted(TIERS), default=["small", "medium"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--cases", default=None, help="only run cases whose name contains this text")
+    parser.add_argument("--output", default="my_projects_bench.json", help="JSON report path")
+    args = parser.parse_args(argv)
+
+    report = run(args.tiers, args.seed, args.iterations, args.warmup, args.cases)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Wrote {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,211 @@
+"""
+Concurrency benchmark: sync vs async my-projects routers.
+
+Seeds a temporary SQLite database, mounts the sync router (thread pool +
+Session) and the async router (event loop + AsyncSession) in separate
+apps, and fires the same request mix at each with increasing concurrency
+through an in-process ASGI transport. Reports throughput and latency
+percentiles per concurrency level. The list cache is disabled so every
+request reaches the database.
+
+The mix hits the authenticated list and click routes. Both apps look the
+user up by an X-Bench-User header with the same query, through
+get_current_user on the sync Session and get_async_current_user on the
+AsyncSession. `--test-routes` hits the unauthenticated /test/ routes
+instead.
+
+    PYTHONPATH=. python benchmarks/bench_my_projects_async.py
+    PYTHONPATH=. python benchmarks/bench_my_projects_async.py --threads 8 --concurrency 1 16 64
+
+`--threads` caps the anyio thread pool the sync handlers run in, to
+model a worker with a small pool; the async handlers don't use it.
+"""
+from contextlib import asynccontextmanager
+from typing import Dict, List, Tuple
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import anyio.to_thread
+import httpx
+from fastapi import Depends, FastAPI, Header, HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from core.database import Base, get_db
+from core.models import User, Campaign, CampaignParticipation
+from core.security import get_current_user
+from src.campaign.my_projects.async_database import (
+    async_session_dependency,
+    get_async_current_user,
+    get_async_db,
+)
+from src.campaign.my_projects.async_router import async_router
+from src.campaign.my_projects.cache import projects_cache
+from src.campaign.my_projects.router import router
+
+
+def seed(db, users: int, campaigns_per_user: int, applications_per_user: int) -> None:
+    rng = random.Random(42)
+    db.add_all(
+        User(id=f"user_{i}", username=f"user_{i}", email=f"user_{i}@bench.test", hashed_password="x")
+        for i in range(users)
+    )
+    campaign_id = 0
+    for i in range(users):
+        for _ in range(campaigns_per_user):
+            campaign_id += 1
+            db.add(Campaign(
+                id=campaign_id, user_id=f"user_{i}", title=f"Campaign {campaign_id}",
+                summary="summary", description="description " * 20,
+                budget=1000.0, target_views=10000, category="TECH",
+            ))
+    db.flush()
+
+    participation_id = 0
+    for i in range(users):
+        for campaign in rng.sample(range(1, campaign_id + 1), applications_per_user):
+            participation_id += 1
+            db.add(CampaignParticipation(
+                id=participation_id, user_id=f"user_{i}", campaign_id=campaign,
+                reason_for_participation="reason", is_pending=rng.random() < 0.5,
+                is_approved=rng.random() < 0.5,
+            ))
+    db.commit()
+
+
+def bench_current_user(x_bench_user: str = Header(None), db: Session = Depends(get_db)) -> User:
+    """Stand-in for the token lookup of get_current_user: one User query per request"""
+    user = db.query(User).filter(User.id == x_bench_user).first()
+    if not user:
+        raise HTTPException(status_code=401)
+    return user
+
+
+@asynccontextmanager
+async def bench_apps(args):
+    """Yield (sync app, async app) serving the same seeded SQLite file"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+
+        SessionLocal = sessionmaker(bind=engine)
+        AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+        with SessionLocal() as db:
+            seed(db, args.users, args.campaigns, args.applications)
+
+        def override_get_db():
+            db = SessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        async def override_get_async_db():
+            async with AsyncSessionLocal() as db:
+                yield db
+
+        sync_app = FastAPI()
+        sync_app.include_router(router)
+        sync_app.dependency_overrides[get_db] = override_get_db
+        sync_app.dependency_overrides[get_current_user] = bench_current_user
+
+        async_app = FastAPI()
+        async_app.include_router(async_router)
+        async_app.dependency_overrides[get_async_db] = override_get_async_db
+        async_app.dependency_overrides[get_async_current_user] = async_session_dependency(bench_current_user)
+
+        try:
+            yield sync_app, async_app
+        finally:
+            engine.dispose()
+            await async_engine.dispose()
+
+
+def request_paths(args) -> List[Tuple[str, Dict[str, str]]]:
+    """(path, headers) of each request: half lists, half click views"""
+    rng = random.Random(7)
+    paths = []
+    for _ in range(args.requests):
+        user = f"user_{rng.randrange(args.users)}"
+        base = f"/my-projects/test/applications/{user}" if args.test_routes else "/my-projects/applications"
+        headers = {} if args.test_routes else {"X-Bench-User": user}
+        if rng.random() < 0.5:
+            paths.append((base, headers))
+        else:
+            campaign = rng.randrange(1, args.users * args.campaigns + 1)
+            click = f"{base}/campaign/{campaign}" if args.test_routes else f"{base}/{campaign}"
+            paths.append((click, headers))
+    return paths
+
+
+async def run_level(app: FastAPI, paths: List[Tuple[str, Dict[str, str]]], concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    queue = list(reversed(paths))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker():
+            while queue:
+                path, headers = queue.pop()
+                started = time.perf_counter()
+                response = await client.get(path, headers=headers)
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code in (200, 403, 404), response.text
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p95_ms": quantiles[94] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+    }
+
+
+async def run(args) -> None:
+    if args.threads:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = args.threads
+
+    paths = request_paths(args)
+    async with bench_apps(args) as (sync_app, async_app):
+        print(f"{'router':<6} {'conc':>5} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        for concurrency in args.concurrency:
+            for name, app in (("sync", sync_app), ("async", async_app)):
+                result = await run_level(app, paths, concurrency)
+                print(
+                    f"{name:<6} {concurrency:>5} {result['rps']:>9.1f} {result['p50_ms']:>8.2f} "
+                    f"{result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f}"
+                )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async my-projects routers")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--campaigns", type=int, default=5, help="campaigns owned per user")
+    parser.add_argument("--applications", type=int, default=10, help="applications per user")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--threads", type=int, default=0, help="anyio thread pool size (0 = default 40)")
+    parser.add_argument("--test-routes", action="store_true", help="hit the unauthenticated /test/ routes")
+    args = parser.parse_args(argv)
+
+    projects_cache.maxsize = 0
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,155 @@
+"""
+Deterministic synthetic data for my-projects benchmarks.
+
+A size tier describes one "focus" user (the user whose projects are
+benchmarked) plus a background population that makes the tables
+realistically large:
+
+- the focus user owns `owned_campaigns` campaigns, each with
+  `applicants_per_campaign` applicants drawn from the population
+- the focus user has applied to `applications` campaigns of other users
+- `background_campaigns` more campaigns belong to random users, each with
+  0..`background_applicants` applicants
+
+The same tier and seed always produce the same rows (ids, timestamps,
+statuses), so results can be compared between runs. Rows are bulk
+inserted through Core, bypassing the ORM session hooks, and the
+application counters and the project entries read model are rebuilt at
+the end.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple
+import random
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from core.models import User, Campaign, CampaignParticipation
+from src.campaign.my_projects.counters import rebuild_counters
+from src.campaign.my_projects.entries import rebuild_entries
+
+FOCUS_USER_ID = "bench_user_0"
+
+CATEGORIES = ("TECH", "SOFTWARE", "LIFESTYLE", "GAMING", "FOOD", "TRAVEL")
+
+# Fixed origin so generated timestamps don't depend on the clock
+EPOCH = datetime(2024, 1, 1)
+
+
+class SizeTier(NamedTuple):
+    name: str
+    users: int
+    owned_campaigns: int
+    applicants_per_campaign: int
+    applications: int
+    background_campaigns: int
+    background_applicants: int = 5
+
+
+TIERS: Dict[str, SizeTier] = {
+    tier.name: tier
+    for tier in (
+        SizeTier("small", users=200, owned_campaigns=10, applicants_per_campaign=10,
+                 applications=10, background_campaigns=500),
+        SizeTier("medium", users=2_000, owned_campaigns=100, applicants_per_campaign=50,
+                 applications=100, background_campaigns=5_000),
+        SizeTier("large", users=10_000, owned_campaigns=500, applicants_per_campaign=200,
+                 applications=500, background_campaigns=20_000),
+    )
+}
+
+
+def _participation(rng: random.Random, participation_id: int, user_id: str, campaign_id: int) -> dict:
+    roll = rng.random()
+    is_pending = roll < 0.5
+    is_approved = 0.5 <= roll < 0.8
+    applied_at = EPOCH + timedelta(minutes=participation_id)
+    return {
+        "id": participation_id,
+        "user_id": user_id,
+        "campaign_id": campaign_id,
+        "reason_for_participation": f"Application {participation_id}",
+        "is_pending": is_pending,
+        "is_approved": is_approved,
+        "terms_accepted": True,
+        "review_message": "Welcome aboard" if is_approved else None,
+        "rejection_reason": "Not a fit" if not is_pending and not is_approved else None,
+        "applied_at": applied_at,
+        "approved_at": applied_at + timedelta(days=1) if is_approved else None,
+        "updated_at": applied_at,
+    }
+
+
+def generate_rows(tier: SizeTier, seed: int = 0) -> Dict[str, List[dict]]:
+    """Build the rows for a tier as plain dicts, keyed by table"""
+    rng = random.Random(f"{tier.name}:{seed}")
+    user_ids = [f"bench_user_{i}" for i in range(tier.users)]
+    others = user_ids[1:]
+
+    users = [
+        {
+            "id": user_id,
+            "username": user_id,
+            "email": f"{user_id}@bench.test",
+            "hashed_password": "x",
+            "is_active": True,
+            "is_verified": i % 3 == 0,
+            "rating": round(rng.uniform(0, 5), 2),
+            "user_level": rng.randint(1, 10),
+        }
+        for i, user_id in enumerate(user_ids)
+    ]
+
+    campaigns = []
+
+    def add_campaign(owner_id: str) -> int:
+        campaign_id = len(campaigns) + 1
+        created_at = EPOCH + timedelta(hours=campaign_id)
+        campaigns.append({
+            "id": campaign_id,
+            "user_id": owner_id,
+            "title": f"Campaign {campaign_id}",
+            "summary": f"Summary of campaign {campaign_id}",
+            "description": f"Description of campaign {campaign_id}. " * 10,
+            "budget": float(rng.randrange(100, 100_000)),
+            "target_views": rng.randrange(1_000, 1_000_000),
+            "category": rng.choice(CATEGORIES),
+            "is_active": rng.random() < 0.8,
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+        return campaign_id
+
+    participations = []
+
+    def add_participations(campaign_id: int, applicants: List[str]) -> None:
+        for user_id in applicants:
+            participations.append(_participation(rng, len(participations) + 1, user_id, campaign_id))
+
+    for _ in range(tier.owned_campaigns):
+        campaign_id = add_campaign(FOCUS_USER_ID)
+        add_participations(campaign_id, rng.sample(others, min(tier.applicants_per_campaign, len(others))))
+
+    for _ in range(tier.applications):
+        campaign_id = add_campaign(rng.choice(others))
+        add_participations(campaign_id, [FOCUS_USER_ID])
+
+    for _ in range(tier.background_campaigns):
+        campaign_id = add_campaign(rng.choice(others))
+        count = rng.randint(0, tier.background_applicants)
+        add_participations(campaign_id, rng.sample(others, min(count, len(others))))
+
+    return {"users": users, "campaigns": campaigns, "participations": participations}
+
+
+def populate(db: Session, tier: SizeTier, seed: int = 0) -> Dict[str, int]:
+    """Insert a tier into an empty database. Returns row counts per table."""
+    rows = generate_rows(tier, seed)
+    db.execute(insert(User), rows["users"])
+    db.execute(insert(Campaign), rows["campaigns"])
+    db.execute(insert(CampaignParticipation), rows["participations"])
+    db.commit()
+    rebuild_counters(db)
+    # Owner entries copy the counters, so they are rebuilt after them
+    rebuild_entries(db)
+    return {table: len(table_rows) for table, table_rows in rows.items()}
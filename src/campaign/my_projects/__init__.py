@@ -1,22 +1,38 @@
 # my_projects/__init__.py
 from .router import router
-from .service import my_projects_service
+from .async_router import async_router
+from .service import ProjectFilters, my_projects_service
+from .async_service import async_my_projects_service
+from . import hooks  # noqa: F401  registers ORM session hooks
 from .schemas import (
+    MyProjectCard,
     MyProjectCampaign,
     MyProjectsResponse,
+    MyProjectsCardResponse,
     CampaignClickResponse,
     ApplicantInfo,
     ApplicationDetails,
     ApplicationStats,
+    ApplicantChange,
+    MyProjectsChangesResponse,
+    MyProjectsCountsResponse,
 )
 
 __all__ = [
     "router",
+    "async_router",
     "my_projects_service",
+    "async_my_projects_service",
+    "ProjectFilters",
+    "MyProjectCard",
     "MyProjectCampaign",
     "MyProjectsResponse",
+    "MyProjectsCardResponse",
     "CampaignClickResponse",
     "ApplicantInfo",
     "ApplicationDetails",
     "ApplicationStats",
+    "ApplicantChange",
+    "MyProjectsChangesResponse",
+    "MyProjectsCountsResponse",
 ]
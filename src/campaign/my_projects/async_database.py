@@ -0,0 +1,106 @@
+# my_projects/async_database.py
+"""
+AsyncSession support for the async my-projects router.
+
+The async engine points at the same database as core.database. Its URL is
+taken from ASYNC_DATABASE_URL, or derived from the sync engine URL by
+swapping in the async driver (asyncpg, aiosqlite, aiomysql). The engine is
+created on first use so importing this module needs no async driver.
+
+get_async_current_user authenticates with core.security's get_current_user
+on the request's AsyncSession, so authenticated async routes use neither a
+thread-pool thread nor a sync pool connection.
+"""
+from typing import AsyncIterator, Callable, Optional
+import inspect
+
+from fastapi import Depends, params
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from core.database import get_db
+from core.security import get_current_user
+import os
+
+# Sync driver (backend name) -> async driver used for the AsyncSession path
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+}
+
+_engine: Optional[AsyncEngine] = None
+_sessionmaker: Optional[async_sessionmaker] = None
+
+
+def async_url(sync_url: URL) -> str:
+    """A sync engine URL with the async driver of its backend"""
+    driver = ASYNC_DRIVERS.get(sync_url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver known for database backend: {sync_url.get_backend_name()}")
+    return sync_url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def async_database_url() -> str:
+    """ASYNC_DATABASE_URL, or the sync database URL with an async driver"""
+    url = os.getenv("ASYNC_DATABASE_URL")
+    if url:
+        return url
+
+    from core.database import engine
+
+    return async_url(engine.url)
+
+
+def get_async_engine() -> AsyncEngine:
+    global _engine
+    if _engine is None:
+        url = make_url(async_database_url())
+        _engine = create_async_engine(url, pool_pre_ping=url.get_backend_name() != "sqlite")
+    return _engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    global _sessionmaker
+    if _sessionmaker is None:
+        _sessionmaker = async_sessionmaker(get_async_engine(), expire_on_commit=False)
+    return _sessionmaker
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency yielding an AsyncSession, the async counterpart of get_db"""
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+def async_session_dependency(dependency: Callable) -> Callable:
+    """
+    Async counterpart of a sync dependency that takes `Depends(get_db)`
+    sessions: same parameters (headers, tokens, sub-dependencies), but
+    the sessions are the request's AsyncSession, shared with the route,
+    and `dependency` runs through AsyncSession.run_sync on the event loop.
+    """
+    signature = inspect.signature(dependency, eval_str=True)
+    session_names = [
+        name for name, parameter in signature.parameters.items()
+        if isinstance(parameter.default, params.Depends) and parameter.default.dependency is get_db
+    ]
+    if not session_names:
+        raise ValueError(f"{dependency.__name__} takes no Depends(get_db) session")
+
+    async def run(**kwargs):
+        db: AsyncSession = kwargs[session_names[0]]
+        return await db.run_sync(
+            lambda session: dependency(**{**kwargs, **dict.fromkeys(session_names, session)})
+        )
+
+    run.__name__ = f"async_{dependency.__name__}"
+    run.__signature__ = signature.replace(parameters=[
+        parameter.replace(default=Depends(get_async_db), annotation=AsyncSession)
+        if name in session_names else parameter
+        for name, parameter in signature.parameters.items()
+    ])
+    return run
+
+
+# FastAPI dependency: core.security's current user, looked up through the AsyncSession
+get_async_current_user = async_session_dependency(get_current_user)
@@ -0,0 +1,399 @@
+# my_projects/async_router.py
+"""
+Async variant of the my-projects endpoints.
+
+Same paths, parameters, responses and error mapping as router.py, but the
+handlers are `async def` and read through an AsyncSession, so a request
+waiting on the database does not hold a thread-pool thread. The current
+user is looked up through the same AsyncSession (get_async_current_user),
+and the list, counts, click and batch reads use a read-replica AsyncSession
+under the same rules as the sync routes (see read_database.py).
+Include this router *instead of* `router`, not next to it:
+
+    from src.campaign.my_projects import async_router
+    app.include_router(async_router)
+"""
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.models import User
+from .async_database import get_async_current_user, get_async_db
+from .async_service import async_my_projects_service
+from .instrumentation import InstrumentedRoute
+from .migrations import migrations_lifespan
+from .read_database import get_async_read_db, get_async_user_read_db
+from .service import ProjectFilters
+from .router import (
+    ENABLE_TEST_ENDPOINTS,
+    MAX_PAGE_SIZE,
+    NDJSON_MEDIA_TYPE,
+    _etag_matches,
+    _json_response,
+    _wants_ndjson,
+    get_metrics,
+    stream_my_events,
+    test_stream_events,
+)
+from .schemas import (
+    BatchClickRequest,
+    BatchClickResponse,
+    CampaignClickResponse,
+    MyProjectsCardResponse,
+    MyProjectsChangesResponse,
+    MyProjectsCountsResponse,
+    MyProjectsResponse,
+)
+from typing import AsyncIterable, AsyncIterator, Literal, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+async_router = APIRouter(
+    prefix="/my-projects",
+    tags=["My Projects"],
+    route_class=InstrumentedRoute,
+    lifespan=migrations_lifespan,
+)
+
+
+async def _ndjson_lines(campaigns: AsyncIterable) -> AsyncIterator[bytes]:
+    async for campaign in campaigns:
+        yield campaign.model_dump_json().encode() + b"\n"
+
+
+async def _stream_projects(db: AsyncSession, user_id: str, limit, cursor, view, filters) -> StreamingResponse:
+    """Async router._stream_projects"""
+    if limit is not None or cursor is not None:
+        raise ValueError(f"Pagination is not supported with {NDJSON_MEDIA_TYPE}")
+    campaigns = await async_my_projects_service.stream_user_projects(db, user_id, view=view, filters=filters)
+    return StreamingResponse(_ndjson_lines(campaigns), media_type=NDJSON_MEDIA_TYPE)
+
+
+@async_router.get("/applications", response_model=Union[MyProjectsResponse, MyProjectsCardResponse])
+async def get_my_applications(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    view: Literal["full", "card"] = Query("full"),
+    role: Optional[Literal["owner", "applicant"]] = Query(None),
+    status: Optional[Literal["active", "inactive"]] = Query(None),
+    application_status: Optional[Literal["pending", "approved", "rejected"]] = Query(None),
+    category: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> Union[MyProjectsResponse, MyProjectsCardResponse]:
+    """Async GET /my-projects/applications, see router.get_my_applications"""
+    try:
+        user_id = str(current_user.id)
+        filters = ProjectFilters(role, status, application_status, category)
+        if _wants_ndjson(accept):
+            return await _stream_projects(db, user_id, limit, cursor, view, filters)
+
+        etag = await async_my_projects_service.get_projects_version(db, user_id, limit, cursor, view, filters)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+        result = await async_my_projects_service.get_user_projects(
+            db, user_id, limit=limit, cursor=cursor, view=view, filters=filters
+        )
+        logger.info(f"Retrieved {len(result.campaigns)} of {result.total_campaigns} projects for user {user_id}")
+        return _json_response(result, response)
+
+    except ValueError as e:
+        if "invalid cursor" in str(e).lower() or "not supported" in str(e).lower():
+            raise HTTPException(status_code=400, detail=str(e))
+        logger.error(f"User not found: {e}")
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error fetching my projects: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch projects")
+
+
+# Registered before /applications/{campaign_id}, which would otherwise match "changes"
+@async_router.get("/applications/changes", response_model=MyProjectsChangesResponse)
+async def get_my_application_changes(
+    since: Optional[str] = Query(None),
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> MyProjectsChangesResponse:
+    """Async GET /my-projects/applications/changes, see router.get_my_application_changes"""
+    try:
+        user_id = str(current_user.id)
+        result = await async_my_projects_service.get_changes(db, user_id, since)
+        logger.info(
+            f"Retrieved {len(result.campaigns)} changed projects and "
+            f"{len(result.applicants)} changed applicants for user {user_id}"
+        )
+        return _json_response(result)
+
+    except ValueError as e:
+        if "invalid since token" in str(e).lower():
+            raise HTTPException(status_code=400, detail=str(e))
+        logger.error(f"User not found: {e}")
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error fetching project changes: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch project changes")
+
+
+@async_router.get("/counts", response_model=MyProjectsCountsResponse)
+async def get_my_counts(
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> MyProjectsCountsResponse:
+    """Async GET /my-projects/counts, see router.get_my_counts"""
+    try:
+        user_id = str(current_user.id)
+        result = await async_my_projects_service.get_project_counts(db, user_id)
+        return _json_response(result)
+    except ValueError as e:
+        logger.error(f"User not found: {e}")
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error fetching project counts: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch project counts")
+
+
+@async_router.post("/applications/batch", response_model=BatchClickResponse)
+async def get_campaign_details_batch(
+    request: BatchClickRequest,
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> BatchClickResponse:
+    """Async POST /my-projects/applications/batch, see router.get_campaign_details_batch"""
+    try:
+        user_id = str(current_user.id)
+        result = await async_my_projects_service.get_campaign_click_data_batch(db, user_id, request.campaign_ids)
+        logger.info(f"Retrieved {len(result.results)} campaign details for user {user_id}")
+        return _json_response(result)
+    except Exception as e:
+        logger.error(f"Error fetching batch campaign details: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch campaign details")
+
+
+@async_router.get("/applications/{campaign_id}", response_model=CampaignClickResponse)
+async def get_campaign_details_for_user(
+    campaign_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_async_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> CampaignClickResponse:
+    """Async GET /my-projects/applications/{campaign_id}, see router.get_campaign_details_for_user"""
+    try:
+        user_id = str(current_user.id)
+        etag = await async_my_projects_service.get_campaign_version(db, user_id, campaign_id, limit, cursor)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+        result = await async_my_projects_service.get_campaign_click_data(
+            db, user_id, campaign_id, limit=limit, cursor=cursor
+        )
+        logger.info(f"Retrieved campaign {campaign_id} details for user {user_id} (role: {result.user_role})")
+        return _json_response(result, response)
+
+    except ValueError as e:
+        error_msg = str(e)
+        if "not found" in error_msg.lower():
+            raise HTTPException(status_code=404, detail=error_msg)
+        elif "no relationship" in error_msg.lower():
+            raise HTTPException(status_code=403, detail=error_msg)
+        raise HTTPException(status_code=400, detail=error_msg)
+    except Exception as e:
+        logger.error(f"Error fetching campaign details: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch campaign details")
+
+
+# Event streams don't touch the database, so the handlers are shared
+async_router.add_api_route("/events", stream_my_events, methods=["GET"], response_class=StreamingResponse)
+
+# Metrics are in-process and cheap to render, so the sync handler is shared
+async_router.add_api_route("/metrics", get_metrics, methods=["GET"], include_in_schema=False)
+
+
+# Test endpoint without authentication (for development)
+@async_router.get("/test/applications/{user_id}", response_model=Union[MyProjectsResponse, MyProjectsCardResponse])
+async def test_get_my_applications(
+    user_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    view: Literal["full", "card"] = Query("full"),
+    role: Optional[Literal["owner", "applicant"]] = Query(None),
+    status: Optional[Literal["active", "inactive"]] = Query(None),
+    application_status: Optional[Literal["pending", "approved", "rejected"]] = Query(None),
+    category: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_user_read_db),
+) -> Union[MyProjectsResponse, MyProjectsCardResponse]:
+    """
+    TEST ENDPOINT - Get unified list without authentication.
+    Disabled unless ENABLE_TEST_ENDPOINTS=true.
+    """
+    if not ENABLE_TEST_ENDPOINTS:
+        logger.warning(f"Test endpoint called in production by user {user_id}")
+        raise HTTPException(
+            status_code=403,
+            detail="Test endpoints are disabled in production"
+        )
+
+    try:
+        logger.debug(f"Test endpoint: fetching projects for user {user_id}")
+        filters = ProjectFilters(role, status, application_status, category)
+        if _wants_ndjson(accept):
+            return await _stream_projects(db, user_id, limit, cursor, view, filters)
+
+        etag = await async_my_projects_service.get_projects_version(db, user_id, limit, cursor, view, filters)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+        result = await async_my_projects_service.get_user_projects(
+            db, user_id, limit=limit, cursor=cursor, view=view, filters=filters
+        )
+        return _json_response(result, response)
+    except ValueError as e:
+        if "invalid cursor" in str(e).lower() or "not supported" in str(e).lower():
+            raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in test endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch projects")
+
+
+@async_router.get("/test/applications/{user_id}/changes", response_model=MyProjectsChangesResponse)
+async def test_get_my_application_changes(
+    user_id: str,
+    since: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+) -> MyProjectsChangesResponse:
+    """
+    TEST ENDPOINT - Delta sync without authentication.
+    Disabled unless ENABLE_TEST_ENDPOINTS=true.
+    """
+    if not ENABLE_TEST_ENDPOINTS:
+        logger.warning(f"Test endpoint called in production: user={user_id}, changes")
+        raise HTTPException(
+            status_code=403,
+            detail="Test endpoints are disabled in production"
+        )
+
+    try:
+        logger.debug(f"Test endpoint: fetching changes for user {user_id}")
+        result = await async_my_projects_service.get_changes(db, user_id, since)
+        return _json_response(result)
+    except ValueError as e:
+        if "invalid since token" in str(e).lower():
+            raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in test endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch project changes")
+
+
+async_router.add_api_route(
+    "/test/events/{user_id}", test_stream_events, methods=["GET"], response_class=StreamingResponse
+)
+
+
+@async_router.get("/test/counts/{user_id}", response_model=MyProjectsCountsResponse)
+async def test_get_my_counts(
+    user_id: str,
+    db: AsyncSession = Depends(get_async_user_read_db),
+) -> MyProjectsCountsResponse:
+    """
+    TEST ENDPOINT - Badge counts without authentication.
+    Disabled unless ENABLE_TEST_ENDPOINTS=true.
+    """
+    if not ENABLE_TEST_ENDPOINTS:
+        logger.warning(f"Test endpoint called in production: user={user_id}, counts")
+        raise HTTPException(
+            status_code=403,
+            detail="Test endpoints are disabled in production"
+        )
+
+    try:
+        result = await async_my_projects_service.get_project_counts(db, user_id)
+        return _json_response(result)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in test endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch project counts")
+
+
+@async_router.post("/test/applications/{user_id}/batch", response_model=BatchClickResponse)
+async def test_get_campaign_details_batch(
+    user_id: str,
+    request: BatchClickRequest,
+    db: AsyncSession = Depends(get_async_user_read_db),
+) -> BatchClickResponse:
+    """
+    TEST ENDPOINT - Batch click views without authentication.
+    Disabled unless ENABLE_TEST_ENDPOINTS=true.
+    """
+    if not ENABLE_TEST_ENDPOINTS:
+        logger.warning(f"Test endpoint called in production: user={user_id}, batch")
+        raise HTTPException(
+            status_code=403,
+            detail="Test endpoints are disabled in production"
+        )
+
+    try:
+        logger.debug(f"Test endpoint: fetching {len(request.campaign_ids)} campaigns for user {user_id}")
+        result = await async_my_projects_service.get_campaign_click_data_batch(db, user_id, request.campaign_ids)
+        return _json_response(result)
+    except Exception as e:
+        logger.error(f"Error in test endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch campaign details")
+
+
+@async_router.get("/test/applications/{user_id}/campaign/{campaign_id}", response_model=CampaignClickResponse)
+async def test_get_campaign_details(
+    user_id: str,
+    campaign_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_user_read_db),
+) -> CampaignClickResponse:
+    """
+    TEST ENDPOINT - Get campaign click data without authentication.
+    Disabled unless ENABLE_TEST_ENDPOINTS=true.
+    """
+    if not ENABLE_TEST_ENDPOINTS:
+        logger.warning(f"Test endpoint called in production: user={user_id}, campaign={campaign_id}")
+        raise HTTPException(
+            status_code=403,
+            detail="Test endpoints are disabled in production"
+        )
+
+    try:
+        logger.debug(f"Test endpoint: fetching campaign {campaign_id} for user {user_id}")
+        etag = await async_my_projects_service.get_campaign_version(db, user_id, campaign_id, limit, cursor)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+        result = await async_my_projects_service.get_campaign_click_data(
+            db, user_id, campaign_id, limit=limit, cursor=cursor
+        )
+        return _json_response(result, response)
+    except ValueError as e:
+        error_msg = str(e)
+        if "not found" in error_msg.lower():
+            raise HTTPException(status_code=404, detail=error_msg)
+        elif "no relationship" in error_msg.lower():
+            raise HTTPException(status_code=403, detail=error_msg)
+        raise HTTPException(status_code=400, detail=error_msg)
+    except Exception as e:
+        logger.error(f"Error in test endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch campaign details")
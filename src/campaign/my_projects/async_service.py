@@ -0,0 +1,355 @@
+# my_projects/async_service.py
+"""
+AsyncSession variant of MyProjectsService.
+
+Runs the same statements as the sync service (the builders in service.py)
+and returns identical MyProjectsResponse / CampaignClickResponse objects,
+but awaits every round-trip instead of holding a worker thread for it.
+Both services share the per-user list cache.
+"""
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.models import User, Campaign, CampaignParticipation
+from .schemas import (
+    MyProjectCard,
+    MyProjectCampaign,
+    MyProjectsResponse,
+    MyProjectsCardResponse,
+    CampaignClickResponse,
+    ApplicantInfo,
+    ApplicationDetails,
+    BatchClickResponse,
+    MyProjectsChangesResponse,
+    MyProjectsCountsResponse,
+)
+from .cache import ProjectsCache, projects_cache
+from .metrics import timed_service_method
+from .singleflight import SingleFlight, project_flights
+from .service import (
+    CHANGES_OVERLAP_SECONDS,
+    KeysetPosition,
+    NO_FILTERS,
+    STREAM_BATCH_SIZE,
+    ProjectFilters,
+    _applicant_count_statement,
+    _applicants_statement,
+    _badge_counts_statement,
+    _batch_applicants_statement,
+    _batch_campaign_ids,
+    _batch_campaigns_statement,
+    _batch_owners_statement,
+    _batch_participations_statement,
+    _build_applicants,
+    _build_application_details,
+    _build_changes_response,
+    _build_click_batch,
+    _build_counts_response,
+    _build_projects_response,
+    _describe_applicants,
+    _describe_application_details,
+    _describe_click,
+    _describe_counts,
+    _describe_projects,
+    _campaign_version,
+    _campaign_version_statement,
+    _changed_applicants_statement,
+    _changes_statement,
+    _decode_since,
+    _describe_changes,
+    _encode_since,
+    _entries_statement,
+    _flight_key,
+    _page_params,
+    _project_counts_statement,
+    _projects_version,
+    _projects_version_statement,
+    _row_to_campaign,
+    _user_exists_statement,
+    _utcnow,
+)
+from typing import AsyncIterator, List, Literal, Optional, Tuple, Union
+from datetime import timedelta
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMyProjectsService:
+    """
+    Async service for unified my-projects functionality.
+    Mirrors MyProjectsService method for method.
+    """
+
+    def __init__(self, cache: ProjectsCache = projects_cache, flights: SingleFlight = project_flights):
+        self.cache = cache
+        self.flights = flights
+
+    @timed_service_method("get_user_projects", _describe_projects)
+    async def get_user_projects(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        view: Literal["full", "card"] = "full",
+        filters: ProjectFilters = NO_FILTERS,
+    ) -> Union[MyProjectsResponse, MyProjectsCardResponse]:
+        """Async MyProjectsService.get_user_projects"""
+        key = _flight_key(self.cache, user_id, limit, cursor, view, filters)
+        return await self.flights.do_async(
+            "get_user_projects", key,
+            lambda: self._load_user_projects(db, user_id, limit, cursor, view, filters),
+        )
+
+    async def _load_user_projects(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        view: Literal["full", "card"] = "full",
+        filters: ProjectFilters = NO_FILTERS,
+    ) -> Union[MyProjectsResponse, MyProjectsCardResponse]:
+        """Async MyProjectsService._load_user_projects"""
+        logger.info(f"🔍 Getting user projects for user_id={user_id}")
+
+        paginated, limit, after = _page_params(limit, cursor)
+
+        if not paginated:
+            cached = self.cache.get(user_id, (view, filters))
+            if cached is not None:
+                logger.info(f"✅ Served {cached.total_campaigns} campaigns for user {user_id} from cache")
+                return cached
+            cache_version = self.cache.version()
+
+        statement = _entries_statement(
+            user_id, after, limit, include_description=view == "full", filters=filters
+        )
+        rows = (await db.execute(statement)).all()
+
+        # Only an empty result needs the extra user existence check
+        if not rows and (await db.execute(_user_exists_statement(user_id))).first() is None:
+            logger.warning(f"User not found: {user_id}")
+            raise ValueError(f"User not found: {user_id}")
+
+        counts = await self._count_user_projects(db, user_id, filters) if paginated else None
+        response = _build_projects_response(user_id, rows, view, limit, counts)
+
+        if not paginated:
+            self.cache.set(user_id, (view, filters), response, cache_version)
+        return response
+
+    async def stream_user_projects(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        view: Literal["full", "card"] = "full",
+        filters: ProjectFilters = NO_FILTERS,
+    ) -> AsyncIterator[Union[MyProjectCampaign, MyProjectCard]]:
+        """Async MyProjectsService.stream_user_projects"""
+        logger.info(f"🔍 Streaming user projects for user_id={user_id}")
+
+        statement = _entries_statement(user_id, include_description=view == "full", filters=filters)
+        result = await db.stream(statement.execution_options(yield_per=STREAM_BATCH_SIZE))
+        first = await result.fetchone()
+        if first is None:
+            await result.close()
+            if (await db.execute(_user_exists_statement(user_id))).first() is None:
+                logger.warning(f"User not found: {user_id}")
+                raise ValueError(f"User not found: {user_id}")
+        return self._stream_campaigns(result, first, view)
+
+    async def _stream_campaigns(self, result, first, view: str):
+        if first is None:
+            return
+        count = 0
+        try:
+            yield _row_to_campaign(first, view)
+            count += 1
+            async for row in result:
+                yield _row_to_campaign(row, view)
+                count += 1
+        finally:
+            await result.close()
+            logger.info(f"✅ Streamed {count} campaigns")
+
+    async def get_projects_version(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        view: str = "full",
+        filters: ProjectFilters = NO_FILTERS,
+    ) -> str:
+        """Async MyProjectsService.get_projects_version"""
+        version = (await db.execute(_projects_version_statement(user_id, filters))).one()
+        return _projects_version(user_id, version, (limit, cursor, view, filters))
+
+    @timed_service_method("get_project_counts", _describe_counts)
+    async def get_project_counts(self, db: AsyncSession, user_id: str) -> MyProjectsCountsResponse:
+        """Async MyProjectsService.get_project_counts"""
+        row = (await db.execute(_badge_counts_statement(user_id))).one()
+
+        if not any(row) and (await db.execute(_user_exists_statement(user_id))).first() is None:
+            logger.warning(f"User not found: {user_id}")
+            raise ValueError(f"User not found: {user_id}")
+
+        return _build_counts_response(user_id, row)
+
+    @timed_service_method("get_changes", _describe_changes)
+    async def get_changes(
+        self, db: AsyncSession, user_id: str, since: Optional[str] = None
+    ) -> MyProjectsChangesResponse:
+        """Async MyProjectsService.get_changes"""
+        logger.info(f"🔍 Getting project changes for user_id={user_id}")
+
+        next_since = _encode_since(_utcnow())
+        changed_after = None
+        if since is not None:
+            changed_after = _decode_since(since) - timedelta(seconds=CHANGES_OVERLAP_SECONDS)
+
+        rows = (await db.execute(_changes_statement(user_id, changed_after))).all()
+        applicant_rows = (await db.execute(_changed_applicants_statement(user_id, changed_after))).all()
+
+        if not rows and (await db.execute(_user_exists_statement(user_id))).first() is None:
+            logger.warning(f"User not found: {user_id}")
+            raise ValueError(f"User not found: {user_id}")
+
+        logger.info(f"✅ {len(rows)} changed campaigns, {len(applicant_rows)} changed applicants for user {user_id}")
+        return _build_changes_response(user_id, rows, applicant_rows, next_since)
+
+    async def _count_user_projects(
+        self, db: AsyncSession, user_id: str, filters: ProjectFilters = NO_FILTERS
+    ) -> Tuple[int, int]:
+        owner_count, applicant_count = (await db.execute(_project_counts_statement(user_id, filters))).one()
+        return owner_count or 0, applicant_count or 0
+
+    @timed_service_method("get_campaign_click_data", _describe_click)
+    async def get_campaign_click_data(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        campaign_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> CampaignClickResponse:
+        """Async MyProjectsService.get_campaign_click_data"""
+        key = _flight_key(self.cache, user_id, campaign_id, limit, cursor)
+        return await self.flights.do_async(
+            "get_campaign_click_data", key,
+            lambda: self._load_campaign_click_data(db, user_id, campaign_id, limit, cursor),
+        )
+
+    async def _load_campaign_click_data(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        campaign_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> CampaignClickResponse:
+        """Async MyProjectsService._load_campaign_click_data"""
+        logger.info(f"🔍 Getting campaign click data for user={user_id}, campaign={campaign_id}")
+
+        _, limit, after = _page_params(limit, cursor)
+
+        campaign = (await db.execute(
+            select(Campaign).where(Campaign.id == int(campaign_id))
+        )).scalars().first()
+        if not campaign:
+            logger.warning(f"Campaign not found: {campaign_id}")
+            raise ValueError(f"Campaign not found: {campaign_id}")
+
+        is_owner = str(campaign.user_id) == str(user_id)
+
+        participation = (await db.execute(
+            select(CampaignParticipation).where(
+                CampaignParticipation.campaign_id == int(campaign_id),
+                CampaignParticipation.user_id == user_id,
+            )
+        )).scalars().first()
+
+        if is_owner:
+            applicants, next_cursor = await self._get_campaign_applicants(db, campaign_id, limit, after)
+            return CampaignClickResponse.model_construct(
+                campaign_id=campaign_id,
+                campaign_title=campaign.title,
+                user_role="owner",
+                applicants=applicants,
+                application_details=None,
+                total_applicants=await self._count_campaign_applicants(db, campaign_id),
+                next_cursor=next_cursor,
+            )
+        elif participation is not None:
+            application_details = await self._get_application_details(db, participation, campaign)
+            return CampaignClickResponse.model_construct(
+                campaign_id=campaign_id,
+                campaign_title=campaign.title,
+                user_role="applicant",
+                applicants=None,
+                application_details=application_details,
+            )
+        else:
+            raise ValueError(f"User {user_id} has no relationship with campaign {campaign_id}")
+
+    async def get_campaign_click_data_batch(
+        self, db: AsyncSession, user_id: str, campaign_ids: List[str]
+    ) -> BatchClickResponse:
+        """Async MyProjectsService.get_campaign_click_data_batch"""
+        logger.info(f"🔍 Getting batch click data for user={user_id}, {len(campaign_ids)} campaigns")
+
+        ids = _batch_campaign_ids(campaign_ids)
+        campaigns = {}
+        participations = {}
+        applicant_rows = []
+        owners = {}
+        if ids:
+            campaigns = {c.id: c for c in (await db.execute(_batch_campaigns_statement(ids))).scalars()}
+        if campaigns:
+            participations = {
+                p.campaign_id: p
+                for p in (await db.execute(_batch_participations_statement(user_id, list(campaigns)))).scalars()
+            }
+
+        owned_ids = [c.id for c in campaigns.values() if str(c.user_id) == str(user_id)]
+        owner_ids = {
+            campaigns[campaign_id].user_id for campaign_id in participations
+            if campaign_id not in owned_ids
+        }
+        if owned_ids:
+            applicant_rows = (await db.execute(_batch_applicants_statement(owned_ids))).all()
+        if owner_ids:
+            owners = {u.id: u for u in (await db.execute(_batch_owners_statement(owner_ids))).scalars()}
+
+        return _build_click_batch(user_id, campaign_ids, campaigns, participations, applicant_rows, owners)
+
+    async def get_campaign_version(self, db: AsyncSession, user_id: str, campaign_id: str, *params) -> str:
+        """Async MyProjectsService.get_campaign_version"""
+        version = (await db.execute(_campaign_version_statement(user_id, campaign_id))).one()
+        return _campaign_version(user_id, campaign_id, version, params)
+
+    @timed_service_method("_get_campaign_applicants", _describe_applicants)
+    async def _get_campaign_applicants(
+        self,
+        db: AsyncSession,
+        campaign_id: str,
+        limit: Optional[int] = None,
+        after: Optional[KeysetPosition] = None,
+    ) -> Tuple[List[ApplicantInfo], Optional[str]]:
+        rows = (await db.execute(_applicants_statement(campaign_id, after, limit))).all()
+        return _build_applicants(rows, limit)
+
+    async def _count_campaign_applicants(self, db: AsyncSession, campaign_id: str) -> int:
+        return (await db.execute(_applicant_count_statement(campaign_id))).scalar() or 0
+
+    @timed_service_method("_get_application_details", _describe_application_details)
+    async def _get_application_details(
+        self, db: AsyncSession, participation: CampaignParticipation, campaign: Campaign
+    ) -> ApplicationDetails:
+        owner = (await db.execute(select(User).where(User.id == campaign.user_id))).scalars().first()
+        return _build_application_details(participation, owner)
+
+
+# Singleton instance
+async_my_projects_service = AsyncMyProjectsService()
@@ -0,0 +1,158 @@
+# my_projects/cache.py
+"""
+In-process result cache for the my-projects list.
+
+Built MyProjectsResponse objects are kept per user in a bounded LRU with
+a TTL. Entries are dropped through `invalidate(*user_ids)`, which the ORM
+session hooks call after any commit touching a user's campaigns or
+participations, and which write paths can call directly.
+
+Configuration:
+- MY_PROJECTS_CACHE_SIZE - max cached responses (0 disables the cache)
+- MY_PROJECTS_CACHE_TTL - seconds an entry stays valid
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+import os
+import threading
+import time
+
+MY_PROJECTS_CACHE_SIZE = int(os.getenv("MY_PROJECTS_CACHE_SIZE", "1024"))
+MY_PROJECTS_CACHE_TTL = float(os.getenv("MY_PROJECTS_CACHE_TTL", "30"))
+
+CacheKey = Tuple[str, Hashable]
+
+
+class ProjectsCache:
+    """
+    Thread-safe LRU + TTL cache keyed by (user_id, variant).
+
+    `variant` distinguishes response shapes for the same user (e.g. the
+    list view). Invalidation works per user and removes every variant.
+
+    A compute that started before an invalidation must not store its
+    (possibly stale) result afterwards, so callers take a `version()`
+    token before computing and pass it to `set`; the write is skipped if
+    any invalidation happened in between.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = MY_PROJECTS_CACHE_SIZE,
+        ttl: float = MY_PROJECTS_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._keys_by_user: Dict[str, Set[CacheKey]] = {}
+        self._version = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def version(self) -> int:
+        """Token to pass to `set` for a value computed from now on"""
+        with self._lock:
+            return self._version
+
+    def get(self, user_id: str, variant: Hashable = None) -> Optional[Any]:
+        """Return the cached value or None on miss/expiry"""
+        if not self.enabled:
+            return None
+
+        key = (str(user_id), variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, user_id: str, variant: Hashable, value: Any, version: Optional[int] = None) -> bool:
+        """
+        Store a value. Returns False if it was not stored because the cache
+        is disabled or an invalidation happened after `version` was taken.
+        """
+        if not self.enabled:
+            return False
+
+        key = (str(user_id), variant)
+        with self._lock:
+            if version is not None and version != self._version:
+                return False
+
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            self._keys_by_user.setdefault(key[0], set()).add(key)
+
+            while len(self._entries) > self.maxsize:
+                oldest, _ = self._entries.popitem(last=False)
+                self._unindex(oldest)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, *user_ids: str) -> int:
+        """Drop every cached variant for the given users. Returns entries removed."""
+        removed = 0
+        with self._lock:
+            self._version += 1
+            for user_id in user_ids:
+                for key in self._keys_by_user.pop(str(user_id), ()):
+                    if self._entries.pop(key, None) is not None:
+                        removed += 1
+            self.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for sizing the cache"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: CacheKey) -> None:
+        self._entries.pop(key, None)
+        self._unindex(key)
+
+    def _unindex(self, key: CacheKey) -> None:
+        keys = self._keys_by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[0]]
+
+
+# Shared instance used by the service and the session hooks
+projects_cache = ProjectsCache()
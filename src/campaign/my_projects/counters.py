@@ -0,0 +1,239 @@
+# my_projects/counters.py
+"""
+Materialized per-campaign application counters.
+
+The campaign_application_counters table holds the ApplicationStats
+totals for each campaign so the project list can read them instead of
+aggregating participations on every request. Counters are updated in the
+same transaction as participation writes by the session hooks
+(hooks.py), using `counter = counter + delta` so concurrent writers
+don't lose updates.
+
+On an existing database the table is created and backfilled by the
+first migration in migrations.py. Verify the counters against the
+participation table, or rebuild them from scratch and report the drift
+that was fixed:
+
+    python -m src.campaign.my_projects.counters
+    python -m src.campaign.my_projects.counters --rebuild
+"""
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import and_, case, delete, func, insert, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from core.models import CampaignParticipation
+from .models import CampaignApplicationCounter
+import argparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FIELDS = ("total", "pending", "approved", "rejected")
+
+Counts = Tuple[int, int, int, int]
+
+
+def _application_status(is_pending: Optional[bool], is_approved: Optional[bool]) -> str:
+    """Map participation flags to pending/approved/rejected"""
+    if is_pending:
+        return "pending"
+    elif is_approved:
+        return "approved"
+    return "rejected"
+
+
+# Conditional counts bucketing participations the same way as _application_status
+_PENDING_COUNT = func.sum(case((CampaignParticipation.is_pending.is_(True), 1), else_=0))
+_APPROVED_COUNT = func.sum(case(
+    (CampaignParticipation.is_pending.is_(True), 0),
+    (CampaignParticipation.is_approved.is_(True), 1),
+    else_=0,
+))
+_REJECTED_COUNT = func.sum(case(
+    (CampaignParticipation.is_pending.is_(True), 0),
+    (CampaignParticipation.is_approved.is_(True), 0),
+    else_=1,
+))
+
+
+def _application_status_clause(status: str, p=CampaignParticipation):
+    """
+    WHERE clause selecting participations that _application_status maps
+    to `status`; `p` is any source with is_pending/is_approved columns
+    """
+    if status == "pending":
+        return p.is_pending.is_(True)
+    elif status == "approved":
+        return and_(p.is_pending.is_not(True), p.is_approved.is_(True))
+    return and_(p.is_pending.is_not(True), p.is_approved.is_not(True))
+
+
+class CounterDrift(NamedTuple):
+    """A campaign whose stored counters differ from the participation table"""
+    campaign_id: int
+    stored: Optional[Counts]
+    actual: Counts
+
+
+def counts_statement(campaign_ids: Optional[Iterable[int]] = None):
+    """Aggregate (campaign_id, total, pending, approved, rejected) from participations"""
+    p = CampaignParticipation
+    statement = select(
+        p.campaign_id,
+        func.count(p.id),
+        _PENDING_COUNT,
+        _APPROVED_COUNT,
+        _REJECTED_COUNT,
+    ).group_by(p.campaign_id)
+    if campaign_ids is not None:
+        statement = statement.where(p.campaign_id.in_(list(campaign_ids)))
+    return statement
+
+
+def apply_counter_deltas(connection: Connection, deltas: Dict[int, Dict[str, int]]) -> None:
+    """
+    Add per-campaign deltas to the stored counters. A campaign without a
+    counter row yet (created before the counters existed) is seeded from
+    the participation table, which already includes the current flush.
+    """
+    table = CampaignApplicationCounter.__table__
+    for campaign_id, delta in deltas.items():
+        if not any(delta.values()):
+            continue
+
+        result = connection.execute(
+            update(table)
+            .where(table.c.campaign_id == campaign_id)
+            .values({name: table.c[name] + delta.get(name, 0) for name in COUNTER_FIELDS})
+        )
+        if result.rowcount == 0:
+            refresh_counters(connection, [campaign_id])
+
+
+def _dialect_insert(connection: Connection):
+    """The dialect's INSERT construct with ON CONFLICT support, or None"""
+    if connection.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif connection.dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return None
+    return dialect_insert
+
+
+def refresh_counters(connection: Connection, campaign_ids: Iterable[int]) -> None:
+    """
+    Recompute the counters of the given campaigns from the participation
+    table. Rows are overwritten in place (INSERT ... ON CONFLICT DO
+    UPDATE), never deleted first, so a concurrent writer adding its delta
+    waits for the row and adds to the recomputed value instead of racing
+    a delete/insert. Dialects without ON CONFLICT lock the rows instead.
+    """
+    table = CampaignApplicationCounter.__table__
+    p = CampaignParticipation
+    campaign_ids = list(campaign_ids)
+    if not campaign_ids:
+        return
+
+    counts = counts_statement(campaign_ids)
+    dialect_insert = _dialect_insert(connection)
+    if dialect_insert is not None:
+        statement = dialect_insert(table).from_select(["campaign_id", *COUNTER_FIELDS], counts)
+        connection.execute(statement.on_conflict_do_update(
+            index_elements=[table.c.campaign_id],
+            set_={**{name: statement.excluded[name] for name in COUNTER_FIELDS}, "updated_at": func.now()},
+        ))
+    else:
+        connection.execute(
+            select(table.c.campaign_id).where(table.c.campaign_id.in_(campaign_ids)).with_for_update()
+        )
+        connection.execute(delete(table).where(table.c.campaign_id.in_(campaign_ids)))
+        connection.execute(insert(table).from_select(["campaign_id", *COUNTER_FIELDS], counts))
+
+    # Campaigns left without applications have no counts row to upsert
+    connection.execute(
+        update(table)
+        .where(
+            table.c.campaign_id.in_(campaign_ids),
+            table.c.campaign_id.not_in(select(p.campaign_id).where(p.campaign_id.in_(campaign_ids))),
+        )
+        .values(dict.fromkeys(COUNTER_FIELDS, 0))
+    )
+
+
+def create_counters(connection: Connection, campaign_ids: Iterable[int]) -> None:
+    """Add zeroed counter rows for newly created campaigns"""
+    campaign_ids = list(campaign_ids)
+    if campaign_ids:
+        connection.execute(
+            insert(CampaignApplicationCounter.__table__),
+            [{"campaign_id": campaign_id, **dict.fromkeys(COUNTER_FIELDS, 0)} for campaign_id in campaign_ids],
+        )
+
+
+def delete_counters(connection: Connection, campaign_ids: Iterable[int]) -> None:
+    """Remove counter rows of deleted campaigns"""
+    table = CampaignApplicationCounter.__table__
+    campaign_ids = list(campaign_ids)
+    if campaign_ids:
+        connection.execute(delete(table).where(table.c.campaign_id.in_(campaign_ids)))
+
+
+def verify_counters(db: Session) -> List[CounterDrift]:
+    """Compare every stored counter row with the participation table"""
+    table = CampaignApplicationCounter.__table__
+    actual = {row[0]: tuple(v or 0 for v in row[1:]) for row in db.execute(counts_statement())}
+    stored = {
+        row.campaign_id: tuple(getattr(row, name) for name in COUNTER_FIELDS)
+        for row in db.execute(select(table))
+    }
+
+    drift = []
+    zero = (0, 0, 0, 0)
+    for campaign_id in sorted(set(actual) | set(stored)):
+        actual_counts = actual.get(campaign_id, zero)
+        stored_counts = stored.get(campaign_id)
+        # A missing row reads as zero stats, which is only wrong if there are applications
+        if stored_counts is None and actual_counts == zero:
+            continue
+        if stored_counts != actual_counts:
+            drift.append(CounterDrift(campaign_id, stored_counts, actual_counts))
+    return drift
+
+
+def rebuild_counters(db: Session) -> List[CounterDrift]:
+    """
+    Recompute all counters from scratch in one transaction.
+    Returns the drift that existed before the rebuild.
+    """
+    drift = verify_counters(db)
+    table = CampaignApplicationCounter.__table__
+    db.execute(delete(table))
+    db.execute(insert(table).from_select(["campaign_id", *COUNTER_FIELDS], counts_statement()))
+    db.commit()
+    return drift
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from core.database import get_db
+
+    parser = argparse.ArgumentParser(description="Verify or rebuild campaign application counters")
+    parser.add_argument("--rebuild", action="store_true", help="recompute all counters from scratch")
+    args = parser.parse_args(argv)
+
+    db_session = get_db()
+    db = next(db_session)
+    try:
+        drift = rebuild_counters(db) if args.rebuild else verify_counters(db)
+    finally:
+        db_session.close()
+
+    for item in drift:
+        print(f"campaign {item.campaign_id}: stored={item.stored} actual={item.actual}")
+    print(f"{len(drift)} campaigns with drift" + (" (fixed)" if args.rebuild and drift else ""))
+    return 1 if drift and not args.rebuild else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,197 @@
+# my_projects/entries.py
+"""
+The user_project_entries read model behind the project list.
+
+Each row is one entry of one user's list: a campaign the user owns
+(with its application stats) or applied to (with the user's own
+participation), holding exactly the fields the list returns. Reading a
+list is then a single range scan of the (user_id, created_at,
+campaign_id, id) index instead of joining campaigns, participations and
+counters on every request.
+
+Entries are refreshed in the same transaction as campaign and
+participation writes by the session hooks (hooks.py), after the
+application counters. A refresh deletes the affected entries and
+re-inserts them with INSERT ... SELECT from the same row builders the
+source-table query uses (service._owner_rows/_applicant_rows):
+- campaign created or moved to another owner: every entry of the campaign
+- campaign edited: the edited CAMPAIGN_COLUMNS are updated in place on
+  its entries, in one UPDATE; other edits write nothing
+- participation written: the applicant's entry and the owner's (stats)
+- campaign deleted: its entries are removed
+UPDATE and DELETE statements on campaigns or participations executed
+through a session (ORM bulk or Core) refresh the entries of the rows
+they match. Writes the session never sees (raw SQL or statements on a
+bare Connection, bulk INSERTs) are not tracked: run the verify command
+below periodically, and rebuild after such writes.
+
+On an existing database the table is created and backfilled by a
+migration in migrations.py, applied on startup. Verify the entries against the source tables, or rebuild them from
+scratch and report the drift that was fixed:
+
+    python -m src.campaign.my_projects.entries
+    python -m src.campaign.my_projects.entries --rebuild
+"""
+from collections import defaultdict
+from typing import Collection, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import delete, insert, select, tuple_, union_all, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from core.models import Campaign, CampaignParticipation
+from .models import UserProjectEntry
+from .service import _applicant_rows, _owner_rows
+import argparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+EntryKey = Tuple[str, int]
+
+# Entry columns copied from the campaign, the same on every entry of it
+CAMPAIGN_COLUMNS = tuple(
+    column.name for column in UserProjectEntry.__table__.c
+    if column.name in Campaign.__table__.c and column.name not in ("id", "user_id")
+)
+
+
+class EntryDrift(NamedTuple):
+    """A (user, campaign) whose stored entries differ from the source tables"""
+    user_id: str
+    campaign_id: int
+    stored: List[tuple]
+    actual: List[tuple]
+
+
+def _entry_column_names(rows) -> List[str]:
+    """Entry columns in the order a row builder selects them"""
+    return ["campaign_id" if column.name == "id" else column.name for column in rows.selected_columns]
+
+
+def _insert_entries(connection: Connection, *branches) -> None:
+    statement = branches[0] if len(branches) == 1 else union_all(*branches)
+    connection.execute(
+        insert(UserProjectEntry.__table__).from_select(_entry_column_names(branches[0]), statement)
+    )
+
+
+def refresh_entries(
+    connection: Connection,
+    campaign_ids: Iterable[int] = (),
+    owner_campaign_ids: Iterable[int] = (),
+    applications: Collection[EntryKey] = (),
+) -> None:
+    """
+    Recompute entries from the source tables: every entry of
+    `campaign_ids`, the owner entry of `owner_campaign_ids`, and the
+    applicant entry of each (user_id, campaign_id) in `applications`
+    """
+    table = UserProjectEntry.__table__
+    p = CampaignParticipation
+    campaign_ids = list(campaign_ids)
+    owner_campaign_ids = [c for c in owner_campaign_ids if c not in campaign_ids]
+    applications = [(str(u), c) for u, c in applications if c not in campaign_ids]
+
+    if campaign_ids:
+        connection.execute(delete(table).where(table.c.campaign_id.in_(campaign_ids)))
+        _insert_entries(
+            connection,
+            _owner_rows(Campaign.id.in_(campaign_ids)),
+            _applicant_rows(Campaign.id.in_(campaign_ids)),
+        )
+    if owner_campaign_ids:
+        connection.execute(delete(table).where(
+            table.c.campaign_id.in_(owner_campaign_ids), table.c.user_role == "owner"
+        ))
+        _insert_entries(connection, _owner_rows(Campaign.id.in_(owner_campaign_ids)))
+    if applications:
+        connection.execute(delete(table).where(
+            tuple_(table.c.user_id, table.c.campaign_id).in_(applications),
+            table.c.user_role == "applicant",
+        ))
+        _insert_entries(connection, _applicant_rows(tuple_(p.user_id, p.campaign_id).in_(applications)))
+
+
+def update_campaign_entries(
+    connection: Connection, campaign_ids: Iterable[int], columns: Iterable[str]
+) -> None:
+    """Copy `columns` (of CAMPAIGN_COLUMNS) from the campaigns to all of their entries"""
+    table = UserProjectEntry.__table__
+    campaigns = Campaign.__table__
+    campaign_ids, columns = list(campaign_ids), list(columns)
+    if campaign_ids and columns:
+        connection.execute(
+            update(table)
+            .where(table.c.campaign_id.in_(campaign_ids))
+            .values({
+                name: select(campaigns.c[name]).where(campaigns.c.id == table.c.campaign_id).scalar_subquery()
+                for name in columns
+            })
+        )
+
+
+def delete_entries(connection: Connection, campaign_ids: Iterable[int]) -> None:
+    """Remove entries of deleted campaigns"""
+    table = UserProjectEntry.__table__
+    campaign_ids = list(campaign_ids)
+    if campaign_ids:
+        connection.execute(delete(table).where(table.c.campaign_id.in_(campaign_ids)))
+
+
+def verify_entries(db: Session) -> List[EntryDrift]:
+    """Compare every stored entry with the entry the source tables produce"""
+    owner_rows, applicant_rows = _owner_rows(), _applicant_rows()
+    names = _entry_column_names(owner_rows)
+    table = UserProjectEntry.__table__
+
+    def by_key(rows):
+        entries = defaultdict(list)
+        for row in rows:
+            entries[(str(row[0]), row[1])].append(tuple(row[2:]))
+        return {key: sorted(values, key=repr) for key, values in entries.items()}
+
+    actual = by_key(db.execute(union_all(owner_rows, applicant_rows)))
+    stored = by_key(db.execute(select(*(table.c[name] for name in names))))
+
+    drift = []
+    for key in sorted(set(actual) | set(stored)):
+        if stored.get(key, []) != actual.get(key, []):
+            drift.append(EntryDrift(*key, stored.get(key, []), actual.get(key, [])))
+    return drift
+
+
+def rebuild_entries(db: Session) -> List[EntryDrift]:
+    """
+    Recompute all entries from scratch in one transaction.
+    Returns the drift that existed before the rebuild.
+    """
+    drift = verify_entries(db)
+    db.execute(delete(UserProjectEntry.__table__))
+    _insert_entries(db.connection(), _owner_rows(), _applicant_rows())
+    db.commit()
+    return drift
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from core.database import get_db
+
+    parser = argparse.ArgumentParser(description="Verify or rebuild the user project entries read model")
+    parser.add_argument("--rebuild", action="store_true", help="recompute all entries from scratch")
+    args = parser.parse_args(argv)
+
+    db_session = get_db()
+    db = next(db_session)
+    try:
+        drift = rebuild_entries(db) if args.rebuild else verify_entries(db)
+    finally:
+        db_session.close()
+
+    for item in drift:
+        print(f"user {item.user_id} campaign {item.campaign_id}: "
+              f"{len(item.stored)} stored, {len(item.actual)} expected entries differ")
+    print(f"{len(drift)} entries with drift" + (" (fixed)" if args.rebuild and drift else ""))
+    return 1 if drift and not args.rebuild else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
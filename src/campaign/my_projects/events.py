@@ -0,0 +1,295 @@
+# my_projects/events.py
+"""
+Server-sent events for my-projects application changes.
+
+The ORM session hooks (hooks.py) publish an event once a transaction
+that touches participations commits:
+- `application_status` to the applicant when the status, review message
+  or rejection reason of their application changes
+- `new_applicant` to the campaign owner when someone applies
+
+GET /my-projects/events streams a user's events as `text/event-stream`.
+Every event carries an `id:`; a client reconnecting with `Last-Event-ID`
+first gets the buffered events it missed. If it may have missed more than
+the buffer holds (or this worker started after its last event), a
+`resync` event tells it to catch up via GET /applications/changes. Idle
+streams get a comment line every MY_PROJECTS_SSE_HEARTBEAT seconds, and
+each stream ends after MY_PROJECTS_SSE_STREAM_SECONDS so clients
+reconnect through proxies that cut long requests.
+
+The broker fans events out to subscribers in this process. Events travel
+through its EventBackend: LocalBackend delivers them in-process. To share
+events between workers, implement EventBackend on a shared channel
+(e.g. Redis pub/sub) and install it with `event_broker.set_backend(...)`.
+
+Configuration:
+- MY_PROJECTS_SSE_HEARTBEAT - seconds between heartbeats on an idle stream
+- MY_PROJECTS_SSE_STREAM_SECONDS - max lifetime of one stream
+- MY_PROJECTS_SSE_REPLAY_SIZE - events kept per user for Last-Event-ID replay
+- MY_PROJECTS_SSE_QUEUE_SIZE - undelivered events per connection before it resyncs
+"""
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Set
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = float(os.getenv("MY_PROJECTS_SSE_HEARTBEAT", "15"))
+STREAM_SECONDS = float(os.getenv("MY_PROJECTS_SSE_STREAM_SECONDS", "300"))
+REPLAY_SIZE = int(os.getenv("MY_PROJECTS_SSE_REPLAY_SIZE", "100"))
+QUEUE_SIZE = int(os.getenv("MY_PROJECTS_SSE_QUEUE_SIZE", "1000"))
+
+# Users whose replay buffers are kept (least recently used are dropped)
+MAX_REPLAY_USERS = 10000
+
+# Reconnect delay suggested to EventSource clients
+RETRY_MILLISECONDS = 3000
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+
+class ProjectEvent(NamedTuple):
+    """One event for one user; ids increase over time"""
+    id: int
+    user_id: str
+    event: str
+    data: dict
+
+    def encode(self) -> bytes:
+        """The event as an SSE message"""
+        payload = json.dumps(self.data, separators=(",", ":"))
+        return f"id: {self.id}\nevent: {self.event}\ndata: {payload}\n\n".encode()
+
+
+class EventBackend:
+    """
+    Transport that carries published events to the broker of every
+    worker, including the publishing one. `start` is given the broker's
+    delivery callback, which must be called once per event (from any
+    thread).
+    """
+
+    def start(self, deliver: Callable[[ProjectEvent], None]) -> None:
+        raise NotImplementedError
+
+    def publish(self, event: ProjectEvent) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class LocalBackend(EventBackend):
+    """Single-process backend: delivers published events directly"""
+
+    def __init__(self):
+        self._deliver: Optional[Callable[[ProjectEvent], None]] = None
+
+    def start(self, deliver: Callable[[ProjectEvent], None]) -> None:
+        self._deliver = deliver
+
+    def publish(self, event: ProjectEvent) -> None:
+        self._deliver(event)
+
+
+class Subscription:
+    """
+    A connection's view of one user's events: those to replay after
+    `Last-Event-ID`, then live ones through an asyncio queue owned by the
+    subscribing event loop.
+    """
+
+    def __init__(self, broker: "EventBroker", user_id: str, loop: asyncio.AbstractEventLoop):
+        self.broker = broker
+        self.user_id = user_id
+        self.loop = loop
+        self.queue: "asyncio.Queue[ProjectEvent]" = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.replay: List[ProjectEvent] = []
+        # Events after `last_event_id` may be gone from the replay buffer
+        self.missed = False
+        # Live events were dropped because the queue was full
+        self.overflowed = False
+        # Id the client should resume from after a resync
+        self.resume_id = 0
+
+    def offer(self, event: ProjectEvent) -> None:
+        """Queue a live event (called on the subscriber's loop)"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    def close(self) -> None:
+        self.broker._unsubscribe(self)
+
+
+class EventBroker:
+    """
+    Thread-safe per-user fan-out of ProjectEvents with a bounded replay
+    buffer per user. Publishing goes through the backend; the backend
+    hands every event (local or from other workers) back to `_deliver`.
+    """
+
+    def __init__(self, backend: Optional[EventBackend] = None, replay_size: int = REPLAY_SIZE):
+        self.replay_size = replay_size
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        # user_id -> (buffered events, id of the newest event dropped from the buffer)
+        self._history: "OrderedDict[str, List]" = OrderedDict()
+        self._last_id = 0
+        # Events older than this were published before the broker existed
+        self._first_id = self._next_id()
+        # Newest event of any user whose buffer was dropped to make room
+        self._evicted_id = 0
+        self.backend: EventBackend = None
+        self.set_backend(backend or LocalBackend())
+
+    def set_backend(self, backend: EventBackend) -> None:
+        """Route events through `backend` (closing the previous one)"""
+        if self.backend is not None:
+            self.backend.close()
+        self.backend = backend
+        backend.start(self._deliver)
+
+    def _next_id(self) -> int:
+        # Microsecond timestamps, so ids from different workers roughly interleave
+        with self._lock:
+            self._last_id = max(self._last_id + 1, time.time_ns() // 1000)
+            return self._last_id
+
+    def publish(self, user_id: str, event: str, data: dict) -> ProjectEvent:
+        """Publish an event to every stream of `user_id`"""
+        project_event = ProjectEvent(self._next_id(), str(user_id), event, data)
+        self.backend.publish(project_event)
+        return project_event
+
+    def _deliver(self, event: ProjectEvent) -> None:
+        with self._lock:
+            self._last_id = max(self._last_id, event.id)
+            entry = self._history.get(event.user_id)
+            if entry is None:
+                entry = self._history[event.user_id] = [deque(), 0]
+                if len(self._history) > MAX_REPLAY_USERS:
+                    _, (evicted, _) = self._history.popitem(last=False)
+                    if evicted:
+                        self._evicted_id = max(self._evicted_id, evicted[-1].id)
+            self._history.move_to_end(event.user_id)
+            events = entry[0]
+            events.append(event)
+            while len(events) > self.replay_size:
+                entry[1] = events.popleft().id
+            subscribers = list(self._subscribers.get(event.user_id, ()))
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # Subscriber's loop is closed; it unsubscribes on its way out
+                pass
+
+    def subscribe(self, user_id: str, last_event_id: Optional[int] = None) -> Subscription:
+        """
+        Start receiving `user_id`'s events on the running event loop.
+        With `last_event_id`, buffered events after it are put in
+        `replay`, and `missed` is set if older ones may be gone.
+        """
+        subscription = Subscription(self, str(user_id), asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(subscription.user_id, set()).add(subscription)
+            subscription.resume_id = self._last_id
+            if last_event_id is not None:
+                entry = self._history.get(subscription.user_id)
+                if entry is None:
+                    # Nothing buffered: fine unless the buffer may have been dropped
+                    subscription.missed = last_event_id < max(self._first_id, self._evicted_id)
+                else:
+                    events, dropped_id = entry
+                    subscription.replay = [event for event in events if event.id > last_event_id]
+                    subscription.missed = last_event_id < max(dropped_id, self._first_id)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.user_id]
+
+    def subscriber_count(self, user_id: Optional[str] = None) -> int:
+        with self._lock:
+            if user_id is not None:
+                return len(self._subscribers.get(str(user_id), ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def clear(self) -> None:
+        """Drop replay buffers (subscribers are kept)"""
+        with self._lock:
+            self._history.clear()
+
+
+# Shared broker the session hooks publish to
+event_broker = EventBroker()
+
+
+def _resync_message(resume_id: int) -> bytes:
+    return f"id: {resume_id}\nevent: resync\ndata: {{}}\n\n".encode()
+
+
+async def event_stream(
+    user_id: str,
+    last_event_id: Optional[int] = None,
+    broker: Optional[EventBroker] = None,
+    heartbeat: Optional[float] = None,
+    duration: Optional[float] = None,
+) -> AsyncIterator[bytes]:
+    """
+    SSE messages for one connection: the retry hint, then a resync if
+    events were missed, replayed events, and live events with heartbeat
+    comments in between until `duration` has passed.
+    """
+    broker = broker or event_broker
+    heartbeat = HEARTBEAT_SECONDS if heartbeat is None else heartbeat
+    duration = STREAM_SECONDS if duration is None else duration
+    subscription = broker.subscribe(user_id, last_event_id)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n".encode()
+        if subscription.missed:
+            yield _resync_message(subscription.resume_id)
+        for event in subscription.replay:
+            yield event.encode()
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=min(heartbeat, remaining))
+            except asyncio.TimeoutError:
+                yield b": heartbeat\n\n"
+                continue
+            if subscription.overflowed:
+                # The queue overflowed; the client catches up and resumes from here
+                logger.warning(f"Event stream for user {user_id} fell behind, sending resync")
+                yield _resync_message(event.id)
+                return
+            yield event.encode()
+    finally:
+        subscription.close()
+
+
+def parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    """Parse a Last-Event-ID header; raises ValueError for anything but an event id"""
+    if value is None or not value.strip():
+        return None
+    try:
+        return int(value)
+    except ValueError as e:
+        raise ValueError(f"Invalid Last-Event-ID: {value}") from e
@@ -0,0 +1,405 @@
+# my_projects/hooks.py
+"""
+ORM session hooks that keep my-projects derived state in sync with writes.
+
+On every flush, in the same transaction:
+- campaign application counters are adjusted for participations that
+  were created, deleted, or changed status (see counters.py)
+- user_project_entries read model rows of the written campaigns and
+  participations are refreshed, after the counters (see entries.py)
+
+UPDATE and DELETE statements on campaigns or participations executed
+through a session (ORM bulk or Core) never reach the flush: the rows
+they match are recounted and their entries refreshed right after the
+statement, and their users are invalidated like flushed writes, but no
+events are published. Writes outside any session are not tracked; see
+counters.py and entries.py for the verify and rebuild commands.
+
+Once the transaction commits, cached project lists of every affected
+user are invalidated. Affected users are:
+- participation written: the applicant and the campaign owner (before
+  and after, if the participation moved)
+- campaign written: the owner (old and new, if it changed hands) and
+  everyone who applied to it
+The same users are read from the primary instead of the read replica
+for the read-your-writes window (see read_database.py).
+
+Committed participation writes are also published as server-sent events
+(see events.py): `new_applicant` to the owner, `application_status` to
+the applicant whose status or review feedback changed.
+"""
+from collections import defaultdict
+from itertools import chain
+from typing import Dict, Set, Tuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import ORMExecuteState, Session
+from core.models import Campaign, CampaignParticipation
+from .cache import projects_cache
+from .events import event_broker
+from .read_database import replica_router
+from .counters import (
+    _application_status,
+    apply_counter_deltas,
+    create_counters,
+    delete_counters,
+    refresh_counters,
+)
+from .entries import CAMPAIGN_COLUMNS, delete_entries, refresh_entries, update_campaign_entries
+import logging
+
+logger = logging.getLogger(__name__)
+
+_AFFECTED_USERS_KEY = "my_projects_affected_users"
+
+_EVENTS_KEY = "my_projects_events"
+
+_STATUS_ATTRIBUTES = ("campaign_id", "is_pending", "is_approved")
+
+# Participation attributes the applicant is notified about
+_EVENT_ATTRIBUTES = ("is_pending", "is_approved", "review_message", "rejection_reason")
+
+
+def _committed_values(obj):
+    """
+    Pre-flush values of the status attributes, or None when an attribute
+    was overwritten without its old value ever being loaded.
+    """
+    state = inspect(obj)
+    values = []
+    for key in _STATUS_ATTRIBUTES:
+        history = state.attrs[key].history
+        if history.deleted:
+            values.append(history.deleted[0])
+        elif history.unchanged:
+            values.append(history.unchanged[0])
+        elif history.added:
+            return None
+        else:
+            values.append(getattr(obj, key))
+    return tuple(values)
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_application_counters(session: Session, flush_context) -> None:
+    """Apply participation changes of this flush to the campaign counters"""
+    deltas: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    refresh_ids = set()
+    new_campaign_ids = []
+    deleted_campaign_ids = []
+
+    def count(campaign_id, is_pending, is_approved, sign):
+        deltas[campaign_id]["total"] += sign
+        deltas[campaign_id][_application_status(is_pending, is_approved)] += sign
+
+    for obj in session.new:
+        if isinstance(obj, CampaignParticipation):
+            count(obj.campaign_id, obj.is_pending, obj.is_approved, 1)
+        elif isinstance(obj, Campaign):
+            new_campaign_ids.append(obj.id)
+
+    for obj in session.deleted:
+        if isinstance(obj, CampaignParticipation):
+            committed = _committed_values(obj)
+            if committed is None:
+                refresh_ids.add(obj.campaign_id)
+            else:
+                count(*committed, -1)
+        elif isinstance(obj, Campaign):
+            deleted_campaign_ids.append(obj.id)
+
+    for obj in session.dirty:
+        if not isinstance(obj, CampaignParticipation):
+            continue
+        state = inspect(obj)
+        if not any(state.attrs[key].history.has_changes() for key in _STATUS_ATTRIBUTES):
+            continue
+        committed = _committed_values(obj)
+        if committed is None:
+            # Old status unknown: recount the campaign instead of guessing
+            refresh_ids.add(obj.campaign_id)
+            continue
+        count(*committed, -1)
+        count(obj.campaign_id, obj.is_pending, obj.is_approved, 1)
+
+    if not (deltas or refresh_ids or new_campaign_ids or deleted_campaign_ids):
+        return
+
+    connection = session.connection()
+    create_counters(connection, new_campaign_ids)
+    apply_counter_deltas(connection, {
+        campaign_id: delta for campaign_id, delta in deltas.items()
+        if campaign_id not in refresh_ids
+    })
+    if refresh_ids:
+        refresh_counters(connection, refresh_ids)
+    delete_counters(connection, deleted_campaign_ids)
+
+
+def _entry_keys(obj: CampaignParticipation) -> Set[Tuple[str, int]]:
+    """(user_id, campaign_id) of the participation now and before this flush"""
+    state = inspect(obj)
+    user_history = state.attrs.user_id.history
+    campaign_history = state.attrs.campaign_id.history
+    user_ids = {obj.user_id, *user_history.deleted}
+    campaign_ids = {obj.campaign_id, *campaign_history.deleted}
+    return {(str(u), c) for u in user_ids for c in campaign_ids if u is not None and c is not None}
+
+
+def _owner_ids(obj: Campaign) -> Set[str]:
+    """Owner of the campaign now and before this flush (both, when ownership changed)"""
+    history = inspect(obj).attrs.user_id.history
+    return {str(u) for u in (obj.user_id, *history.deleted) if u is not None}
+
+
+# Registered after _sync_application_counters: owner entries copy the updated stats
+@event.listens_for(Session, "after_flush")
+def _sync_project_entries(session: Session, flush_context) -> None:
+    """Refresh the read model entries of campaigns and participations written in this flush"""
+    campaign_ids = set()
+    edited_campaign_ids = set()
+    edited_columns = set()
+    deleted_campaign_ids = set()
+    applications: Set[Tuple[str, int]] = set()
+
+    for obj in chain(session.new, session.dirty):
+        if isinstance(obj, Campaign) and obj not in session.deleted:
+            state = inspect(obj)
+            if obj in session.new or state.attrs.user_id.history.has_changes():
+                # A new owner takes over the owner entry, and the old and
+                # new owner's own applications (not listed while they own
+                # the campaign) change: refresh all entries of the campaign
+                campaign_ids.add(obj.id)
+                continue
+            columns = {name for name in CAMPAIGN_COLUMNS if state.attrs[name].history.has_changes()}
+            if columns:
+                edited_campaign_ids.add(obj.id)
+                edited_columns.update(columns)
+        elif isinstance(obj, CampaignParticipation):
+            if obj in session.new or session.is_modified(obj):
+                applications.update(_entry_keys(obj))
+
+    for obj in session.deleted:
+        if isinstance(obj, Campaign):
+            deleted_campaign_ids.add(obj.id)
+        elif isinstance(obj, CampaignParticipation):
+            applications.update(_entry_keys(obj))
+
+    if not (campaign_ids or edited_campaign_ids or deleted_campaign_ids or applications):
+        return
+
+    connection = session.connection()
+    delete_entries(connection, deleted_campaign_ids)
+    # Edited columns are copied in place; other entries of the campaign are untouched
+    update_campaign_entries(
+        connection, edited_campaign_ids - campaign_ids - deleted_campaign_ids, edited_columns
+    )
+    refresh_entries(
+        connection,
+        campaign_ids=campaign_ids - deleted_campaign_ids,
+        # Owner entries carry the stats of their campaign's applications
+        owner_campaign_ids={c for _, c in applications} - deleted_campaign_ids,
+        applications={(u, c) for u, c in applications if c not in deleted_campaign_ids},
+    )
+
+
+def _bulk_write_ids(state: ORMExecuteState, table):
+    """
+    Ids of the `table` rows an UPDATE/DELETE statement will write, or
+    None when they cannot be told before it runs
+    """
+    if state.is_executemany:
+        # Bulk UPDATE by primary key: one parameter set per row
+        ids = [params.get("id") for params in state.parameters]
+        return None if None in ids else ids
+    statement = select(table.c.id)
+    if state.statement.whereclause is not None:
+        statement = statement.where(state.statement.whereclause)
+    return list(state.session.connection().execute(statement).scalars())
+
+
+def _sync_bulk_campaign_write(state: ORMExecuteState, ids):
+    campaigns = Campaign.__table__
+    connection = state.session.connection()
+    affected = {str(u) for u in connection.execute(
+        select(campaigns.c.user_id).where(campaigns.c.id.in_(ids))
+    ).scalars() if u is not None}
+
+    result = state.invoke_statement()
+
+    if state.is_delete:
+        delete_counters(connection, ids)
+        delete_entries(connection, ids)
+    else:
+        refresh_entries(connection, campaign_ids=ids)
+        affected.update(str(u) for u in connection.execute(
+            select(campaigns.c.user_id).where(campaigns.c.id.in_(ids))
+        ).scalars() if u is not None)
+    affected.update(str(u) for u in connection.execute(
+        select(CampaignParticipation.user_id).where(CampaignParticipation.campaign_id.in_(ids))
+    ).scalars())
+    state.session.info.setdefault(_AFFECTED_USERS_KEY, set()).update(affected)
+    return result
+
+
+def _sync_bulk_participation_write(state: ORMExecuteState, ids):
+    p = CampaignParticipation.__table__
+    connection = state.session.connection()
+
+    def entry_keys():
+        rows = connection.execute(select(p.c.user_id, p.c.campaign_id).where(p.c.id.in_(ids)))
+        return {(str(u), c) for u, c in rows if u is not None and c is not None}
+
+    # Old and new applicant/campaign, as for a flushed participation
+    keys = entry_keys()
+    result = state.invoke_statement()
+    if state.is_update:
+        keys.update(entry_keys())
+
+    campaign_ids = {c for _, c in keys}
+    refresh_counters(connection, campaign_ids)
+    refresh_entries(connection, owner_campaign_ids=campaign_ids, applications=keys)
+    affected = {u for u, _ in keys}
+    affected.update(str(u) for u in connection.execute(
+        select(Campaign.user_id).where(Campaign.id.in_(campaign_ids))
+    ).scalars() if u is not None)
+    state.session.info.setdefault(_AFFECTED_USERS_KEY, set()).update(affected)
+    return result
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _sync_bulk_writes(state: ORMExecuteState):
+    """Keep counters, entries and caches in sync with UPDATE/DELETE statements the flush hooks never see"""
+    if not (state.is_update or state.is_delete):
+        return None
+    table_name = getattr(state.statement.table, "name", None)
+    if table_name == Campaign.__tablename__:
+        table, sync = Campaign.__table__, _sync_bulk_campaign_write
+    elif table_name == CampaignParticipation.__tablename__:
+        table, sync = CampaignParticipation.__table__, _sync_bulk_participation_write
+    else:
+        return None
+
+    ids = _bulk_write_ids(state, table)
+    if ids is None:
+        logger.warning(
+            f"Bulk write to {table_name} with per-row WHERE parameters is not tracked; "
+            "verify the my-projects counters and entries"
+        )
+        return None
+    if not ids:
+        return None
+    return sync(state, ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_affected_users(session: Session, flush_context) -> None:
+    """Record users whose project lists change with this flush"""
+    affected: Set[str] = set()
+    participation_campaign_ids = set()
+    edited_campaign_ids = set()
+
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, CampaignParticipation):
+            # Old and new applicant/campaign when the participation was moved
+            for user_id, campaign_id in _entry_keys(obj):
+                affected.add(user_id)
+                participation_campaign_ids.add(campaign_id)
+        elif isinstance(obj, Campaign):
+            affected.update(_owner_ids(obj))
+            if obj not in session.new:
+                edited_campaign_ids.add(obj.id)
+
+    if not affected:
+        return
+
+    connection = session.connection()
+    if participation_campaign_ids:
+        owners = connection.execute(
+            select(Campaign.user_id).where(Campaign.id.in_(participation_campaign_ids))
+        ).scalars()
+        affected.update(str(user_id) for user_id in owners)
+    if edited_campaign_ids:
+        applicants = connection.execute(
+            select(CampaignParticipation.user_id).where(
+                CampaignParticipation.campaign_id.in_(edited_campaign_ids)
+            )
+        ).scalars()
+        affected.update(str(user_id) for user_id in applicants)
+
+    session.info.setdefault(_AFFECTED_USERS_KEY, set()).update(affected)
+
+
+def _application_status_event(participation: CampaignParticipation) -> dict:
+    return {
+        "campaign_id": str(participation.campaign_id),
+        "participation_id": str(participation.id),
+        "status": _application_status(participation.is_pending, participation.is_approved),
+        "review_message": participation.review_message,
+        "rejection_reason": participation.rejection_reason,
+    }
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_project_events(session: Session, flush_context) -> None:
+    """Record events to publish once this flush is committed"""
+    events = []
+    new_participations = []
+
+    for obj in session.new:
+        if isinstance(obj, CampaignParticipation):
+            new_participations.append(obj)
+
+    for obj in session.dirty:
+        if not isinstance(obj, CampaignParticipation) or obj in session.deleted:
+            continue
+        state = inspect(obj)
+        if any(state.attrs[key].history.has_changes() for key in _EVENT_ATTRIBUTES):
+            events.append((str(obj.user_id), "application_status", _application_status_event(obj)))
+
+    if new_participations:
+        owners = dict(session.connection().execute(
+            select(Campaign.id, Campaign.user_id).where(
+                Campaign.id.in_({obj.campaign_id for obj in new_participations})
+            )
+        ).all())
+        for obj in new_participations:
+            owner_id = owners.get(obj.campaign_id)
+            if owner_id is None or str(owner_id) == str(obj.user_id):
+                continue
+            events.append((str(owner_id), "new_applicant", {
+                "campaign_id": str(obj.campaign_id),
+                "participation_id": str(obj.id),
+                "user_id": str(obj.user_id),
+                "status": _application_status(obj.is_pending, obj.is_approved),
+            }))
+
+    if events:
+        session.info.setdefault(_EVENTS_KEY, []).extend(events)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_affected_users(session: Session) -> None:
+    """Invalidate cached project lists once the writes are visible"""
+    affected = session.info.pop(_AFFECTED_USERS_KEY, None)
+    if affected:
+        replica_router.mark_written(*affected)
+        removed = projects_cache.invalidate(*affected)
+        logger.debug(f"Invalidated my-projects cache for {len(affected)} users ({removed} entries)")
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_project_events(session: Session) -> None:
+    """Publish collected events once the writes are visible"""
+    for user_id, name, data in session.info.pop(_EVENTS_KEY, ()):
+        try:
+            event_broker.publish(user_id, name, data)
+        except Exception as e:
+            # Streams resync from GET /applications/changes; never fail the commit
+            logger.error(f"Failed to publish {name} event for user {user_id}: {e}", exc_info=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_affected_users(session: Session) -> None:
+    session.info.pop(_AFFECTED_USERS_KEY, None)
+    session.info.pop(_EVENTS_KEY, None)
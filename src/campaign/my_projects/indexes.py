@@ -0,0 +1,114 @@
+# my_projects/indexes.py
+"""
+Indexes the my-projects queries rely on.
+
+The campaign and participation tables are defined in core.models; the
+indexes are attached to them here, so `Base.metadata.create_all`
+creates them together with the tables. On an existing database create
+the missing ones once with:
+
+    python -m src.campaign.my_projects.indexes
+
+Every read path filters on an indexed column first:
+- Campaign.user_id: the owned-campaigns branch of the list, counts and
+  version fingerprints, and (with updated_at) delta sync
+- CampaignParticipation.user_id: the applied branch and the user's own
+  application counts, covered so they never read the table rows
+- CampaignParticipation.campaign_id: applicants of a campaign, alone
+  or together with user_id (the click view's role lookup)
+
+The second column is the sort key where a path orders its rows
+(created_at for the owned list, applied_at for applicants), so pages
+are read in index order instead of being sorted. Delta sync
+(GET /applications/changes) reads rows by updated_at within one user's
+campaigns or participations as a range scan over the changed rows only.
+
+tests/test_my_projects.py runs EXPLAIN QUERY PLAN on each service query
+and fails if one falls back to a full table scan.
+"""
+from typing import List, Optional
+
+from sqlalchemy import Index, inspect
+from core.models import Campaign, CampaignParticipation
+import argparse
+
+# Edits of the user's own campaigns
+campaigns_owner_updated_at = Index(
+    "ix_campaigns_user_id_updated_at", Campaign.user_id, Campaign.updated_at
+)
+
+# The user's own applications
+participations_user_updated_at = Index(
+    "ix_campaign_participations_user_id_updated_at",
+    CampaignParticipation.user_id, CampaignParticipation.updated_at,
+)
+
+# Applicants of a campaign, e.g. of each campaign the user owns
+participations_campaign_updated_at = Index(
+    "ix_campaign_participations_campaign_id_updated_at",
+    CampaignParticipation.campaign_id, CampaignParticipation.updated_at,
+)
+
+# Owned campaigns newest first (the owner branch of the list)
+campaigns_owner_created_at = Index(
+    "ix_campaigns_user_id_created_at", Campaign.user_id, Campaign.created_at, Campaign.id
+)
+
+# The user's application in one campaign (click view) or several (batch)
+participations_campaign_user = Index(
+    "ix_campaign_participations_campaign_id_user_id",
+    CampaignParticipation.campaign_id, CampaignParticipation.user_id,
+)
+
+# Applicants of a campaign newest first (owner click view pages)
+participations_campaign_applied_at = Index(
+    "ix_campaign_participations_campaign_id_applied_at",
+    CampaignParticipation.campaign_id, CampaignParticipation.applied_at, CampaignParticipation.id,
+)
+
+# The user's applications with their status, for the applied branch and
+# the per-status counts without reading the table rows
+participations_user_status = Index(
+    "ix_campaign_participations_user_id_campaign_id_status",
+    CampaignParticipation.user_id, CampaignParticipation.campaign_id,
+    CampaignParticipation.is_pending, CampaignParticipation.is_approved,
+)
+
+MY_PROJECTS_INDEXES = (
+    campaigns_owner_updated_at,
+    participations_user_updated_at,
+    participations_campaign_updated_at,
+    campaigns_owner_created_at,
+    participations_campaign_user,
+    participations_campaign_applied_at,
+    participations_user_status,
+)
+
+
+def create_indexes(bind) -> List[str]:
+    """Create my-projects indexes missing on `bind` (engine or connection); returns their names"""
+    inspector = inspect(bind)
+    created = []
+    for index in MY_PROJECTS_INDEXES:
+        existing = {ix["name"] for ix in inspector.get_indexes(index.table.name)}
+        if index.name not in existing:
+            index.create(bind)
+            created.append(index.name)
+    return created
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from core.database import engine
+
+    parser = argparse.ArgumentParser(description="Create missing my-projects indexes")
+    parser.parse_args(argv)
+
+    created = create_indexes(engine)
+    for name in created:
+        print(f"created {name}")
+    print(f"{len(created)} indexes created")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,184 @@
+# my_projects/instrumentation.py
+"""
+Per-request SQL instrumentation for the my-projects endpoints.
+
+Engine events time every statement. While a request is in progress, the
+statements are recorded against that request's QueryStats, which is held
+in a context variable. Sync handlers run in a thread pool with a copy of
+the request context, so their queries are counted too. The routers use
+InstrumentedRoute, which for every request:
+
+- adds a `Server-Timing` header, also to HTTPException error responses:
+  `db;dur=<ms>;desc="<n> queries", db-slowest;dur=<ms>, app;dur=<ms>`
+  where `app` is the request time spent outside the database
+  (dependencies, service code, Pydantic validation and serialization)
+- logs one record with the same numbers as structured `extra` fields
+- records request duration and response size histograms (metrics.py)
+
+Tests can bound the queries an endpoint issues with
+`assert_max_queries(response, n)`, or count queries of direct service
+calls with `track_queries()`.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+import logging
+import re
+import time
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from .metrics import request_duration, request_labels, response_size
+
+logger = logging.getLogger(__name__)
+
+_QUERY_START_KEY = "my_projects_query_start"
+
+# Longest statement text kept for the slowest query in logs
+MAX_STATEMENT_LENGTH = 500
+
+
+class QueryStats:
+    """SQL statements executed within one request (or track_queries block)"""
+
+    def __init__(self):
+        self.count = 0
+        self.db_time = 0.0
+        self.slowest_time = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.db_time += elapsed
+        if elapsed >= self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = statement
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("my_projects_query_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current_stats.get() is not None:
+        conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_stats.get()
+    starts = conn.info.get(_QUERY_START_KEY)
+    if stats is not None and starts:
+        stats.record(statement, time.perf_counter() - starts.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_query_timer(exception_context) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_QUERY_START_KEY):
+        connection.info[_QUERY_START_KEY].pop()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Record statements executed in this context (and threads started from it)"""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _server_timing(stats: QueryStats, total: float) -> str:
+    db_ms = stats.db_time * 1000
+    app_ms = max(total - stats.db_time, 0.0) * 1000
+    return (
+        f'db;dur={db_ms:.2f};desc="{stats.count} queries", '
+        f"db-slowest;dur={stats.slowest_time * 1000:.2f}, "
+        f"app;dur={app_ms:.2f}"
+    )
+
+
+def _report_request(
+    request: Request, route_path: str, stats: QueryStats, total: float, status_code: int, user_role: str
+) -> str:
+    """Record the request duration and log its SQL stats; returns the Server-Timing value"""
+    request_duration.observe(
+        total, route=route_path, method=request.method,
+        status_code=status_code, user_role=user_role,
+    )
+    logger.info(
+        f"{request.method} {route_path}: {stats.count} queries, "
+        f"db={stats.db_time * 1000:.1f}ms total={total * 1000:.1f}ms",
+        extra={
+            "route": route_path,
+            "method": request.method,
+            "status_code": status_code,
+            "user_role": user_role,
+            "db_queries": stats.count,
+            "db_time_ms": round(stats.db_time * 1000, 3),
+            "db_slowest_ms": round(stats.slowest_time * 1000, 3),
+            "db_slowest_statement": (stats.slowest_statement or "")[:MAX_STATEMENT_LENGTH],
+            "total_time_ms": round(total * 1000, 3),
+        },
+    )
+    return _server_timing(stats, total)
+
+
+class InstrumentedRoute(APIRoute):
+    """APIRoute that reports per-request SQL stats (Server-Timing header + log fields)"""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        route_path = self.path_format
+
+        async def instrumented_handler(request: Request) -> Response:
+            with track_queries() as stats, request_labels() as labels:
+                started = time.perf_counter()
+                try:
+                    response = await handler(request)
+                except HTTPException as e:
+                    server_timing = _report_request(
+                        request, route_path, stats, time.perf_counter() - started, e.status_code, "none"
+                    )
+                    # The app's exception handler builds the error response with these headers
+                    e.headers = {**(e.headers or {}), "Server-Timing": server_timing}
+                    raise
+                total = time.perf_counter() - started
+
+            user_role = labels.get("user_role", "none")
+            body = getattr(response, "body", None)
+            if body is not None:
+                response_size.observe(len(body), route=route_path, user_role=user_role)
+
+            # Streamed bodies are produced after this point; their queries are not included
+            response.headers.append(
+                "Server-Timing",
+                _report_request(request, route_path, stats, total, response.status_code, user_role),
+            )
+            return response
+
+        return instrumented_handler
+
+
+_QUERY_COUNT_PATTERN = re.compile(r'(?:^|,)\s*db;[^,]*desc="(\d+) queries"')
+
+
+def query_count(response) -> int:
+    """Number of SQL statements a response's Server-Timing header reports"""
+    match = _QUERY_COUNT_PATTERN.search(response.headers.get("Server-Timing", ""))
+    if match is None:
+        raise AssertionError("Response has no my-projects Server-Timing db entry")
+    return int(match.group(1))
+
+
+def assert_max_queries(response, max_queries: int) -> None:
+    """Test helper: fail if the request behind `response` ran more than `max_queries` statements"""
+    count = query_count(response)
+    assert count <= max_queries, (
+        f"{response.request.method} {response.request.url.path} ran {count} queries, "
+        f"expected at most {max_queries}"
+    )
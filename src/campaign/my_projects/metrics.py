@@ -0,0 +1,268 @@
+# my_projects/metrics.py
+"""
+In-process metrics for the my-projects routes and service.
+
+A small thread-safe registry of labelled histograms and counters,
+rendered in the Prometheus text exposition format by
+GET /my-projects/metrics (off unless ENABLE_METRICS_ENDPOINT=true; the
+endpoint has no authentication).
+
+Recorded metrics:
+- my_projects_request_duration_seconds{route, method, status_code, user_role}
+- my_projects_response_size_bytes{route, user_role}
+- my_projects_service_duration_seconds{method, user_role}
+- my_projects_result_count{method, user_role}
+- my_projects_singleflight_calls_total{method, outcome} (singleflight.py)
+
+`user_role` is "owner" or "applicant" for a single-campaign view. For the
+list it is "owner"/"applicant" when every campaign has that role,
+"mixed" when both occur and "none" when the list is empty. Requests that
+do not resolve a role (batch, errors, 304s) are labelled "none". Request
+metrics are recorded by InstrumentedRoute (instrumentation.py), service
+metrics by the @timed_service_method decorator.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, Optional, Sequence, Tuple, Union
+import bisect
+import functools
+import inspect
+import math
+import threading
+import time
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+COUNT_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram with a fixed set of label names"""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # label values -> (per-bucket counts incl. +Inf, sum)
+        self._series: Dict[Tuple[str, ...], Tuple[list, float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels[name]) for name in self.label_names)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[index] += 1
+            self._series[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def snapshot(self) -> Dict[Tuple[str, ...], Tuple[Tuple[int, ...], int, float]]:
+        """Label values -> (cumulative bucket counts, count, sum)"""
+        with self._lock:
+            series = {key: (list(counts), total) for key, (counts, total) in self._series.items()}
+        result = {}
+        for key, (counts, total) in series.items():
+            cumulative, running = [], 0
+            for count in counts:
+                running += count
+                cumulative.append(running)
+            result[key] = (tuple(cumulative), running, total)
+        return result
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for key, (cumulative, count, total) in sorted(self.snapshot().items()):
+            labels = list(zip(self.label_names, key))
+            for bound, value in zip(self.buckets + (math.inf,), cumulative):
+                lines.append(f"{self.name}_bucket{_format_labels(labels + [('le', _format_value(bound))])} {value}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class Counter:
+    """Monotonic counter with a fixed set of label names"""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(str(labels[name]) for name in self.label_names)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def snapshot(self) -> Dict[Tuple[str, ...], float]:
+        """Label values -> count"""
+        with self._lock:
+            return dict(self._series)
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self.snapshot().items()):
+            lines.append(f"{self.name}{_format_labels(list(zip(self.label_names, key)))} {_format_value(value)}")
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """Named histograms and counters, rendered together for scraping"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Union[Histogram, Counter]] = {}
+
+    def histogram(
+        self, name: str, documentation: str, label_names: Sequence[str], buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram"""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = Histogram(name, documentation, label_names, buckets)
+            return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str]) -> Counter:
+        """Get or create a counter"""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = Counter(name, documentation, label_names)
+            return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+    def clear(self) -> None:
+        """Drop all recorded observations (metric definitions are kept)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+# Shared registry scraped by GET /my-projects/metrics
+metrics_registry = MetricsRegistry()
+
+request_duration = metrics_registry.histogram(
+    "my_projects_request_duration_seconds",
+    "Time to handle a my-projects request",
+    ("route", "method", "status_code", "user_role"),
+)
+response_size = metrics_registry.histogram(
+    "my_projects_response_size_bytes",
+    "Size of my-projects response bodies",
+    ("route", "user_role"),
+    SIZE_BUCKETS,
+)
+service_duration = metrics_registry.histogram(
+    "my_projects_service_duration_seconds",
+    "Time spent in my-projects service methods",
+    ("method", "user_role"),
+)
+result_count = metrics_registry.histogram(
+    "my_projects_result_count",
+    "Campaigns or applicants returned by my-projects service methods",
+    ("method", "user_role"),
+    COUNT_BUCKETS,
+)
+
+
+# Labels resolved while handling the current request (set by service methods)
+_request_labels: ContextVar[Optional[Dict[str, str]]] = ContextVar("my_projects_request_labels", default=None)
+
+
+@contextmanager
+def request_labels() -> Iterator[Dict[str, str]]:
+    """Collect labels resolved during a request, e.g. by service methods in worker threads"""
+    labels: Dict[str, str] = {}
+    token = _request_labels.set(labels)
+    try:
+        yield labels
+    finally:
+        _request_labels.reset(token)
+
+
+def _record_service_call(method: str, started: float, result, describe) -> None:
+    user_role, count = describe(result)
+    service_duration.observe(time.perf_counter() - started, method=method, user_role=user_role)
+    if count is not None:
+        result_count.observe(count, method=method, user_role=user_role)
+    labels = _request_labels.get()
+    if labels is not None:
+        labels["user_role"] = user_role
+
+
+def timed_service_method(method: str, describe: Callable[[object], Tuple[str, Optional[int]]]):
+    """
+    Record duration and result count of a (sync or async) service method.
+    `describe(result)` returns (user_role, result count or None). Calls
+    that raise are recorded with user_role="error".
+    """
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    result = await fn(*args, **kwargs)
+                except Exception:
+                    service_duration.observe(time.perf_counter() - started, method=method, user_role="error")
+                    raise
+                _record_service_call(method, started, result, describe)
+                return result
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception:
+                service_duration.observe(time.perf_counter() - started, method=method, user_role="error")
+                raise
+            _record_service_call(method, started, result, describe)
+            return result
+        return wrapper
+
+    return decorator
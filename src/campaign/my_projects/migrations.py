@@ -0,0 +1,102 @@
+# my_projects/migrations.py
+"""
+Creates and backfills the my-projects tables on an existing database.
+
+`Base.metadata.create_all` creates the tables in models.py empty, and the
+session hooks only maintain them from then on, so on a database that
+already has campaigns and applications they must be filled once from the
+source tables. Each migration below runs once per database: it creates
+its table if missing and backfills it in the same transaction as the row
+recording it in my_projects_migrations. A second process starting at the
+same time blocks on that row and skips the migration once the first
+commits.
+
+Pending migrations run on application startup (the routers' lifespan;
+set MY_PROJECTS_MIGRATE_ON_STARTUP=0 to skip) and from the command line:
+
+    python -m src.campaign.my_projects.migrations
+"""
+from contextlib import asynccontextmanager
+from typing import Callable, List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from .counters import rebuild_counters
+from .entries import rebuild_entries
+from .models import CampaignApplicationCounter, MyProjectsMigration, UserProjectEntry
+import argparse
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+MY_PROJECTS_MIGRATE_ON_STARTUP = os.getenv("MY_PROJECTS_MIGRATE_ON_STARTUP", "1") != "0"
+
+
+def _application_counters(db: Session) -> None:
+    CampaignApplicationCounter.__table__.create(db.connection(), checkfirst=True)
+    drift = rebuild_counters(db)
+    logger.info("Backfilled application counters of %d campaigns", len(drift))
+
+
+def _user_project_entries(db: Session) -> None:
+    # Owner entries copy the counters, so this runs after their backfill
+    UserProjectEntry.__table__.create(db.connection(), checkfirst=True)
+    drift = rebuild_entries(db)
+    logger.info("Backfilled project entries of %d (user, campaign) pairs", len(drift))
+
+
+# (name, upgrade) in the order they are applied; never rename or reorder
+MIGRATIONS: Tuple[Tuple[str, Callable[[Session], None]], ...] = (
+    ("0001_application_counters", _application_counters),
+    ("0002_user_project_entries", _user_project_entries),
+)
+
+
+def migrate(bind) -> List[str]:
+    """Apply the migrations not yet recorded on `bind` (an engine); returns their names"""
+    MyProjectsMigration.__table__.create(bind, checkfirst=True)
+    applied = []
+    for name, upgrade in MIGRATIONS:
+        with Session(bind) as db:
+            if db.get(MyProjectsMigration, name) is not None:
+                continue
+            db.add(MyProjectsMigration(name=name))
+            try:
+                db.flush()
+            except IntegrityError:
+                # Applied by another process in the meantime
+                continue
+            upgrade(db)
+            db.commit()
+        logger.info("Applied my-projects migration %s", name)
+        applied.append(name)
+    return applied
+
+
+@asynccontextmanager
+async def migrations_lifespan(app):
+    """Router lifespan applying pending migrations to core.database's engine on startup"""
+    if MY_PROJECTS_MIGRATE_ON_STARTUP:
+        from core.database import engine
+
+        await run_in_threadpool(migrate, engine)
+    yield
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from core.database import engine
+
+    parser = argparse.ArgumentParser(description="Create and backfill the my-projects tables")
+    parser.parse_args(argv)
+
+    applied = migrate(engine)
+    for name in applied:
+        print(f"applied {name}")
+    print(f"{len(applied)} migrations applied")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
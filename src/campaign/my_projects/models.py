@@ -0,0 +1,89 @@
+# my_projects/models.py
+"""
+Tables owned by the my-projects feature.
+
+These are derived data maintained from campaign/participation writes by
+the session hooks in hooks.py; they can always be rebuilt from the
+source tables. migrations.py creates and backfills them on an existing
+database.
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, func
+from core.database import Base
+from core.models import Campaign, CampaignParticipation
+
+_campaigns = Campaign.__table__.c
+_participations = CampaignParticipation.__table__.c
+
+
+class CampaignApplicationCounter(Base):
+    """
+    Materialized application stats per campaign.
+    Kept in sync transactionally on participation writes; see
+    counters.py for the rebuild/verify command.
+    """
+    __tablename__ = "campaign_application_counters"
+
+    campaign_id = Column(
+        Integer, ForeignKey(Campaign.id, ondelete="CASCADE"), primary_key=True
+    )
+    total = Column(Integer, nullable=False, default=0)
+    pending = Column(Integer, nullable=False, default=0)
+    approved = Column(Integer, nullable=False, default=0)
+    rejected = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+
+
+class UserProjectEntry(Base):
+    """
+    Read model of the project list: one row per (user, campaign) with the
+    user's role and exactly the MyProjectCampaign fields (one per
+    application if a user applied to a campaign more than once, as the
+    list shows it). Owner rows carry the application stats, applicant
+    rows the user's own participation.
+    Kept in sync transactionally on campaign and participation writes;
+    see entries.py for the rebuild/verify command.
+
+    Column types are copied from the source columns.
+    """
+    __tablename__ = "user_project_entries"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(_participations.user_id.type, nullable=False)
+    campaign_id = Column(
+        Integer, ForeignKey(Campaign.id, ondelete="CASCADE"), nullable=False
+    )
+    title = Column(_campaigns.title.type)
+    summary = Column(_campaigns.summary.type)
+    budget = Column(_campaigns.budget.type)
+    target_views = Column(_campaigns.target_views.type)
+    poster_url = Column(_campaigns.poster_url.type)
+    category = Column(_campaigns.category.type)
+    is_active = Column(_campaigns.is_active.type)
+    created_at = Column(_campaigns.created_at.type)
+    description = Column(_campaigns.description.type)
+    user_role = Column(String(16), nullable=False)
+    stats_total = Column(Integer)
+    stats_pending = Column(Integer)
+    stats_approved = Column(Integer)
+    stats_rejected = Column(Integer)
+    is_pending = Column(_participations.is_pending.type)
+    is_approved = Column(_participations.is_approved.type)
+    applied_at = Column(_participations.applied_at.type)
+    approved_at = Column(_participations.approved_at.type)
+    review_message = Column(_participations.review_message.type)
+    rejection_reason = Column(_participations.rejection_reason.type)
+
+    __table_args__ = (
+        # The whole list of one user, newest first, is one range of this index
+        Index("ix_user_project_entries_user_id_created_at", "user_id", "created_at", "campaign_id", "id"),
+        # Refreshes delete by campaign, or by (user, campaign)
+        Index("ix_user_project_entries_campaign_id_user_id", "campaign_id", "user_id"),
+    )
+
+
+class MyProjectsMigration(Base):
+    """A migration in migrations.py that has been applied to this database"""
+    __tablename__ = "my_projects_migrations"
+
+    name = Column(String(64), primary_key=True)
+    applied_at = Column(DateTime, nullable=False, server_default=func.now())
@@ -0,0 +1,313 @@
+# my_projects/read_database.py
+"""
+Read-replica routing for the read-only my-projects endpoints.
+
+`get_read_db` (and `get_user_read_db` for routes with a `{user_id}` path
+parameter) is a drop-in for core.database.get_db that yields a session on
+the replica engine when it is safe to, and the primary session from
+get_db otherwise. `get_async_read_db` and `get_async_user_read_db` do the
+same for the async router with AsyncSessions, applying the same routing
+state (health, lag, read-your-writes):
+
+- no replica configured (READ_REPLICA_DATABASE_URL unset)
+- the replica failed a health check or a query, for
+  MY_PROJECTS_REPLICA_RETRY_SECONDS
+- the replica lags more than MY_PROJECTS_REPLICA_MAX_LAG seconds
+- read-your-writes: the user's data was written within the last
+  MY_PROJECTS_READ_YOUR_WRITES_SECONDS. The session hooks mark every user
+  whose project list a commit affects (hooks.py).
+
+Health and lag are probed at most every MY_PROJECTS_REPLICA_CHECK_SECONDS.
+Lag is measured by a per-backend probe (PostgreSQL: time since the last
+replayed transaction); backends without one are only checked for
+connectivity. Stickiness is tracked per process, so with several workers
+pin a user to one worker or keep the window above the replica lag.
+
+Delta sync (GET /applications/changes) stays on the primary: its token
+comes from the clock, and a lagging replica could hide rows written just
+before it.
+
+The async replica engine is created on first async use, from
+ASYNC_READ_REPLICA_DATABASE_URL or the replica URL with its async driver
+(see async_database.py). Its health checks run on the event loop.
+
+For local testing, point the replica at a second SQLite file:
+
+    READ_REPLICA_DATABASE_URL=sqlite:///./replica.db
+"""
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional, Tuple
+
+from fastapi import Depends
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from core.database import get_db
+from core.security import get_current_user
+from core.models import User
+from .async_database import async_url, get_async_current_user, get_async_db
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+REPLICA_MAX_LAG = float(os.getenv("MY_PROJECTS_REPLICA_MAX_LAG", "5"))
+READ_YOUR_WRITES_SECONDS = float(os.getenv("MY_PROJECTS_READ_YOUR_WRITES_SECONDS", "10"))
+REPLICA_CHECK_SECONDS = float(os.getenv("MY_PROJECTS_REPLICA_CHECK_SECONDS", "1"))
+REPLICA_RETRY_SECONDS = float(os.getenv("MY_PROJECTS_REPLICA_RETRY_SECONDS", "30"))
+
+
+def postgres_replica_lag(connection: Connection) -> Optional[float]:
+    """
+    Seconds since the standby replayed its last transaction (0 on a
+    primary). An idle primary also shows up as lag here.
+    """
+    return connection.exec_driver_sql(
+        "SELECT CASE WHEN pg_is_in_recovery() "
+        "THEN COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+        "ELSE 0 END"
+    ).scalar()
+
+
+# Backend name -> lag probe; other backends are checked with SELECT 1
+LAG_PROBES: Dict[str, Callable[[Connection], Optional[float]]] = {
+    "postgresql": postgres_replica_lag,
+}
+
+
+class ReplicaRouter:
+    """
+    Decides per request whether reads may go to the replica. Thread-safe;
+    `clock` is injectable for tests.
+    """
+
+    def __init__(
+        self,
+        replica_engine: Optional[Engine] = None,
+        max_lag: float = REPLICA_MAX_LAG,
+        sticky_seconds: float = READ_YOUR_WRITES_SECONDS,
+        check_seconds: float = REPLICA_CHECK_SECONDS,
+        retry_seconds: float = REPLICA_RETRY_SECONDS,
+        lag_probe: Optional[Callable[[Connection], Optional[float]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        async_replica_engine: Optional[AsyncEngine] = None,
+    ):
+        self._lock = threading.Lock()
+        self._written: Dict[str, float] = {}
+        self.configure(
+            replica_engine, max_lag, sticky_seconds, check_seconds, retry_seconds, lag_probe, clock,
+            async_replica_engine,
+        )
+
+    def configure(
+        self,
+        replica_engine: Optional[Engine],
+        max_lag: float = REPLICA_MAX_LAG,
+        sticky_seconds: float = READ_YOUR_WRITES_SECONDS,
+        check_seconds: float = REPLICA_CHECK_SECONDS,
+        retry_seconds: float = REPLICA_RETRY_SECONDS,
+        lag_probe: Optional[Callable[[Connection], Optional[float]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        async_replica_engine: Optional[AsyncEngine] = None,
+    ) -> None:
+        """
+        (Re)point the router at a replica engine (None disables routing).
+        `async_replica_engine` is the same replica for AsyncSessions;
+        by default it is created from the replica URL on first async use.
+        """
+        with self._lock:
+            self.replica_engine = replica_engine
+            self._async_engine = async_replica_engine if replica_engine is not None else None
+            self._async_sessionmaker = None
+            self.max_lag = max_lag
+            self.sticky_seconds = sticky_seconds
+            self.check_seconds = check_seconds
+            self.retry_seconds = retry_seconds
+            self._clock = clock
+            self._healthy = False
+            self._checked_until = 0.0
+            self._written.clear()
+            self._sessionmaker = None
+            self.lag_probe = lag_probe
+            if replica_engine is not None:
+                if lag_probe is None:
+                    self.lag_probe = LAG_PROBES.get(replica_engine.url.get_backend_name())
+                self._sessionmaker = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+                if not event.contains(replica_engine, "handle_error", self._on_replica_error):
+                    event.listen(replica_engine, "handle_error", self._on_replica_error)
+
+    def mark_written(self, *user_ids: str) -> None:
+        """Serve these users from the primary for the read-your-writes window"""
+        if self.replica_engine is None:
+            return
+        with self._lock:
+            now = self._clock()
+            until = now + self.sticky_seconds
+            for user_id in user_ids:
+                self._written[str(user_id)] = until
+            # Drop expired marks so the map stays bounded by recent writers
+            if len(self._written) > 1024:
+                self._written = {user_id: t for user_id, t in self._written.items() if t > now}
+
+    def is_sticky(self, user_id: str) -> bool:
+        with self._lock:
+            until = self._written.get(str(user_id))
+            return until is not None and until > self._clock()
+
+    def use_replica(self, user_id: Optional[str]) -> bool:
+        """True if this user's reads may go to the replica right now"""
+        if self.replica_engine is None:
+            return False
+        if user_id is not None and self.is_sticky(user_id):
+            return False
+        return self._replica_healthy()
+
+    async def use_replica_async(self, user_id: Optional[str]) -> bool:
+        """use_replica for the async path: the health check runs on the event loop"""
+        if self.replica_engine is None:
+            return False
+        if user_id is not None and self.is_sticky(user_id):
+            return False
+        return await self._replica_healthy_async()
+
+    def replica_session(self) -> Session:
+        return self._sessionmaker()
+
+    def async_replica_engine(self) -> AsyncEngine:
+        with self._lock:
+            if self._async_engine is None:
+                url = os.getenv("ASYNC_READ_REPLICA_DATABASE_URL") or async_url(self.replica_engine.url)
+                self._async_engine = create_async_engine(url, pool_pre_ping=not url.startswith("sqlite"))
+            engine = self._async_engine
+            if not event.contains(engine.sync_engine, "handle_error", self._on_replica_error):
+                event.listen(engine.sync_engine, "handle_error", self._on_replica_error)
+            return engine
+
+    def replica_async_session(self) -> AsyncSession:
+        if self._async_sessionmaker is None:
+            self._async_sessionmaker = async_sessionmaker(self.async_replica_engine(), expire_on_commit=False)
+        return self._async_sessionmaker()
+
+    def _cached_health(self) -> Optional[bool]:
+        """The last health check result, or None when a new check is due"""
+        with self._lock:
+            if self._clock() < self._checked_until:
+                return self._healthy
+        return None
+
+    def _probe(self, connection: Connection) -> Tuple[bool, float]:
+        """(healthy, seconds until the next check) of a replica connection"""
+        if self.lag_probe is not None:
+            lag = self.lag_probe(connection)
+        else:
+            connection.exec_driver_sql("SELECT 1")
+            lag = None
+        if lag is not None and lag > self.max_lag:
+            logger.warning(f"Read replica lags {lag:.1f}s (max {self.max_lag}s), reading from the primary")
+            return False, self.check_seconds
+        return True, self.check_seconds
+
+    def _record_health(self, healthy: bool, recheck: float) -> bool:
+        with self._lock:
+            self._healthy = healthy
+            self._checked_until = self._clock() + recheck
+        return healthy
+
+    def _replica_healthy(self) -> bool:
+        cached = self._cached_health()
+        if cached is not None:
+            return cached
+
+        try:
+            with self.replica_engine.connect() as connection:
+                healthy, recheck = self._probe(connection)
+        except Exception as e:
+            logger.warning(f"Read replica unavailable, reading from the primary: {e}")
+            healthy, recheck = False, self.retry_seconds
+        return self._record_health(healthy, recheck)
+
+    async def _replica_healthy_async(self) -> bool:
+        cached = self._cached_health()
+        if cached is not None:
+            return cached
+
+        try:
+            async with self.async_replica_engine().connect() as connection:
+                healthy, recheck = await connection.run_sync(self._probe)
+        except Exception as e:
+            logger.warning(f"Read replica unavailable, reading from the primary: {e}")
+            healthy, recheck = False, self.retry_seconds
+        return self._record_health(healthy, recheck)
+
+    def _on_replica_error(self, exception_context) -> None:
+        """A lost/unusable replica connection takes the replica out of rotation until the retry time"""
+        if not (exception_context.is_disconnect
+                or isinstance(exception_context.sqlalchemy_exception, OperationalError)):
+            return
+        with self._lock:
+            self._healthy = False
+            self._checked_until = self._clock() + self.retry_seconds
+
+
+def _replica_engine_from_env() -> Optional[Engine]:
+    url = os.getenv("READ_REPLICA_DATABASE_URL")
+    if not url:
+        return None
+    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
+    return create_engine(url, pool_pre_ping=not url.startswith("sqlite"), connect_args=connect_args)
+
+
+# Shared router used by the read dependencies and the session hooks
+replica_router = ReplicaRouter(_replica_engine_from_env())
+
+
+def _read_session(user_id: Optional[str], primary: Session) -> Iterator[Session]:
+    if not replica_router.use_replica(user_id):
+        yield primary
+        return
+    db = replica_router.replica_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db(
+    current_user: User = Depends(get_current_user),
+    primary: Session = Depends(get_db),
+) -> Iterator[Session]:
+    """Read-only session for the current user: replica when safe, else the primary"""
+    yield from _read_session(str(current_user.id), primary)
+
+
+def get_user_read_db(user_id: str, primary: Session = Depends(get_db)) -> Iterator[Session]:
+    """get_read_db for routes that take the user from a `{user_id}` path parameter"""
+    yield from _read_session(user_id, primary)
+
+
+async def _async_read_session(user_id: Optional[str], primary: AsyncSession) -> AsyncIterator[AsyncSession]:
+    if not await replica_router.use_replica_async(user_id):
+        yield primary
+        return
+    async with replica_router.replica_async_session() as db:
+        yield db
+
+
+async def get_async_read_db(
+    current_user: User = Depends(get_async_current_user),
+    primary: AsyncSession = Depends(get_async_db),
+) -> AsyncIterator[AsyncSession]:
+    """get_read_db for the async router: replica AsyncSession when safe, else the primary"""
+    async for db in _async_read_session(str(current_user.id), primary):
+        yield db
+
+
+async def get_async_user_read_db(
+    user_id: str, primary: AsyncSession = Depends(get_async_db)
+) -> AsyncIterator[AsyncSession]:
+    """get_async_read_db for routes that take the user from a `{user_id}` path parameter"""
+    async for db in _async_read_session(user_id, primary):
+        yield db
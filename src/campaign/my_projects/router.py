@@ -6,18 +6,49 @@ This module provides endpoints for the unified "My Projects" feature that combin
 both owner (brand) and applicant (creator) views into a single interface.
 
 Architecture:
-- GET /applications - Returns all user's campaigns (owned + applied)
+- GET /applications - Returns all user's campaigns (owned + applied), optionally cursor-paginated,
+  or streamed as NDJSON with `Accept: application/x-ndjson`
+- GET /applications/changes - Returns entries changed since a sync token (delta sync)
+- GET /counts - Returns pending/approved/rejected badge counts for both roles
 - GET /applications/{id} - Returns role-specific view on click
+- POST /applications/batch - Returns click views for several campaigns at once
+- GET /events - Server-sent events for application status changes and new applicants (see events.py)
+- GET /metrics - Latency/size histograms in Prometheus text format (see metrics.py)
 
 The backend determines the user's role for each campaign and returns appropriate data.
+
+Every response carries a Server-Timing header with the request's SQL query
+count and database time (see instrumentation.py).
+
+The list, counts, click and batch reads use a read-replica session when one
+is configured and safe to use (see read_database.py).
+
+Including the router applies pending table migrations on startup (see
+migrations.py).
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from core.database import get_db
 from core.security import get_current_user
 from core.models import User
-from .service import my_projects_service
-from .schemas import MyProjectsResponse, CampaignClickResponse
+from .events import EVENT_STREAM_MEDIA_TYPE, event_stream, parse_last_event_id
+from .instrumentation import InstrumentedRoute
+from .read_database import get_read_db, get_user_read_db
+from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, metrics_registry
+from .migrations import migrations_lifespan
+from .service import ProjectFilters, my_projects_service
+from .schemas import (
+    BatchClickRequest,
+    BatchClickResponse,
+    CampaignClickResponse,
+    MyProjectsCardResponse,
+    MyProjectsChangesResponse,
+    MyProjectsCountsResponse,
+    MyProjectsResponse,
+)
+from typing import Iterable, Literal, Optional, Union
 import logging
 import os
 
@@ -26,14 +57,102 @@ logger = logging.getLogger(__name__)
 # Production safety: Disable test endpoints unless explicitly enabled
 ENABLE_TEST_ENDPOINTS = os.getenv("ENABLE_TEST_ENDPOINTS", "true").lower() == "true"
 
-router = APIRouter(prefix="/my-projects", tags=["My Projects"])
+# GET /test/events/{user_id} streams any user's review messages and rejection
+# reasons without authentication: it also needs ENABLE_TEST_EVENT_STREAM=true
+ENABLE_TEST_EVENT_STREAM = os.getenv("ENABLE_TEST_EVENT_STREAM", "false").lower() == "true"
+
+# GET /my-projects/metrics is unauthenticated: only serve it when
+# ENABLE_METRICS_ENDPOINT=true, where the scraper can reach it but clients cannot
+ENABLE_METRICS_ENDPOINT = os.getenv("ENABLE_METRICS_ENDPOINT", "false").lower() == "true"
+
+# Upper bound for the `limit` query parameter on paginated endpoints
+MAX_PAGE_SIZE = 100
+
+# Accept type selecting the streamed one-campaign-per-line list
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+router = APIRouter(
+    prefix="/my-projects",
+    tags=["My Projects"],
+    route_class=InstrumentedRoute,
+    lifespan=migrations_lifespan,
+)
+
+
+def _json_response(result: BaseModel, response: Optional[Response] = None) -> Response:
+    """
+    JSON response for a service result, bypassing FastAPI's response_model
+    handling. Service results are built with model_construct from our own
+    rows (see service.py), so re-validating them against the response model
+    only costs time; pydantic's serializer writes the same bytes FastAPI
+    would. Headers set on the injected `response` (the ETag) are kept.
+    """
+    fast = Response(content=result.model_dump_json(), media_type="application/json")
+    if response is not None:
+        fast.headers.raw.extend(response.headers.raw)
+    return fast
+
+
+def _event_stream_response(user_id: str, last_event_id: Optional[str]) -> StreamingResponse:
+    """SSE response for a user's events; raises ValueError for a malformed Last-Event-ID"""
+    return StreamingResponse(
+        event_stream(user_id, parse_last_event_id(last_event_id)),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        # Keep proxies from caching or buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against the current ETag"""
+    if not if_none_match:
+        return False
+    current = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == current:
+            return True
+    return False
+
+
+def _wants_ndjson(accept: Optional[str]) -> bool:
+    """True if the Accept header asks for NDJSON"""
+    if not accept:
+        return False
+    return any(
+        part.split(";")[0].strip().lower() == NDJSON_MEDIA_TYPE
+        for part in accept.split(",")
+    )
+
+
+def _ndjson_lines(campaigns: Iterable) -> Iterable[bytes]:
+    for campaign in campaigns:
+        yield campaign.model_dump_json().encode() + b"\n"
+
 
+def _stream_projects(db: Session, user_id: str, limit, cursor, view, filters) -> StreamingResponse:
+    """NDJSON response for the full list; raises ValueError like get_user_projects"""
+    if limit is not None or cursor is not None:
+        raise ValueError(f"Pagination is not supported with {NDJSON_MEDIA_TYPE}")
+    campaigns = my_projects_service.stream_user_projects(db, user_id, view=view, filters=filters)
+    return StreamingResponse(_ndjson_lines(campaigns), media_type=NDJSON_MEDIA_TYPE)
 
-@router.get("/applications", response_model=MyProjectsResponse)
+
+@router.get("/applications", response_model=Union[MyProjectsResponse, MyProjectsCardResponse])
 def get_my_applications(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    view: Literal["full", "card"] = Query("full"),
+    role: Optional[Literal["owner", "applicant"]] = Query(None),
+    status: Optional[Literal["active", "inactive"]] = Query(None),
+    application_status: Optional[Literal["pending", "approved", "rejected"]] = Query(None),
+    category: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> MyProjectsResponse:
+    db: Session = Depends(get_read_db),
+) -> Union[MyProjectsResponse, MyProjectsCardResponse]:
     """
     Get unified list of all campaigns where user is either owner OR applicant.
 
@@ -51,14 +170,52 @@ def get_my_applications(
     - Role-specific data:
       - For owners: application_stats (total, pending, approved, rejected)
       - For applicants: application_status, review_message, rejection_reason
+
+    **Pagination:**
+    - Pass `limit` to get one page, ordered by (created_at, id) descending
+    - Pass the returned `next_cursor` as `cursor` to get the following page
+    - Without `limit`/`cursor` the full list is returned
+
+    **Streaming:**
+    - With `Accept: application/x-ndjson` the full list is streamed as one
+      campaign JSON object per line, read from the database in batches
+      (no ETag, no counts, `limit`/`cursor` not allowed)
+
+    **Filters** (applied in SQL; counts reflect the filtered list):
+    - `role=owner|applicant` - only campaigns with that role
+    - `status=active|inactive` - campaign status
+    - `application_status=pending|approved|rejected` - the user's own
+      application status (implies applicant campaigns)
+    - `category` - exact campaign category
+
+    **Views:**
+    - `view=full` (default) - every campaign includes its description
+    - `view=card` - compact entries without description, for the list UI
+
+    **Caching:**
+    - Responses carry an `ETag`; send it back as `If-None-Match` to get
+      `304 Not Modified` when nothing changed
     """
     try:
         user_id = str(current_user.id)
-        result = my_projects_service.get_user_projects(db, user_id)
-        logger.info(f"Retrieved {result.total_campaigns} projects for user {user_id}")
-        return result
+        filters = ProjectFilters(role, status, application_status, category)
+        if _wants_ndjson(accept):
+            return _stream_projects(db, user_id, limit, cursor, view, filters)
+
+        etag = my_projects_service.get_projects_version(db, user_id, limit, cursor, view, filters)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+        result = my_projects_service.get_user_projects(
+            db, user_id, limit=limit, cursor=cursor, view=view, filters=filters
+        )
+        logger.info(f"Retrieved {len(result.campaigns)} of {result.total_campaigns} projects for user {user_id}")
+        return _json_response(result, response)
 
     except ValueError as e:
+        if "invalid cursor" in str(e).lower() or "not supported" in str(e).lower():
+            raise HTTPException(status_code=400, detail=str(e))
         logger.error(f"User not found: {e}")
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -66,11 +223,110 @@ def get_my_applications(
         raise HTTPException(status_code=500, detail="Failed to fetch projects")
 
 
+# Registered before /applications/{campaign_id}, which would otherwise match "changes".
+# Reads the primary: a lagging replica could hide rows written just before the token.
+@router.get("/applications/changes", response_model=MyProjectsChangesResponse)
+def get_my_application_changes(
+    since: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> MyProjectsChangesResponse:
+    """
+    Delta sync for polling clients: only what changed since the last poll.
+
+    Returns the list entries (same shape as `/applications`, full view)
+    of campaigns that were created or modified since `since` - campaign
+    edits, new or updated applications on owned campaigns, the user's
+    own application status changes - and the changed applications to
+    owned campaigns (new applicants, approvals, rejections).
+
+    **Tokens:**
+    - Pass the returned `next_since` as `since` on the next poll
+    - Without `since` everything is returned (initial sync)
+    - Entries changed shortly before the token may be returned again;
+      apply them as upserts by id
+    - Deleted campaigns/applications are not reported
+    """
+    try:
+        user_id = str(current_user.id)
+        result = my_projects_service.get_changes(db, user_id, since)
+        logger.info(
+            f"Retrieved {len(result.campaigns)} changed projects and "
+            f"{len(result.applicants)} changed applicants for user {user_id}"
+        )
+        return _json_response(result)
+
+    except ValueError as e:
+        if "invalid since token" in str(e).lower():
+            raise HTTPException(status_code=400, detail=str(e))
+        logger.error(f"User not found: {e}")
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error fetching project changes: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch project changes")
+
+
+@router.get("/counts", response_model=MyProjectsCountsResponse)
+def get_my_counts(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+) -> MyProjectsCountsResponse:
+    """
+    Lightweight badge counts for the app header, instead of fetching the
+    full list and counting on the client:
+
+    - `as_owner` - pending/approved/rejected applications received across
+      all campaigns you own
+    - `as_applicant` - your own applications per status
+
+    Computed in one aggregate query from the materialized counters; no
+    campaign is loaded.
+    """
+    try:
+        user_id = str(current_user.id)
+        result = my_projects_service.get_project_counts(db, user_id)
+        return _json_response(result)
+    except ValueError as e:
+        logger.error(f"User not found: {e}")
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error fetching project counts: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch project counts")
+
+
+@router.post("/applications/batch", response_model=BatchClickResponse)
+def get_campaign_details_batch(
+    request: BatchClickRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+) -> BatchClickResponse:
+    """
+    Get click views for several campaigns in one call.
+
+    Returns one item per requested id, in request order. Each item carries
+    the `status_code` the single `/applications/{campaign_id}` endpoint
+    would return (200, 400, 403, 404) and either `data` or `detail`.
+    Owner views list all applicants (no paging). Up to 50 ids per call.
+    """
+    try:
+        user_id = str(current_user.id)
+        result = my_projects_service.get_campaign_click_data_batch(db, user_id, request.campaign_ids)
+        logger.info(f"Retrieved {len(result.results)} campaign details for user {user_id}")
+        return _json_response(result)
+    except Exception as e:
+        logger.error(f"Error fetching batch campaign details: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch campaign details")
+
+
 @router.get("/applications/{campaign_id}", response_model=CampaignClickResponse)
 def get_campaign_details_for_user(
     campaign_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> CampaignClickResponse:
     """
     Get campaign details based on user's role.
@@ -81,21 +337,34 @@ def get_campaign_details_for_user(
     - Returns list of all applicants
     - Each applicant includes: user info, application status, cover letter
     - Owner can then use /manage endpoint to accept/reject
+    - `total_applicants` is always set; pass `limit` (and `next_cursor` as
+      `cursor`) to page through applicants newest first
 
     **If user is APPLICANT:**
     - Returns their own application details
     - Includes: status (pending/approved/rejected), feedback message
     - Shows campaign owner info
 
+    **Caching:**
+    - Responses carry an `ETag`; send it back as `If-None-Match` to get
+      `304 Not Modified` when nothing changed
+
     **Error cases:**
     - 404 if campaign doesn't exist
     - 403 if user has no relationship with the campaign
     """
     try:
         user_id = str(current_user.id)
-        result = my_projects_service.get_campaign_click_data(db, user_id, campaign_id)
+        etag = my_projects_service.get_campaign_version(db, user_id, campaign_id, limit, cursor)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+        result = my_projects_service.get_campaign_click_data(
+            db, user_id, campaign_id, limit=limit, cursor=cursor
+        )
         logger.info(f"Retrieved campaign {campaign_id} details for user {user_id} (role: {result.user_role})")
-        return result
+        return _json_response(result, response)
 
     except ValueError as e:
         error_msg = str(e)
@@ -109,12 +378,65 @@ def get_campaign_details_for_user(
         raise HTTPException(status_code=500, detail="Failed to fetch campaign details")
 
 
+@router.get("/events", response_class=StreamingResponse)
+async def stream_my_events(
+    last_event_id: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Server-sent events (`text/event-stream`) for the current user, instead
+    of polling the click endpoint:
+
+    - `application_status` - your application's status, review message or
+      rejection reason changed
+    - `new_applicant` - someone applied to one of your campaigns
+    - `resync` - events may have been missed; catch up with
+      `/applications/changes`
+
+    Reconnecting with `Last-Event-ID` (EventSource does this itself)
+    replays buffered events after that id. Idle streams receive heartbeat
+    comments, and streams end periodically so clients reconnect.
+    """
+    user_id = str(current_user.id)
+    # `db` is the session get_current_user used. Streams stay open for
+    # minutes, so give its connection back to the pool now instead of when
+    # the response ends.
+    db.close()
+    try:
+        return _event_stream_response(user_id, last_event_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    """
+    Request/service latency, response size and result count histograms
+    in the Prometheus text exposition format, for the local scraper.
+    Returns 404 unless ENABLE_METRICS_ENDPOINT=true.
+    """
+    if not ENABLE_METRICS_ENDPOINT:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return Response(metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 # Test endpoint without authentication (for development)
-@router.get("/test/applications/{user_id}", response_model=MyProjectsResponse)
+@router.get("/test/applications/{user_id}", response_model=Union[MyProjectsResponse, MyProjectsCardResponse])
 def test_get_my_applications(
     user_id: str,
-    db: Session = Depends(get_db),
-) -> MyProjectsResponse:
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    view: Literal["full", "card"] = Query("full"),
+    role: Optional[Literal["owner", "applicant"]] = Query(None),
+    status: Optional[Literal["active", "inactive"]] = Query(None),
+    application_status: Optional[Literal["pending", "approved", "rejected"]] = Query(None),
+    category: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+    db: Session = Depends(get_user_read_db),
+) -> Union[MyProjectsResponse, MyProjectsCardResponse]:
     """
     TEST ENDPOINT - Get unified list without authentication.
     For development/testing purposes only.
@@ -131,20 +453,142 @@ def test_get_my_applications(
 
     try:
         logger.debug(f"Test endpoint: fetching projects for user {user_id}")
-        result = my_projects_service.get_user_projects(db, user_id)
-        return result
+        filters = ProjectFilters(role, status, application_status, category)
+        if _wants_ndjson(accept):
+            return _stream_projects(db, user_id, limit, cursor, view, filters)
+
+        etag = my_projects_service.get_projects_version(db, user_id, limit, cursor, view, filters)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+        result = my_projects_service.get_user_projects(
+            db, user_id, limit=limit, cursor=cursor, view=view, filters=filters
+        )
+        return _json_response(result, response)
     except ValueError as e:
+        if "invalid cursor" in str(e).lower() or "not supported" in str(e).lower():
+            raise HTTPException(status_code=400, detail=str(e))
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         logger.error(f"Error in test endpoint: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to fetch projects")
 
 
+@router.get("/test/applications/{user_id}/changes", response_model=MyProjectsChangesResponse)
+def test_get_my_application_changes(
+    user_id: str,
+    since: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+) -> MyProjectsChangesResponse:
+    """
+    TEST ENDPOINT - Delta sync without authentication.
+    For development/testing purposes only.
+    """
+    if not ENABLE_TEST_ENDPOINTS:
+        logger.warning(f"Test endpoint called in production: user={user_id}, changes")
+        raise HTTPException(
+            status_code=403,
+            detail="Test endpoints are disabled in production"
+        )
+
+    try:
+        logger.debug(f"Test endpoint: fetching changes for user {user_id}")
+        result = my_projects_service.get_changes(db, user_id, since)
+        return _json_response(result)
+    except ValueError as e:
+        if "invalid since token" in str(e).lower():
+            raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in test endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch project changes")
+
+
+@router.get("/test/events/{user_id}", response_class=StreamingResponse)
+async def test_stream_events(
+    user_id: str,
+    last_event_id: Optional[str] = Header(None),
+) -> StreamingResponse:
+    """
+    TEST ENDPOINT - Server-sent events without authentication.
+    For development/testing purposes only. Disabled unless both
+    ENABLE_TEST_ENDPOINTS=true and ENABLE_TEST_EVENT_STREAM=true.
+    """
+    if not (ENABLE_TEST_ENDPOINTS and ENABLE_TEST_EVENT_STREAM):
+        logger.warning(f"Test endpoint called in production: user={user_id}, events")
+        raise HTTPException(
+            status_code=403,
+            detail="Test endpoints are disabled in production"
+        )
+
+    try:
+        return _event_stream_response(user_id, last_event_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/test/counts/{user_id}", response_model=MyProjectsCountsResponse)
+def test_get_my_counts(
+    user_id: str,
+    db: Session = Depends(get_user_read_db),
+) -> MyProjectsCountsResponse:
+    """
+    TEST ENDPOINT - Badge counts without authentication.
+    For development/testing purposes only.
+    """
+    if not ENABLE_TEST_ENDPOINTS:
+        logger.warning(f"Test endpoint called in production: user={user_id}, counts")
+        raise HTTPException(
+            status_code=403,
+            detail="Test endpoints are disabled in production"
+        )
+
+    try:
+        result = my_projects_service.get_project_counts(db, user_id)
+        return _json_response(result)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in test endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch project counts")
+
+
+@router.post("/test/applications/{user_id}/batch", response_model=BatchClickResponse)
+def test_get_campaign_details_batch(
+    user_id: str,
+    request: BatchClickRequest,
+    db: Session = Depends(get_user_read_db),
+) -> BatchClickResponse:
+    """
+    TEST ENDPOINT - Batch click views without authentication.
+    For development/testing purposes only.
+    """
+    if not ENABLE_TEST_ENDPOINTS:
+        logger.warning(f"Test endpoint called in production: user={user_id}, batch")
+        raise HTTPException(
+            status_code=403,
+            detail="Test endpoints are disabled in production"
+        )
+
+    try:
+        logger.debug(f"Test endpoint: fetching {len(request.campaign_ids)} campaigns for user {user_id}")
+        result = my_projects_service.get_campaign_click_data_batch(db, user_id, request.campaign_ids)
+        return _json_response(result)
+    except Exception as e:
+        logger.error(f"Error in test endpoint: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch campaign details")
+
+
 @router.get("/test/applications/{user_id}/campaign/{campaign_id}", response_model=CampaignClickResponse)
 def test_get_campaign_details(
     user_id: str,
     campaign_id: str,
-    db: Session = Depends(get_db),
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_user_read_db),
 ) -> CampaignClickResponse:
     """
     TEST ENDPOINT - Get campaign click data without authentication.
@@ -162,8 +606,15 @@ def test_get_campaign_details(
 
     try:
         logger.debug(f"Test endpoint: fetching campaign {campaign_id} for user {user_id}")
-        result = my_projects_service.get_campaign_click_data(db, user_id, campaign_id)
-        return result
+        etag = my_projects_service.get_campaign_version(db, user_id, campaign_id, limit, cursor)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+        result = my_projects_service.get_campaign_click_data(
+            db, user_id, campaign_id, limit=limit, cursor=cursor
+        )
+        return _json_response(result, response)
     except ValueError as e:
         error_msg = str(e)
         if "not found" in error_msg.lower():
@@ -1,8 +1,11 @@
 # my_projects/schemas.py
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Literal
 from datetime import datetime
 
+# Max campaign ids accepted by the batch click endpoint
+MAX_BATCH_SIZE = 50
+
 
 class ApplicationStats(BaseModel):
     """Stats for a campaign's applications (for owners)"""
@@ -43,6 +46,37 @@ class MyProjectCampaign(BaseModel):
     rejection_reason: Optional[str] = None
 
 
+class MyProjectCard(BaseModel):
+    """
+    Compact campaign entry for the projects list card (view=card).
+    Same fields, in the same order, as MyProjectCampaign without the
+    description; the full description is available from the click endpoint.
+    """
+    # Campaign details
+    id: str
+    title: str
+    summary: str
+    budget: float
+    target_views: int
+    poster_url: Optional[str] = None
+    category: str
+    status: str  # active, inactive, completed
+    created_at: datetime
+
+    # User's role for this campaign
+    user_role: Literal["owner", "applicant"]
+
+    # Owner-specific data (only populated if user_role == "owner")
+    application_stats: Optional[ApplicationStats] = None
+
+    # Applicant-specific data (only populated if user_role == "applicant")
+    application_status: Optional[Literal["pending", "approved", "rejected"]] = None
+    applied_at: Optional[datetime] = None
+    approved_at: Optional[datetime] = None
+    review_message: Optional[str] = None
+    rejection_reason: Optional[str] = None
+
+
 class MyProjectsResponse(BaseModel):
     """Response for the unified my-projects/applications endpoint"""
     user_id: str
@@ -52,6 +86,14 @@ class MyProjectsResponse(BaseModel):
     campaigns: List[MyProjectCampaign]
     message: str
 
+    # Opaque cursor for the next page (only set for paginated requests with more results)
+    next_cursor: Optional[str] = None
+
+
+class MyProjectsCardResponse(MyProjectsResponse):
+    """Response for the my-projects/applications endpoint with view=card"""
+    campaigns: List[MyProjectCard]
+
 
 class CampaignClickResponse(BaseModel):
     """
@@ -64,6 +106,10 @@ class CampaignClickResponse(BaseModel):
 
     # For owners - list of applicants
     applicants: Optional[List["ApplicantInfo"]] = None
+    total_applicants: Optional[int] = None
+
+    # Opaque cursor for the next page of applicants (only set for paginated requests with more results)
+    next_cursor: Optional[str] = None
 
     # For applicants - their application details
     application_details: Optional["ApplicationDetails"] = None
@@ -106,3 +152,56 @@ class ApplicationDetails(BaseModel):
 
 # Update forward references
 CampaignClickResponse.model_rebuild()
+
+
+class MyProjectsCountsResponse(BaseModel):
+    """
+    Badge counts for the app header.
+    `as_owner` - applications received across all owned campaigns;
+    `as_applicant` - the user's own applications by status.
+    """
+    user_id: str
+    as_owner: ApplicationStats
+    as_applicant: ApplicationStats
+
+
+class ApplicantChange(ApplicantInfo):
+    """An application to one of the user's campaigns, created or updated since the sync token"""
+    campaign_id: str
+    updated_at: datetime
+
+
+class MyProjectsChangesResponse(BaseModel):
+    """
+    Response for the my-projects/applications/changes endpoint.
+    `campaigns` are the list entries that changed (same shape as in the
+    full list), `applicants` the changed applications to owned campaigns.
+    """
+    user_id: str
+    campaigns: List[MyProjectCampaign]
+    applicants: List[ApplicantChange]
+
+    # Pass as `since` on the next poll
+    next_since: str
+
+
+class BatchClickRequest(BaseModel):
+    """Campaign ids to fetch click views for in one call"""
+    campaign_ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BatchClickItem(BaseModel):
+    """
+    Click view result for one requested campaign id.
+    `status_code` is what the single click endpoint would have returned
+    (200, 400, 403 or 404); `data` is only set for 200.
+    """
+    campaign_id: str
+    status_code: int
+    data: Optional[CampaignClickResponse] = None
+    detail: Optional[str] = None
+
+
+class BatchClickResponse(BaseModel):
+    """Response for the my-projects/applications/batch endpoint, one item per requested id in order"""
+    results: List[BatchClickItem]
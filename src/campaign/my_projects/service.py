@@ -1,151 +1,1201 @@
 # my_projects/service.py
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import and_, case, false, func, literal, null, or_, select, true, type_coerce, union_all
 from core.models import User, Campaign, CampaignParticipation
 from .schemas import (
+    MyProjectCard,
     MyProjectCampaign,
     MyProjectsResponse,
+    MyProjectsCardResponse,
     CampaignClickResponse,
     ApplicantInfo,
     ApplicationDetails,
     ApplicationStats,
+    BatchClickItem,
+    BatchClickResponse,
+    ApplicantChange,
+    MyProjectsChangesResponse,
+    MyProjectsCountsResponse,
 )
-from typing import List, Optional
+from . import indexes  # noqa: F401  registers the updated_at indexes with the tables
+from .cache import ProjectsCache, projects_cache
+from .counters import (
+    COUNTER_FIELDS,
+    _APPROVED_COUNT,
+    _PENDING_COUNT,
+    _REJECTED_COUNT,
+    _application_status,
+    _application_status_clause,
+)
+from .metrics import timed_service_method
+from .singleflight import SingleFlight, project_flights
+from .models import CampaignApplicationCounter, UserProjectEntry
+from typing import Dict, Iterable, Iterator, List, Literal, NamedTuple, Optional, Tuple, Union
+from datetime import datetime, timedelta, timezone
+import base64
+import hashlib
+import json
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
+# Page size used when a cursor is passed without an explicit limit
+DEFAULT_PAGE_SIZE = 20
+
+# Rows fetched per round-trip when streaming the project list
+STREAM_BATCH_SIZE = int(os.getenv("MY_PROJECTS_STREAM_BATCH_SIZE", "500"))
+
+# Delta sync re-reads this many seconds before the `since` token, so rows
+# written by transactions still open when the token was issued are not missed
+CHANGES_OVERLAP_SECONDS = float(os.getenv("MY_PROJECTS_CHANGES_OVERLAP_SECONDS", "5"))
+
+
+class ProjectFilters(NamedTuple):
+    """Server-side filters for the project list; None means unfiltered"""
+    role: Optional[Literal["owner", "applicant"]] = None
+    status: Optional[Literal["active", "inactive"]] = None
+    application_status: Optional[Literal["pending", "approved", "rejected"]] = None
+    category: Optional[str] = None
+
+    @property
+    def include_owned(self) -> bool:
+        # Owned campaigns have no application status of their own
+        return self.role != "applicant" and self.application_status is None
+
+    @property
+    def include_applied(self) -> bool:
+        return self.role != "owner"
+
+    def campaign_clauses(self, source=Campaign) -> list:
+        """WHERE clauses on the campaign fields of `source` shared by both roles"""
+        clauses = []
+        if self.status == "active":
+            clauses.append(source.is_active.is_(True))
+        elif self.status == "inactive":
+            clauses.append(source.is_active.is_not(True))
+        if self.category is not None:
+            clauses.append(source.category == self.category)
+        return clauses
+
+    def participation_clauses(self, source=CampaignParticipation) -> list:
+        """WHERE clauses on the user's own participation (applicant rows)"""
+        if self.application_status is None:
+            return []
+        return [_application_status_clause(self.application_status, source)]
+
+    def entry_clauses(self) -> list:
+        """The same filters as WHERE clauses on user_project_entries"""
+        e = UserProjectEntry
+        clauses = self.campaign_clauses(e) + self.participation_clauses(e)
+        if not self.include_owned:
+            clauses.append(e.user_role == "applicant")
+        if not self.include_applied:
+            clauses.append(e.user_role == "owner")
+        return clauses
+
+
+NO_FILTERS = ProjectFilters()
+
+
+# A keyset position: (timestamp or None, id, ...) of the last row of a page
+KeysetPosition = tuple
+
+
+def _encode_cursor(timestamp: Optional[datetime], *row_ids: int) -> str:
+    """Encode a (timestamp, *ids) keyset position as an opaque cursor; the timestamp may be NULL"""
+    raw = json.dumps([timestamp.isoformat() if timestamp is not None else None, *row_ids]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> KeysetPosition:
+    """Decode a cursor produced by _encode_cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, *row_ids = json.loads(raw)
+        if not row_ids:
+            raise ValueError("cursor has no row id")
+        if timestamp is not None:
+            timestamp = datetime.fromisoformat(timestamp)
+        return (timestamp, *(int(row_id) for row_id in row_ids))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def _utcnow() -> datetime:
+    """Naive UTC now, the convention of the models' updated_at columns"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _encode_since(timestamp: datetime) -> str:
+    """Encode a delta sync position as an opaque token"""
+    raw = json.dumps([timestamp.isoformat()]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_since(token: str) -> datetime:
+    """Decode a token produced by _encode_since"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        (timestamp,) = json.loads(raw)
+        return datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid since token: {token}") from e
+
+
+def _ids_before(id_columns, row_ids):
+    """(id_columns) < (row_ids) in lexicographic order, spelled out so indexes apply"""
+    # zip stops at the shorter: cursors issued before a tiebreaker was added carry fewer ids
+    pairs = list(zip(id_columns, row_ids))
+    return or_(*(
+        and_(*(column == row_id for column, row_id in pairs[:i]), pairs[i][0] < pairs[i][1])
+        for i in range(len(pairs))
+    ))
+
+
+def _keyset_page(
+    query,
+    after: Optional[KeysetPosition],
+    limit: Optional[int],
+    timestamp_column=Campaign.created_at,
+    id_columns=(Campaign.id,),
+):
+    """
+    Order a query by (timestamp, *ids) descending, rows without a
+    timestamp last, and, when paginating, restrict it to rows strictly
+    after the cursor position. The id columns must make the order unique,
+    or rows sharing a position are skipped between pages. Defaults to
+    campaign ordering. One extra row is fetched so callers can tell
+    whether more follow.
+    """
+    if after is not None:
+        timestamp, *row_ids = after
+        same_timestamp_after = _ids_before(id_columns, row_ids)
+        if timestamp is None:
+            query = query.filter(timestamp_column.is_(None), same_timestamp_after)
+        else:
+            query = query.filter(or_(
+                timestamp_column < timestamp,
+                timestamp_column.is_(None),
+                and_(timestamp_column == timestamp, same_timestamp_after),
+            ))
+    query = query.order_by(timestamp_column.desc().nulls_last(), *(column.desc() for column in id_columns))
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
+
+
+def _null_as(column):
+    """Typed NULL so union columns keep the result type of `column`"""
+    return type_coerce(null(), column.type)
+
+
+def _campaign_columns(source=Campaign, include_description: bool = True) -> list:
+    """Campaign fields of a list row, read from Campaign or UserProjectEntry"""
+    columns = [
+        (source.campaign_id if source is UserProjectEntry else source.id).label("id"),
+        source.title.label("title"),
+        source.summary.label("summary"),
+        source.budget.label("budget"),
+        source.target_views.label("target_views"),
+        source.poster_url.label("poster_url"),
+        source.category.label("category"),
+        source.is_active.label("is_active"),
+        source.created_at.label("created_at"),
+    ]
+    if include_description:
+        columns.append(source.description.label("description"))
+    return columns
+
+
+def _owner_rows(*clauses, include_description: bool = True):
+    """
+    List rows of owned campaigns matching `clauses`: the campaign fields,
+    the owner as `user_id`, application stats read from the materialized
+    counters and NULL participation fields
+    """
+    p = CampaignParticipation
+    counters = CampaignApplicationCounter.__table__
+    return (
+        select(
+            Campaign.user_id.label("user_id"),
+            *_campaign_columns(include_description=include_description),
+            literal("owner").label("user_role"),
+            func.coalesce(counters.c.total, 0).label("stats_total"),
+            func.coalesce(counters.c.pending, 0).label("stats_pending"),
+            func.coalesce(counters.c.approved, 0).label("stats_approved"),
+            func.coalesce(counters.c.rejected, 0).label("stats_rejected"),
+            _null_as(p.is_pending).label("is_pending"),
+            _null_as(p.is_approved).label("is_approved"),
+            _null_as(p.applied_at).label("applied_at"),
+            _null_as(p.approved_at).label("approved_at"),
+            _null_as(p.review_message).label("review_message"),
+            _null_as(p.rejection_reason).label("rejection_reason"),
+        )
+        .select_from(Campaign)
+        .outerjoin(counters, counters.c.campaign_id == Campaign.id)
+        # A campaign without an owner has no owner entry
+        .where(Campaign.user_id.is_not(None), *clauses)
+    )
+
+
+def _applicant_rows(*clauses, include_description: bool = True):
+    """
+    List rows of applications matching `clauses`: the campaign fields,
+    the applicant as `user_id`, NULL stats and the participation fields.
+    Applications to the applicant's own campaigns are left out since
+    those are owner rows.
+    """
+    p = CampaignParticipation
+    counters = CampaignApplicationCounter.__table__
+    return (
+        select(
+            p.user_id.label("user_id"),
+            *_campaign_columns(include_description=include_description),
+            literal("applicant").label("user_role"),
+            _null_as(counters.c.total).label("stats_total"),
+            _null_as(counters.c.total).label("stats_pending"),
+            _null_as(counters.c.total).label("stats_approved"),
+            _null_as(counters.c.total).label("stats_rejected"),
+            p.is_pending.label("is_pending"),
+            p.is_approved.label("is_approved"),
+            p.applied_at.label("applied_at"),
+            p.approved_at.label("approved_at"),
+            p.review_message.label("review_message"),
+            p.rejection_reason.label("rejection_reason"),
+        )
+        .select_from(p)
+        .join(Campaign, Campaign.id == p.campaign_id)
+        # IS DISTINCT FROM: campaigns without an owner (NULL user_id) still list their applicants
+        .where(Campaign.user_id.is_distinct_from(p.user_id), *clauses)
+    )
+
+
+def _projects_statement(
+    user_id: str,
+    after: Optional[KeysetPosition] = None,
+    limit: Optional[int] = None,
+    include_description: bool = True,
+    filters: ProjectFilters = NO_FILTERS,
+    campaign_ids=None,
+):
+    """
+    Build the project list from the source tables as one UNION ALL of
+    _owner_rows and _applicant_rows. Used by delta sync; the list itself
+    reads the user_project_entries read model (_entries_statement).
+    The description column is only selected when `include_description`
+    is set (full view), so card lists never read it.
+
+    `filters` become WHERE clauses of each branch, and a branch the
+    filters rule out (e.g. owned campaigns for role=applicant) is left
+    out of the statement entirely. `campaign_ids` (ids or a select of
+    them) restricts both branches to those campaigns.
+
+    Every row is tagged with `user_role` and the result is ordered by
+    (created_at, id) descending. When paginating, each branch is bounded
+    by the keyset predicate and limit before the outer merge.
+    """
+    p = CampaignParticipation
+    campaign_clauses = filters.campaign_clauses()
+    if campaign_ids is not None:
+        campaign_clauses.append(Campaign.id.in_(campaign_ids))
+
+    # 1. Campaigns user CREATED (owner role)
+    owner_rows = _owner_rows(
+        Campaign.user_id == user_id, *campaign_clauses, include_description=include_description
+    )
+    # 2. Campaigns user APPLIED TO (applicant role)
+    applicant_rows = _applicant_rows(
+        p.user_id == user_id,
+        *campaign_clauses,
+        *filters.participation_clauses(),
+        include_description=include_description,
+    )
+
+    branches = []
+    if filters.include_owned:
+        branches.append(owner_rows)
+    if filters.include_applied:
+        branches.append(applicant_rows)
+    if not branches:
+        branches.append(owner_rows.where(false()))
+
+    if limit is not None:
+        # ORDER BY/LIMIT inside a UNION member needs its own subquery
+        branches = [select(_keyset_page(branch, after, limit).subquery()) for branch in branches]
+
+    if len(branches) == 1:
+        projects = branches[0].subquery("projects")
+    else:
+        projects = union_all(*branches).subquery("projects")
+    statement = select(projects).order_by(projects.c.created_at.desc().nulls_last(), projects.c.id.desc())
+    if limit is not None:
+        statement = statement.limit(limit + 1)
+    return statement
+
+
+def _entries_statement(
+    user_id: str,
+    after: Optional[KeysetPosition] = None,
+    limit: Optional[int] = None,
+    include_description: bool = True,
+    filters: ProjectFilters = NO_FILTERS,
+):
+    """
+    The project list behind get_user_projects, read from the
+    user_project_entries read model: one range of its (user_id,
+    created_at, campaign_id, id) index, with the rows and labels of
+    _projects_statement plus `entry_id`.
+    """
+    e = UserProjectEntry
+    statement = select(
+        *_campaign_columns(e, include_description),
+        e.user_role,
+        e.stats_total,
+        e.stats_pending,
+        e.stats_approved,
+        e.stats_rejected,
+        e.is_pending,
+        e.is_approved,
+        e.applied_at,
+        e.approved_at,
+        e.review_message,
+        e.rejection_reason,
+        e.id.label("entry_id"),
+    ).where(e.user_id == user_id, *filters.entry_clauses())
+    # A user who applied twice has two entries for one campaign: the entry id breaks the tie
+    return _keyset_page(
+        statement, after, limit, timestamp_column=e.created_at, id_columns=(e.campaign_id, e.id)
+    )
+
+
+def _flight_key(cache: ProjectsCache, user_id: str, *params) -> tuple:
+    """
+    Single-flight key of a call: its arguments and the cache version,
+    which moves on every commit that invalidates a cached list
+    """
+    return (str(user_id), params, cache.version())
+
+
+def _fingerprint(*parts) -> str:
+    """Weak ETag from version parts (row counts, max timestamps, request params)"""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+# Response models are built with model_construct: rows come from our own
+# schema, so validation only costs time. Values the validator would have
+# coerced (e.g. Numeric budgets) are converted explicitly so serialized
+# output is unchanged.
+_REQUIRED_FIELDS = {
+    model: [name for name, field in model.model_fields.items() if field.is_required()]
+    for model in (MyProjectCampaign, MyProjectCard, ApplicantInfo, ApplicantChange, ApplicationDetails)
+}
+
+
+def _has_null_required(model, fields: dict) -> bool:
+    return any(fields[name] is None for name in _REQUIRED_FIELDS[model])
+
+
+def _construct(model, **fields):
+    """
+    model.model_construct(**fields), unless a required field is NULL:
+    such legacy rows are validated, raising the ValidationError the
+    response model has always raised for them.
+    """
+    if _has_null_required(model, fields):
+        return model(**fields)
+    return model.model_construct(**fields)
+
+
+def _row_to_campaign(row, view: str = "full") -> Union[MyProjectCampaign, MyProjectCard]:
+    """Build a MyProjectCampaign (or MyProjectCard for view=card) from a list row"""
+    is_owner = row.user_role == "owner"
+    extra = {"description": row.description} if view == "full" else {}
+    model = MyProjectCampaign if view == "full" else MyProjectCard
+    fields = dict(
+        id=str(row.id),
+        title=row.title,
+        summary=row.summary,
+        budget=row.budget,
+        target_views=row.target_views,
+        poster_url=row.poster_url,
+        category=row.category,
+        status="active" if row.is_active else "inactive",
+        created_at=row.created_at,
+        user_role=row.user_role,
+        # Owner-specific fields
+        application_stats=ApplicationStats.model_construct(
+            total=row.stats_total,
+            pending=row.stats_pending,
+            approved=row.stats_approved,
+            rejected=row.stats_rejected,
+        ) if is_owner else None,
+        # Applicant-specific fields
+        application_status=None if is_owner else _application_status(row.is_pending, row.is_approved),
+        applied_at=row.applied_at,
+        approved_at=row.approved_at,
+        review_message=row.review_message,
+        rejection_reason=row.rejection_reason,
+        **extra,
+    )
+    if _has_null_required(model, fields):
+        return model(**fields)
+    fields["budget"] = float(row.budget)
+    fields["target_views"] = int(row.target_views)
+    return model.model_construct(**fields)
+
+
+def _projects_version_statement(user_id: str, filters: ProjectFilters = NO_FILTERS):
+    """
+    Whether the user exists, plus, as one row, the parts of the list
+    `filters` can include: the count and max(updated_at) of the owned
+    campaigns and their application counters with the summed stats, and
+    the count and max(updated_at) of the user's own participations and
+    the campaigns they point to. Owned campaigns are read through their
+    maintained counters, never their participations.
+    """
+    p = CampaignParticipation
+    counter = CampaignApplicationCounter
+    parts = []
+    if filters.include_owned:
+        parts.append(select(func.count(Campaign.id), func.max(Campaign.updated_at)).where(
+            Campaign.user_id == user_id
+        ).subquery())
+        parts.append(
+            select(
+                func.count(counter.campaign_id),
+                func.max(counter.updated_at),
+                func.sum(counter.pending),
+                func.sum(counter.approved),
+                func.sum(counter.rejected),
+            )
+            .join(Campaign, Campaign.id == counter.campaign_id)
+            .where(Campaign.user_id == user_id)
+            .subquery()
+        )
+    if filters.include_applied:
+        parts.append(
+            select(func.count(p.id), func.max(p.updated_at), func.max(Campaign.updated_at))
+            .join(Campaign, Campaign.id == p.campaign_id)
+            .where(p.user_id == user_id, Campaign.user_id.is_distinct_from(user_id))
+            .subquery()
+        )
+    statement = select(_user_exists_statement(user_id).exists().label("user_exists"), *parts)
+    if len(parts) > 1:
+        # Each subquery is a single aggregate row, so joining on true is a 1x1(x1) product
+        joined = parts[0]
+        for part in parts[1:]:
+            joined = joined.join(part, true())
+        statement = statement.select_from(joined)
+    return statement
+
+
+def _projects_version(user_id: str, row, params: tuple) -> str:
+    """ETag from a _projects_version_statement row; raises ValueError like get_user_projects"""
+    if not row.user_exists:
+        raise ValueError(f"User not found: {user_id}")
+    return _fingerprint("projects", user_id, tuple(row), params)
+
+
+def _campaign_version_statement(user_id: str, campaign_id: str):
+    """
+    The campaign's id/owner/updated_at, the count and max(updated_at) of
+    its participations, and how many of them are the user's
+    """
+    p = CampaignParticipation
+    campaign = select(Campaign.id, Campaign.user_id, Campaign.updated_at).where(
+        Campaign.id == int(campaign_id)
+    ).subquery()
+    participations = select(
+        func.count(p.id),
+        func.max(p.updated_at),
+        func.count(case((p.user_id == user_id, 1))).label("applied"),
+    ).where(p.campaign_id == int(campaign_id)).subquery()
+    return select(campaign, participations).select_from(
+        participations.outerjoin(campaign, true())
+    )
+
+
+def _campaign_version(user_id: str, campaign_id: str, row, params: tuple) -> str:
+    """
+    ETag from a _campaign_version_statement row; raises ValueError like
+    get_campaign_click_data, so a conditional request (even
+    `If-None-Match: *`) never gets a 304 for a campaign the user cannot see
+    """
+    if row.id is None:
+        raise ValueError(f"Campaign not found: {campaign_id}")
+    if str(row.user_id) != str(user_id) and not row.applied:
+        raise ValueError(f"User {user_id} has no relationship with campaign {campaign_id}")
+    return _fingerprint("campaign", user_id, campaign_id, tuple(row), params)
+
+
+def _stream_campaigns(result, first, view: str) -> Iterator[Union[MyProjectCampaign, MyProjectCard]]:
+    """Yield campaigns from a streamed _entries_statement result, closing it when done"""
+    count = 0
+    try:
+        yield _row_to_campaign(first, view)
+        count += 1
+        for row in result:
+            yield _row_to_campaign(row, view)
+            count += 1
+    finally:
+        result.close()
+        logger.info(f"✅ Streamed {count} campaigns")
+
+
+def _page_params(
+    limit: Optional[int], cursor: Optional[str]
+) -> Tuple[bool, Optional[int], Optional[KeysetPosition]]:
+    """Resolve (paginated, limit, keyset position) from request parameters"""
+    paginated = limit is not None or cursor is not None
+    if paginated and limit is None:
+        limit = DEFAULT_PAGE_SIZE
+    after = _decode_cursor(cursor) if cursor else None
+    return paginated, limit, after
+
+
+def _user_exists_statement(user_id: str):
+    return select(User.id).where(User.id == user_id).limit(1)
+
+
+def _project_counts_statement(user_id: str, filters: ProjectFilters = NO_FILTERS):
+    """Owned and applied campaign counts matching `filters`, from the read model in one statement"""
+    e = UserProjectEntry
+    return select(
+        func.coalesce(func.sum(case((e.user_role == "owner", 1), else_=0)), 0),
+        func.coalesce(func.sum(case((e.user_role == "applicant", 1), else_=0)), 0),
+    ).where(e.user_id == user_id, *filters.entry_clauses())
+
+
+def _badge_counts_statement(user_id: str):
+    """
+    Owner-side application totals summed from the counters of the owned
+    campaigns, and the user's own applications counted by status, as one
+    row of eight columns
+    """
+    p = CampaignParticipation
+    counters = CampaignApplicationCounter.__table__
+    owned = (
+        select(*(func.coalesce(func.sum(counters.c[field]), 0) for field in COUNTER_FIELDS))
+        .select_from(Campaign)
+        .join(counters, counters.c.campaign_id == Campaign.id)
+        .where(Campaign.user_id == user_id)
+        .subquery()
+    )
+    applied = (
+        select(
+            func.count(p.id),
+            func.coalesce(_PENDING_COUNT, 0),
+            func.coalesce(_APPROVED_COUNT, 0),
+            func.coalesce(_REJECTED_COUNT, 0),
+        )
+        .join(Campaign, Campaign.id == p.campaign_id)
+        .where(p.user_id == user_id, Campaign.user_id.is_distinct_from(user_id))
+        .subquery()
+    )
+    # Both subqueries are single aggregate rows
+    return select(owned, applied).select_from(owned.join(applied, true()))
+
+
+def _build_counts_response(user_id: str, row) -> MyProjectsCountsResponse:
+    """MyProjectsCountsResponse from a _badge_counts_statement row"""
+    owner, applicant = row[:4], row[4:]
+    return MyProjectsCountsResponse.model_construct(
+        user_id=user_id,
+        as_owner=ApplicationStats.model_construct(**dict(zip(COUNTER_FIELDS, map(int, owner)))),
+        as_applicant=ApplicationStats.model_construct(**dict(zip(COUNTER_FIELDS, map(int, applicant)))),
+    )
+
+
+def _build_projects_response(
+    user_id: str,
+    rows,
+    view: str,
+    limit: Optional[int],
+    counts: Optional[Tuple[int, int]] = None,
+) -> Union[MyProjectsResponse, MyProjectsCardResponse]:
+    """
+    Assemble the list response from _entries_statement rows. Role counts
+    are tallied from the rows unless `counts` (owner, applicant) is given
+    for a paginated request.
+    """
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1].created_at, rows[-1].id, rows[-1].entry_id)
+
+    campaigns_list: List[Union[MyProjectCampaign, MyProjectCard]] = []
+    owner_count = applicant_count = 0
+    for row in rows:
+        campaigns_list.append(_row_to_campaign(row, view))
+        if row.user_role == "owner":
+            owner_count += 1
+        else:
+            applicant_count += 1
+
+    if counts is not None:
+        owner_count, applicant_count = counts
+
+    total_count = owner_count + applicant_count
+
+    logger.info(
+        f"✅ Found {total_count} campaigns for user {user_id} "
+        f"(owner={owner_count}, applicant={applicant_count}, returned={len(campaigns_list)})"
+    )
+
+    response_model = MyProjectsResponse if view == "full" else MyProjectsCardResponse
+    return response_model.model_construct(
+        user_id=user_id,
+        total_campaigns=total_count,
+        campaigns_as_owner=owner_count,
+        campaigns_as_applicant=applicant_count,
+        campaigns=campaigns_list,
+        message=f"Found {total_count} campaigns for user {user_id}",
+        next_cursor=next_cursor,
+    )
+
+
+def _applicants_statement(
+    campaign_id: str,
+    after: Optional[KeysetPosition] = None,
+    limit: Optional[int] = None,
+):
+    """Participations joined to their users, newest first (owner view)"""
+    # Inner join skips participations whose user no longer exists
+    statement = (
+        select(CampaignParticipation, User)
+        .join(User, User.id == CampaignParticipation.user_id)
+        .where(CampaignParticipation.campaign_id == int(campaign_id))
+    )
+    return _keyset_page(
+        statement, after, limit,
+        timestamp_column=CampaignParticipation.applied_at,
+        id_columns=(CampaignParticipation.id,),
+    )
+
+
+def _applicant_count_statement(campaign_id: str):
+    return (
+        select(func.count(CampaignParticipation.id))
+        .join(User, User.id == CampaignParticipation.user_id)
+        .where(CampaignParticipation.campaign_id == int(campaign_id))
+    )
+
+
+def _build_applicants(rows, limit: Optional[int]) -> Tuple[List[ApplicantInfo], Optional[str]]:
+    """Turn (participation, user) rows into one page of ApplicantInfo and the next cursor"""
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1][0]
+        next_cursor = _encode_cursor(last.applied_at, last.id)
+
+    applicants = [_construct(ApplicantInfo, **_applicant_fields(p, user)) for p, user in rows]
+    return applicants, next_cursor
+
+
+def _applicant_fields(p: CampaignParticipation, user: User) -> dict:
+    """ApplicantInfo fields of a (participation, user) row"""
+    return dict(
+        user_id=str(user.id),
+        username=user.username,
+        email=user.email,
+        profile_image_url=user.profile_image_url,
+        rating=float(user.rating) if user.rating else 0.0,
+        user_level=user.user_level,
+        is_verified=user.is_verified,
+        participation_id=str(p.id),
+        status=_application_status(p.is_pending, p.is_approved),
+        applied_at=p.applied_at,
+        approved_at=p.approved_at,
+        reason_for_participation=p.reason_for_participation or "",
+        review_message=p.review_message,
+        rejection_reason=p.rejection_reason,
+    )
+
+
+def _build_application_details(
+    participation: CampaignParticipation, owner: Optional[User]
+) -> ApplicationDetails:
+    return _construct(
+        ApplicationDetails,
+        participation_id=str(participation.id),
+        status=_application_status(participation.is_pending, participation.is_approved),
+        applied_at=participation.applied_at,
+        approved_at=participation.approved_at,
+        reason_for_participation=participation.reason_for_participation or "",
+        review_message=participation.review_message,
+        rejection_reason=participation.rejection_reason,
+        campaign_owner_id=str(owner.id) if owner else "",
+        campaign_owner_username=owner.username if owner else "Unknown",
+    )
+
+
+def _changed_campaign_ids_statement(user_id: str, changed_after: datetime):
+    """
+    Ids of the user's list entries with rows written after `changed_after`:
+    owned campaigns edited or with applications written, campaigns the
+    user applied to that were edited, and the user's own applications.
+    Every branch is bounded by an updated_at index (see indexes.py), so
+    old rows are never read: per owned campaign or application at most
+    an index probe, otherwise only the changed rows. Ids may repeat.
+    """
+    p = CampaignParticipation
+    return union_all(
+        select(Campaign.id).where(Campaign.user_id == user_id, Campaign.updated_at > changed_after),
+        select(p.campaign_id)
+        .join(Campaign, Campaign.id == p.campaign_id)
+        .where(Campaign.user_id == user_id, p.updated_at > changed_after),
+        select(p.campaign_id).where(p.user_id == user_id, p.updated_at > changed_after),
+        select(Campaign.id)
+        .join(p, p.campaign_id == Campaign.id)
+        .where(p.user_id == user_id, Campaign.updated_at > changed_after),
+    )
+
+
+def _changes_statement(user_id: str, changed_after: Optional[datetime]):
+    """List entries (full view) changed after `changed_after`, or all of them for None"""
+    if changed_after is None:
+        return _projects_statement(user_id)
+    return _projects_statement(
+        user_id, campaign_ids=_changed_campaign_ids_statement(user_id, changed_after)
+    )
+
+
+def _changed_applicants_statement(user_id: str, changed_after: Optional[datetime]):
+    """Applications to the user's campaigns written after `changed_after` (all for None), oldest change first"""
+    p = CampaignParticipation
+    statement = (
+        select(p, User)
+        .join(User, User.id == p.user_id)
+        .join(Campaign, Campaign.id == p.campaign_id)
+        .where(Campaign.user_id == user_id)
+    )
+    if changed_after is not None:
+        statement = statement.where(p.updated_at > changed_after)
+    return statement.order_by(p.updated_at, p.id)
+
+
+def _build_changes_response(
+    user_id: str, rows, applicant_rows, next_since: str
+) -> MyProjectsChangesResponse:
+    return MyProjectsChangesResponse.model_construct(
+        user_id=user_id,
+        campaigns=[_row_to_campaign(row) for row in rows],
+        applicants=[
+            _construct(
+                ApplicantChange,
+                **_applicant_fields(p, user),
+                campaign_id=str(p.campaign_id),
+                updated_at=p.updated_at,
+            )
+            for p, user in applicant_rows
+        ],
+        next_since=next_since,
+    )
+
+
+def _click_error_status(error: ValueError) -> int:
+    """HTTP status the click endpoint maps a service ValueError to"""
+    message = str(error).lower()
+    if "not found" in message:
+        return 404
+    elif "no relationship" in message:
+        return 403
+    return 400
+
+
+def _batch_campaign_ids(campaign_ids: Iterable[str]) -> List[int]:
+    """Distinct integer ids among the requested ones; invalid ids are reported per item"""
+    ids = set()
+    for campaign_id in campaign_ids:
+        try:
+            ids.add(int(campaign_id))
+        except ValueError:
+            continue
+    return sorted(ids)
+
+
+def _batch_campaigns_statement(campaign_ids: List[int]):
+    return select(Campaign).where(Campaign.id.in_(campaign_ids))
+
+
+def _batch_participations_statement(user_id: str, campaign_ids: List[int]):
+    """The user's own participations in the given campaigns"""
+    return select(CampaignParticipation).where(
+        CampaignParticipation.campaign_id.in_(campaign_ids),
+        CampaignParticipation.user_id == user_id,
+    )
+
+
+def _batch_applicants_statement(campaign_ids: List[int]):
+    """Participations joined to their users for several campaigns, newest first"""
+    return (
+        select(CampaignParticipation, User)
+        .join(User, User.id == CampaignParticipation.user_id)
+        .where(CampaignParticipation.campaign_id.in_(campaign_ids))
+        .order_by(CampaignParticipation.applied_at.desc(), CampaignParticipation.id.desc())
+    )
+
+
+def _batch_owners_statement(user_ids: Iterable[str]):
+    return select(User).where(User.id.in_(list(user_ids)))
+
+
+def _build_click_batch(
+    user_id: str,
+    campaign_ids: List[str],
+    campaigns: Dict[int, Campaign],
+    participations: Dict[int, CampaignParticipation],
+    applicant_rows,
+    owners: Dict[str, User],
+) -> BatchClickResponse:
+    """
+    Assemble one BatchClickItem per requested id, in request order, with
+    the same role logic and error messages as get_campaign_click_data.
+    """
+    applicants_by_campaign: Dict[int, list] = {}
+    for p, user in applicant_rows:
+        applicants_by_campaign.setdefault(p.campaign_id, []).append((p, user))
+
+    def click_response(campaign_id: str) -> CampaignClickResponse:
+        try:
+            campaign = campaigns.get(int(campaign_id))
+        except ValueError:
+            raise ValueError(f"Invalid campaign id: {campaign_id}")
+        if not campaign:
+            raise ValueError(f"Campaign not found: {campaign_id}")
+
+        if str(campaign.user_id) == str(user_id):
+            applicants, _ = _build_applicants(applicants_by_campaign.get(campaign.id, []), None)
+            return CampaignClickResponse.model_construct(
+                campaign_id=campaign_id,
+                campaign_title=campaign.title,
+                user_role="owner",
+                applicants=applicants,
+                application_details=None,
+                total_applicants=len(applicants),
+            )
+
+        participation = participations.get(campaign.id)
+        if participation is not None:
+            return CampaignClickResponse.model_construct(
+                campaign_id=campaign_id,
+                campaign_title=campaign.title,
+                user_role="applicant",
+                applicants=None,
+                application_details=_build_application_details(
+                    participation, owners.get(campaign.user_id)
+                ),
+            )
+        raise ValueError(f"User {user_id} has no relationship with campaign {campaign_id}")
+
+    results = []
+    for campaign_id in campaign_ids:
+        try:
+            results.append(BatchClickItem.model_construct(
+                campaign_id=campaign_id, status_code=200, data=click_response(campaign_id)
+            ))
+        except ValueError as e:
+            results.append(BatchClickItem.model_construct(
+                campaign_id=campaign_id, status_code=_click_error_status(e), detail=str(e)
+            ))
+    return BatchClickResponse.model_construct(results=results)
+
+
+def _describe_projects(response: MyProjectsResponse) -> Tuple[str, int]:
+    """Metrics user_role and result count of a project list"""
+    if response.campaigns_as_owner and response.campaigns_as_applicant:
+        user_role = "mixed"
+    elif response.campaigns_as_owner:
+        user_role = "owner"
+    elif response.campaigns_as_applicant:
+        user_role = "applicant"
+    else:
+        user_role = "none"
+    return user_role, len(response.campaigns)
+
+
+def _describe_changes(response: MyProjectsChangesResponse) -> Tuple[str, int]:
+    """Metrics user_role (as for the list) and number of changed campaigns"""
+    roles = {campaign.user_role for campaign in response.campaigns}
+    user_role = "mixed" if len(roles) > 1 else next(iter(roles), "none")
+    return user_role, len(response.campaigns)
+
+
+def _describe_counts(response: MyProjectsCountsResponse) -> Tuple[str, None]:
+    """Metrics user_role of the badge counts: the sides with any applications"""
+    if response.as_owner.total and response.as_applicant.total:
+        return "mixed", None
+    elif response.as_owner.total:
+        return "owner", None
+    elif response.as_applicant.total:
+        return "applicant", None
+    return "none", None
+
+
+def _describe_click(response: CampaignClickResponse) -> Tuple[str, int]:
+    return response.user_role, len(response.applicants) if response.applicants is not None else 1
+
+
+def _describe_applicants(result: Tuple[List[ApplicantInfo], Optional[str]]) -> Tuple[str, int]:
+    return "owner", len(result[0])
+
+
+def _describe_application_details(result: ApplicationDetails) -> Tuple[str, int]:
+    return "applicant", 1
+
 
 class MyProjectsService:
     """
     Service for unified my-projects functionality.
     Handles both owner and applicant views in a single interface.
+
+    Full (non-paginated) project lists are served from an in-process
+    per-user cache that is invalidated on campaign/participation writes.
+    Concurrent identical list and click-view calls are coalesced.
     """
 
-    def get_user_projects(self, db: Session, user_id: str) -> MyProjectsResponse:
+    def __init__(self, cache: ProjectsCache = projects_cache, flights: SingleFlight = project_flights):
+        self.cache = cache
+        self.flights = flights
+
+    @timed_service_method("get_user_projects", _describe_projects)
+    def get_user_projects(
+        self,
+        db: Session,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        view: Literal["full", "card"] = "full",
+        filters: ProjectFilters = NO_FILTERS,
+    ) -> Union[MyProjectsResponse, MyProjectsCardResponse]:
         """
         Get all campaigns where user is either owner OR applicant.
-        Returns unified list with role indicator for each campaign.
+        Returns unified list with role indicator for each campaign,
+        ordered by (created_at, id) descending.
+
+        The list is one index range of the user_project_entries read model
+        (see entries.py). When `limit` or `cursor` is given, returns a
+        single keyset page of the owner + applicant entries. `next_cursor`
+        is set when more campaigns follow and is passed back as `cursor`
+        to fetch them.
+
+        With view="card" the description column is neither read nor
+        returned and the response is a MyProjectsCardResponse.
+
+        `filters` (role, status, application_status, category) are applied
+        in SQL; counts in the response are those of the filtered list.
+
+        Identical concurrent calls share one computation (singleflight.py).
         """
+        key = _flight_key(self.cache, user_id, limit, cursor, view, filters)
+        return self.flights.do(
+            "get_user_projects", key,
+            lambda: self._load_user_projects(db, user_id, limit, cursor, view, filters),
+        )
+
+    def _load_user_projects(
+        self,
+        db: Session,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        view: Literal["full", "card"] = "full",
+        filters: ProjectFilters = NO_FILTERS,
+    ) -> Union[MyProjectsResponse, MyProjectsCardResponse]:
+        """get_user_projects without coalescing"""
         logger.info(f"🔍 Getting user projects for user_id={user_id}")
 
-        # Verify user exists
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
+        paginated, limit, after = _page_params(limit, cursor)
+
+        if not paginated:
+            cached = self.cache.get(user_id, (view, filters))
+            if cached is not None:
+                logger.info(f"✅ Served {cached.total_campaigns} campaigns for user {user_id} from cache")
+                return cached
+            cache_version = self.cache.version()
+
+        statement = _entries_statement(
+            user_id, after, limit, include_description=view == "full", filters=filters
+        )
+        rows = db.execute(statement).all()
+
+        # Only an empty result needs the extra user existence check
+        if not rows and db.execute(_user_exists_statement(user_id)).first() is None:
             logger.warning(f"User not found: {user_id}")
             raise ValueError(f"User not found: {user_id}")
 
-        campaigns_list: List[MyProjectCampaign] = []
+        counts = self._count_user_projects(db, user_id, filters) if paginated else None
+        response = _build_projects_response(user_id, rows, view, limit, counts)
 
-        # 1. Get campaigns user CREATED (owner role)
-        owned_campaigns = db.query(Campaign).filter(Campaign.user_id == user_id).all()
+        if not paginated:
+            self.cache.set(user_id, (view, filters), response, cache_version)
+        return response
 
-        for campaign in owned_campaigns:
-            # Calculate application stats for this campaign
-            participations = db.query(CampaignParticipation).filter(
-                CampaignParticipation.campaign_id == campaign.id
-            ).all()
+    def stream_user_projects(
+        self,
+        db: Session,
+        user_id: str,
+        view: Literal["full", "card"] = "full",
+        filters: ProjectFilters = NO_FILTERS,
+    ) -> Iterator[Union[MyProjectCampaign, MyProjectCard]]:
+        """
+        Iterate the user's full project list one campaign at a time, in
+        get_user_projects order, without building the list in memory.
+        Rows are fetched in batches of STREAM_BATCH_SIZE (a server-side
+        cursor where the driver supports one) and the cache is bypassed.
 
-            stats = ApplicationStats(
-                total=len(participations),
-                pending=len([p for p in participations if p.is_pending]),
-                approved=len([p for p in participations if p.is_approved]),
-                rejected=len([p for p in participations if not p.is_pending and not p.is_approved]),
-            )
+        The first row is read eagerly so an unknown user raises ValueError
+        here rather than midway through a response. The returned iterator
+        holds the result open and must be consumed or closed while `db`
+        is still open.
+        """
+        logger.info(f"🔍 Streaming user projects for user_id={user_id}")
 
-            campaigns_list.append(MyProjectCampaign(
-                id=str(campaign.id),
-                title=campaign.title,
-                summary=campaign.summary,
-                description=campaign.description,
-                budget=campaign.budget,
-                target_views=campaign.target_views,
-                poster_url=campaign.poster_url,
-                category=campaign.category,
-                status="active" if campaign.is_active else "inactive",
-                created_at=campaign.created_at,
-                user_role="owner",
-                application_stats=stats,
-                # Applicant fields are None for owner
-                application_status=None,
-                applied_at=None,
-                approved_at=None,
-                review_message=None,
-                rejection_reason=None,
-            ))
+        statement = _entries_statement(user_id, include_description=view == "full", filters=filters)
+        result = db.execute(statement.execution_options(yield_per=STREAM_BATCH_SIZE))
+        first = result.fetchone()
+        if first is None:
+            result.close()
+            if db.execute(_user_exists_statement(user_id)).first() is None:
+                logger.warning(f"User not found: {user_id}")
+                raise ValueError(f"User not found: {user_id}")
+            return iter(())
+        return _stream_campaigns(result, first, view)
 
-        # 2. Get campaigns user APPLIED TO (applicant role)
-        participations = db.query(CampaignParticipation).filter(
-            CampaignParticipation.user_id == user_id
-        ).all()
+    def get_projects_version(
+        self,
+        db: Session,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        view: str = "full",
+        filters: ProjectFilters = NO_FILTERS,
+    ) -> str:
+        """
+        Cheap version fingerprint of the user's project list, without
+        building it. Computed in one statement from row counts and
+        max(updated_at) of the owned campaigns and their application
+        counters, and of the user's own participations and the campaigns
+        they point to; roles excluded by `filters` are not read.
+        The parameters are mixed in so each representation gets its own
+        ETag.
+        """
+        version = db.execute(_projects_version_statement(user_id, filters)).one()
+        return _projects_version(user_id, version, (limit, cursor, view, filters))
 
-        for participation in participations:
-            campaign = participation.campaign
-
-            # Skip if user is also the owner (already added above)
-            if str(campaign.user_id) == str(user_id):
-                continue
-
-            # Determine application status
-            if participation.is_pending:
-                status = "pending"
-            elif participation.is_approved:
-                status = "approved"
-            else:
-                status = "rejected"
-
-            campaigns_list.append(MyProjectCampaign(
-                id=str(campaign.id),
-                title=campaign.title,
-                summary=campaign.summary,
-                description=campaign.description,
-                budget=campaign.budget,
-                target_views=campaign.target_views,
-                poster_url=campaign.poster_url,
-                category=campaign.category,
-                status="active" if campaign.is_active else "inactive",
-                created_at=campaign.created_at,
-                user_role="applicant",
-                # Owner fields are None for applicant
-                application_stats=None,
-                # Applicant-specific fields
-                application_status=status,
-                applied_at=participation.applied_at,
-                approved_at=participation.approved_at,
-                review_message=participation.review_message,
-                rejection_reason=participation.rejection_reason,
-            ))
+    @timed_service_method("get_project_counts", _describe_counts)
+    def get_project_counts(self, db: Session, user_id: str) -> MyProjectsCountsResponse:
+        """
+        Badge counts: pending/approved/rejected applications received on
+        all owned campaigns (from the materialized counters) and the
+        user's own applications per status. One aggregate statement; no
+        campaign is loaded.
+        """
+        row = db.execute(_badge_counts_statement(user_id)).one()
 
-        # Sort by created_at descending (most recent first)
-        campaigns_list.sort(key=lambda x: x.created_at, reverse=True)
+        # Only all-zero counts need the extra user existence check
+        if not any(row) and db.execute(_user_exists_statement(user_id)).first() is None:
+            logger.warning(f"User not found: {user_id}")
+            raise ValueError(f"User not found: {user_id}")
 
-        # Calculate counts
-        owner_count = len([c for c in campaigns_list if c.user_role == "owner"])
-        applicant_count = len([c for c in campaigns_list if c.user_role == "applicant"])
+        return _build_counts_response(user_id, row)
 
-        logger.info(
-            f"✅ Found {len(campaigns_list)} campaigns for user {user_id} "
-            f"(owner={owner_count}, applicant={applicant_count})"
-        )
+    @timed_service_method("get_changes", _describe_changes)
+    def get_changes(
+        self, db: Session, user_id: str, since: Optional[str] = None
+    ) -> MyProjectsChangesResponse:
+        """
+        Delta sync: the user's list entries and owned-campaign applications
+        created or modified since the `since` token, plus the token for
+        the next poll. Without `since` everything is returned.
 
-        return MyProjectsResponse(
-            user_id=user_id,
-            total_campaigns=len(campaigns_list),
-            campaigns_as_owner=owner_count,
-            campaigns_as_applicant=applicant_count,
-            campaigns=campaigns_list,
-            message=f"Found {len(campaigns_list)} campaigns for user {user_id}",
-        )
+        Entries written up to CHANGES_OVERLAP_SECONDS before the token are
+        returned again, so clients must apply them idempotently (upsert by
+        id). Hard deletes leave no row behind and are not reported. Reads
+        go through the updated_at indexes (see indexes.py), so a poll
+        does not scan the history. The cache is bypassed.
+        """
+        logger.info(f"🔍 Getting project changes for user_id={user_id}")
+
+        # Issued before reading, so writes racing this read are seen next time
+        next_since = _encode_since(_utcnow())
+        changed_after = None
+        if since is not None:
+            changed_after = _decode_since(since) - timedelta(seconds=CHANGES_OVERLAP_SECONDS)
+
+        rows = db.execute(_changes_statement(user_id, changed_after)).all()
+        applicant_rows = db.execute(_changed_applicants_statement(user_id, changed_after)).all()
+
+        if not rows and db.execute(_user_exists_statement(user_id)).first() is None:
+            logger.warning(f"User not found: {user_id}")
+            raise ValueError(f"User not found: {user_id}")
 
+        logger.info(f"✅ {len(rows)} changed campaigns, {len(applicant_rows)} changed applicants for user {user_id}")
+        return _build_changes_response(user_id, rows, applicant_rows, next_since)
+
+    def invalidate_user_projects(self, *user_ids: str) -> None:
+        """
+        Drop cached project lists for the given users.
+        Committed ORM writes invalidate automatically (see hooks.py); call
+        this after writes that bypass the ORM session.
+        """
+        self.cache.invalidate(*user_ids)
+
+    def invalidate_campaign(self, db: Session, campaign_id: str) -> None:
+        """Drop cached project lists of a campaign's owner and all its applicants"""
+        owner_ids = db.query(Campaign.user_id).filter(Campaign.id == int(campaign_id)).all()
+        applicant_ids = db.query(CampaignParticipation.user_id).filter(
+            CampaignParticipation.campaign_id == int(campaign_id)
+        ).all()
+        self.cache.invalidate(*(str(row[0]) for row in owner_ids + applicant_ids))
+
+    def _count_user_projects(
+        self, db: Session, user_id: str, filters: ProjectFilters = NO_FILTERS
+    ) -> Tuple[int, int]:
+        """Count owned and applied campaigns matching `filters` without loading them"""
+        owner_count, applicant_count = db.execute(_project_counts_statement(user_id, filters)).one()
+        return owner_count or 0, applicant_count or 0
+
+    @timed_service_method("get_campaign_click_data", _describe_click)
     def get_campaign_click_data(
-        self, db: Session, user_id: str, campaign_id: str
+        self,
+        db: Session,
+        user_id: str,
+        campaign_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> CampaignClickResponse:
         """
         Get data for when user clicks a campaign.
         Returns appropriate view data based on user's role.
+
+        For owners, `limit`/`cursor` page through applicants ordered by
+        (applied_at, participation id) descending.
+
+        Identical concurrent calls share one computation (singleflight.py).
         """
+        key = _flight_key(self.cache, user_id, campaign_id, limit, cursor)
+        return self.flights.do(
+            "get_campaign_click_data", key,
+            lambda: self._load_campaign_click_data(db, user_id, campaign_id, limit, cursor),
+        )
+
+    def _load_campaign_click_data(
+        self,
+        db: Session,
+        user_id: str,
+        campaign_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> CampaignClickResponse:
+        """get_campaign_click_data without coalescing"""
         logger.info(f"🔍 Getting campaign click data for user={user_id}, campaign={campaign_id}")
 
+        _, limit, after = _page_params(limit, cursor)
+
         # Get campaign
         campaign = db.query(Campaign).filter(Campaign.id == int(campaign_id)).first()
         if not campaign:
@@ -164,18 +1214,20 @@ class MyProjectsService:
 
         if is_owner:
             # User is owner - return list of applicants
-            applicants = self._get_campaign_applicants(db, campaign_id)
-            return CampaignClickResponse(
+            applicants, next_cursor = self._get_campaign_applicants(db, campaign_id, limit, after)
+            return CampaignClickResponse.model_construct(
                 campaign_id=campaign_id,
                 campaign_title=campaign.title,
                 user_role="owner",
                 applicants=applicants,
                 application_details=None,
+                total_applicants=self._count_campaign_applicants(db, campaign_id),
+                next_cursor=next_cursor,
             )
         elif is_applicant:
             # User is applicant - return their application details
             application_details = self._get_application_details(db, participation, campaign)
-            return CampaignClickResponse(
+            return CampaignClickResponse.model_construct(
                 campaign_id=campaign_id,
                 campaign_title=campaign.title,
                 user_role="applicant",
@@ -185,73 +1237,82 @@ class MyProjectsService:
         else:
             raise ValueError(f"User {user_id} has no relationship with campaign {campaign_id}")
 
-    def _get_campaign_applicants(self, db: Session, campaign_id: str) -> List[ApplicantInfo]:
-        """Get all applicants for a campaign (for owner view)"""
-        participations = db.query(CampaignParticipation).filter(
-            CampaignParticipation.campaign_id == int(campaign_id)
-        ).all()
+    def get_campaign_click_data_batch(
+        self, db: Session, user_id: str, campaign_ids: List[str]
+    ) -> BatchClickResponse:
+        """
+        Click views for several campaigns at once, one item per requested
+        id with the status the single endpoint would return.
 
-        applicants = []
-        for p in participations:
-            user = db.query(User).filter(User.id == p.user_id).first()
-            if not user:
-                continue
-
-            # Determine status
-            if p.is_pending:
-                status = "pending"
-            elif p.is_approved:
-                status = "approved"
-            else:
-                status = "rejected"
-
-            applicants.append(ApplicantInfo(
-                user_id=str(user.id),
-                username=user.username,
-                email=user.email,
-                profile_image_url=user.profile_image_url,
-                rating=float(user.rating) if user.rating else 0.0,
-                user_level=user.user_level,
-                is_verified=user.is_verified,
-                participation_id=str(p.id),
-                status=status,
-                applied_at=p.applied_at,
-                approved_at=p.approved_at,
-                reason_for_participation=p.reason_for_participation or "",
-                review_message=p.review_message,
-                rejection_reason=p.rejection_reason,
-            ))
+        Runs at most four IN queries regardless of the number of ids:
+        campaigns, the user's participations, applicants of the owned
+        campaigns (with their users) and owners of the applied campaigns.
+        Owner views in a batch list all applicants (no paging).
+        """
+        logger.info(f"🔍 Getting batch click data for user={user_id}, {len(campaign_ids)} campaigns")
+
+        ids = _batch_campaign_ids(campaign_ids)
+        campaigns = {}
+        participations = {}
+        applicant_rows = []
+        owners = {}
+        if ids:
+            campaigns = {c.id: c for c in db.execute(_batch_campaigns_statement(ids)).scalars()}
+        if campaigns:
+            participations = {
+                p.campaign_id: p
+                for p in db.execute(_batch_participations_statement(user_id, list(campaigns))).scalars()
+            }
 
-        # Sort by applied_at descending
-        applicants.sort(key=lambda x: x.applied_at, reverse=True)
-        return applicants
+        owned_ids = [c.id for c in campaigns.values() if str(c.user_id) == str(user_id)]
+        owner_ids = {
+            campaigns[campaign_id].user_id for campaign_id in participations
+            if campaign_id not in owned_ids
+        }
+        if owned_ids:
+            applicant_rows = db.execute(_batch_applicants_statement(owned_ids)).all()
+        if owner_ids:
+            owners = {u.id: u for u in db.execute(_batch_owners_statement(owner_ids)).scalars()}
+
+        return _build_click_batch(user_id, campaign_ids, campaigns, participations, applicant_rows, owners)
+
+    def get_campaign_version(self, db: Session, user_id: str, campaign_id: str, *params) -> str:
+        """
+        Cheap version fingerprint of the click view for one campaign,
+        from the campaign's updated_at/owner and the count and
+        max(updated_at) of its participations.
+        """
+        version = db.execute(_campaign_version_statement(user_id, campaign_id)).one()
+        return _campaign_version(user_id, campaign_id, version, params)
 
+    @timed_service_method("_get_campaign_applicants", _describe_applicants)
+    def _get_campaign_applicants(
+        self,
+        db: Session,
+        campaign_id: str,
+        limit: Optional[int] = None,
+        after: Optional[KeysetPosition] = None,
+    ) -> Tuple[List[ApplicantInfo], Optional[str]]:
+        """
+        Get applicants for a campaign (for owner view), newest first.
+        Returns all applicants unless `limit` is given, in which case one
+        page is returned together with the cursor for the next page.
+        """
+        rows = db.execute(_applicants_statement(campaign_id, after, limit)).all()
+        return _build_applicants(rows, limit)
+
+    def _count_campaign_applicants(self, db: Session, campaign_id: str) -> int:
+        """Count applicants for a campaign without loading them"""
+        return db.execute(_applicant_count_statement(campaign_id)).scalar() or 0
+
+    @timed_service_method("_get_application_details", _describe_application_details)
     def _get_application_details(
         self, db: Session, participation: CampaignParticipation, campaign: Campaign
     ) -> ApplicationDetails:
         """Get application details for user's own application (for applicant view)"""
         # Get campaign owner info
         owner = db.query(User).filter(User.id == campaign.user_id).first()
-
-        # Determine status
-        if participation.is_pending:
-            status = "pending"
-        elif participation.is_approved:
-            status = "approved"
-        else:
-            status = "rejected"
-
-        return ApplicationDetails(
-            participation_id=str(participation.id),
-            status=status,
-            applied_at=participation.applied_at,
-            approved_at=participation.approved_at,
-            reason_for_participation=participation.reason_for_participation or "",
-            review_message=participation.review_message,
-            rejection_reason=participation.rejection_reason,
-            campaign_owner_id=str(owner.id) if owner else "",
-            campaign_owner_username=owner.username if owner else "Unknown",
-        )
+        return _build_application_details(participation, owner)
 
 
 # Singleton instance
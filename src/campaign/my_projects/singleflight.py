@@ -0,0 +1,152 @@
+# my_projects/singleflight.py
+"""
+Single-flight coalescing of identical concurrent service calls.
+
+Bursts of the same request (one account open on several devices, clients
+retrying) would each run the same queries at the same moment. With
+SingleFlight, the first caller of a key runs the computation and callers
+arriving while it is in flight wait for it and get the same result, or
+the same exception. Nothing is kept once the call finishes: callers
+arriving afterwards start a new computation (the result cache, cache.py,
+is what keeps results).
+
+`do` coalesces threads (sync routes run in a thread pool) and
+`do_async` coalesces tasks on one event loop; the two never share
+computations. Coalesced callers get the leader's result object, so
+results must not be mutated. If the leader of an async call is cancelled,
+a waiting caller takes over instead of being cancelled with it.
+
+Callers build keys from every argument that changes the result. The
+service adds the result cache version, which moves on every commit that
+invalidates cached lists, so a call made after a write never joins a
+computation that started before it.
+
+Every call is counted in my_projects_singleflight_calls_total{method,
+outcome} with outcome "executed" (ran the computation) or "coalesced"
+(shared another caller's).
+
+Configuration:
+- MY_PROJECTS_SINGLE_FLIGHT - set to 0 to run every call on its own
+"""
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+import asyncio
+import logging
+import os
+import threading
+
+from .metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+MY_PROJECTS_SINGLE_FLIGHT = os.getenv("MY_PROJECTS_SINGLE_FLIGHT", "1") != "0"
+
+T = TypeVar("T")
+
+singleflight_calls = metrics_registry.counter(
+    "my_projects_singleflight_calls_total",
+    "my-projects service calls that ran a computation or shared one already in flight",
+    ("method", "outcome"),
+)
+
+
+class _Call:
+    """One in-flight sync computation"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Thread-safe registry of in-flight calls keyed by (method, key)"""
+
+    def __init__(self, enabled: bool = MY_PROJECTS_SINGLE_FLIGHT):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._calls: Dict[Tuple[str, Hashable], _Call] = {}
+        self._futures: Dict[Tuple[asyncio.AbstractEventLoop, str, Hashable], asyncio.Future] = {}
+
+    def do(self, method: str, key: Hashable, fn: Callable[[], T]) -> T:
+        """Return fn(), sharing the computation with concurrent callers of the same key"""
+        if not self.enabled:
+            return fn()
+
+        flight_key = (method, key)
+        with self._lock:
+            call = self._calls.get(flight_key)
+            leader = call is None
+            if leader:
+                call = self._calls[flight_key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            singleflight_calls.inc(method=method, outcome="coalesced")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        singleflight_calls.inc(method=method, outcome="executed")
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[flight_key]
+            if call.waiters:
+                logger.debug(f"Coalesced {call.waiters} concurrent {method} calls")
+            call.done.set()
+
+    async def do_async(self, method: str, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async `do`: await fn(), sharing it with concurrent tasks of the same key on this loop"""
+        if not self.enabled:
+            return await fn()
+
+        flight_key = (asyncio.get_running_loop(), method, key)
+        while True:
+            with self._lock:
+                future = self._futures.get(flight_key)
+                if future is None:
+                    future = self._futures[flight_key] = asyncio.get_running_loop().create_future()
+                    break
+
+            singleflight_calls.inc(method=method, outcome="coalesced")
+            try:
+                # Shielded so a waiter being cancelled leaves the shared call alone
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled, not this task: run the call ourselves
+
+        singleflight_calls.inc(method=method, outcome="executed")
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved, so a call nobody waited for is not logged as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._futures[flight_key]
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls) + len(self._futures)
+
+
+# Shared instance used by the sync and async services
+project_flights = SingleFlight()
@@ -7,11 +7,27 @@ Tests the following scenarios:
 3. Owner sees applicant list when clicking their campaign
 4. Applicant sees their application details when clicking a campaign they applied to
 5. Role filtering works correctly
+6. Server-side role/status/category filters
+7. Delta sync via GET /my-projects/applications/changes
+8. Server-sent events for application changes
+9. Badge counts via GET /my-projects/counts
 """
 
+from datetime import datetime, timedelta
+import asyncio
+import importlib
+import json
+import logging
 import pytest
+import re
+import threading
+import time
+from fastapi import Depends, FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from pydantic import ValidationError
+from sqlalchemy import create_engine, event, inspect, update
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 import sys
@@ -21,8 +37,28 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from main import app
+import core.database
 from core.database import Base, get_db
 from core.models import User, Campaign, CampaignParticipation
+from core.security import get_current_user
+from src.campaign.my_projects.cache import projects_cache
+from src.campaign.my_projects import service as service_module
+from src.campaign.my_projects.counters import rebuild_counters, refresh_counters, verify_counters
+from src.campaign.my_projects.entries import rebuild_entries, verify_entries
+from src.campaign.my_projects import events as events_module
+from src.campaign.my_projects.events import event_broker
+from src.campaign.my_projects.indexes import create_indexes, participations_user_updated_at
+from src.campaign.my_projects.instrumentation import assert_max_queries, query_count, track_queries
+from src.campaign.my_projects.metrics import metrics_registry
+from src.campaign.my_projects.migrations import migrate
+from src.campaign.my_projects.models import CampaignApplicationCounter, MyProjectsMigration, UserProjectEntry
+from src.campaign.my_projects.router import router
+from src.campaign.my_projects.async_router import async_router
+from src.campaign.my_projects.service import MyProjectsService, ProjectFilters, my_projects_service
+from src.campaign.my_projects.singleflight import SingleFlight
+
+# The package re-exports `router` (the APIRouter), which shadows the module name
+router_module = importlib.import_module("src.campaign.my_projects.router")
 
 # Create in-memory SQLite database for testing
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -55,6 +91,7 @@ client = TestClient(app)
 def setup_database():
     """Create all tables before each test and drop them after."""
     Base.metadata.create_all(bind=engine)
+    projects_cache.clear()
     yield
     Base.metadata.drop_all(bind=engine)
 
@@ -312,6 +349,37 @@ class TestUnifiedMyProjectsEndpoints:
         assert "1" in campaign_ids
         assert "2" in campaign_ids
 
+    def test_own_campaign_application_listed_once(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """
+        Test that applying to your own campaign does not duplicate it.
+
+        Expected: creator1's application to campaign3 (which they own) is not
+        listed as an applicant entry.
+        """
+        self_application = CampaignParticipation(
+            id=5,
+            user_id=sample_users["creator1"].id,
+            campaign_id=sample_campaigns["campaign3"].id,
+            reason_for_participation="Applying to my own campaign",
+            is_pending=True,
+            is_approved=False,
+            terms_accepted=True,
+        )
+        db_session.add(self_application)
+        db_session.commit()
+
+        user_id = sample_users["creator1"].id
+        response = client.get(f"/my-projects/test/applications/{user_id}")
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["campaigns_as_owner"] == 1
+        assert data["campaigns_as_applicant"] == 2
+        assert [c["id"] for c in data["campaigns"]].count("3") == 1
+
     def test_campaign_click_as_owner(
         self, db_session, sample_users, sample_campaigns, sample_participations
     ):
@@ -346,6 +414,42 @@ class TestUnifiedMyProjectsEndpoints:
             assert "status" in applicant
             assert applicant["status"] in ["pending", "approved", "rejected"]
 
+    def test_campaign_click_as_owner_orders_and_skips_missing_users(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """
+        Test that applicants are newest first and orphaned participations are skipped.
+
+        Expected: a participation whose user no longer exists is not listed.
+        """
+        orphan = CampaignParticipation(
+            id=5,
+            user_id="deleted_user_001",
+            campaign_id=sample_campaigns["campaign1"].id,
+            reason_for_participation="Account since removed",
+            is_pending=True,
+            is_approved=False,
+            terms_accepted=True,
+        )
+        db_session.add(orphan)
+        db_session.commit()
+
+        user_id = sample_users["brand"].id
+        campaign_id = sample_campaigns["campaign1"].id
+
+        response = client.get(
+            f"/my-projects/test/applications/{user_id}/campaign/{campaign_id}"
+        )
+
+        assert response.status_code == 200
+        applicants = response.json()["applicants"]
+
+        assert len(applicants) == 2
+        assert "deleted_user_001" not in [a["user_id"] for a in applicants]
+
+        applied = [a["applied_at"] for a in applicants]
+        assert applied == sorted(applied, reverse=True)
+
     def test_campaign_click_as_applicant(
         self, db_session, sample_users, sample_campaigns, sample_participations
     ):
@@ -514,6 +618,1745 @@ class TestUnifiedMyProjectsEndpoints:
         assert stats["rejected"] == 0
         assert stats["approved"] == 1
 
+    def test_application_stats_for_campaign_without_applications(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that an owned campaign with no applications reports zero stats."""
+        empty_campaign = Campaign(
+            id=4,
+            user_id=sample_users["brand"].id,
+            title="Quiet Campaign",
+            summary="Nobody applied yet",
+            description="No applications",
+            budget=500.0,
+            target_views=1000,
+            category="TECH",
+            is_active=False,
+        )
+        db_session.add(empty_campaign)
+        db_session.commit()
+
+        user_id = sample_users["brand"].id
+        response = client.get(f"/my-projects/test/applications/{user_id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["campaigns_as_owner"] == 3
+
+        campaign4_data = next(
+            (c for c in data["campaigns"] if c["id"] == "4"), None
+        )
+        assert campaign4_data is not None
+        assert campaign4_data["status"] == "inactive"
+        assert campaign4_data["application_stats"] == {
+            "total": 0, "pending": 0, "approved": 0, "rejected": 0,
+        }
+
+    def test_application_to_campaign_without_owner(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that applications to a campaign whose owner is NULL are still listed and counted."""
+        db_session.add(Campaign(
+            id=4,
+            user_id=None,
+            title="Orphaned Campaign",
+            summary="Owner account removed",
+            description="No owner",
+            budget=100.0,
+            target_views=10,
+            category="TECH",
+        ))
+        db_session.add(CampaignParticipation(
+            id=5,
+            user_id=sample_users["creator2"].id,
+            campaign_id=4,
+            reason_for_participation="Still interested",
+            is_pending=True,
+            is_approved=False,
+            terms_accepted=True,
+        ))
+        db_session.commit()
+
+        user_id = sample_users["creator2"].id
+        data = client.get(f"/my-projects/test/applications/{user_id}").json()
+        roles = {c["id"]: c["user_role"] for c in data["campaigns"]}
+        assert roles["4"] == "applicant"
+        assert data["campaigns_as_applicant"] == 3
+        counts = client.get(f"/my-projects/test/counts/{user_id}").json()
+        assert counts["as_applicant"]["total"] == 3
+        assert verify_entries(db_session) == []
+
+
+class TestMyProjectsCache:
+    """Test that cached project lists are invalidated by writes."""
+
+    def test_participation_update_invalidates_both_users(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that approving an application refreshes owner and applicant lists."""
+        brand_id = sample_users["brand"].id
+        creator_id = sample_users["creator1"].id
+
+        before_owner = client.get(f"/my-projects/test/applications/{brand_id}").json()
+        before_applicant = client.get(f"/my-projects/test/applications/{creator_id}").json()
+        assert projects_cache.stats()["size"] == 2
+
+        participation = db_session.get(CampaignParticipation, 1)
+        participation.is_pending = False
+        participation.is_approved = True
+        db_session.commit()
+
+        after_owner = client.get(f"/my-projects/test/applications/{brand_id}").json()
+        after_applicant = client.get(f"/my-projects/test/applications/{creator_id}").json()
+
+        before = {c["id"]: c["application_stats"] for c in before_owner["campaigns"]}
+        after = {c["id"]: c["application_stats"] for c in after_owner["campaigns"]}
+        assert before["1"]["pending"] == 1
+        assert after["1"]["pending"] == 0
+        assert after["1"]["approved"] == 1
+
+        status = {c["id"]: c["application_status"] for c in after_applicant["campaigns"]}
+        assert status["1"] == "approved"
+        assert before_applicant != after_applicant
+
+    def test_ownership_change_invalidates_old_and_new_owner(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that moving a campaign to another owner refreshes both owners' lists and entries."""
+        brand_id = sample_users["brand"].id
+        creator2_id = sample_users["creator2"].id
+        assert "2" in {c["id"] for c in client.get(f"/my-projects/test/applications/{brand_id}").json()["campaigns"]}
+        client.get(f"/my-projects/test/applications/{creator2_id}")
+
+        db_session.get(Campaign, 2).user_id = creator2_id
+        db_session.commit()
+
+        old_owner = client.get(f"/my-projects/test/applications/{brand_id}").json()
+        new_owner = client.get(f"/my-projects/test/applications/{creator2_id}").json()
+        assert {c["id"] for c in old_owner["campaigns"]} == {"1"}
+        assert {c["id"]: c["user_role"] for c in new_owner["campaigns"]}["2"] == "owner"
+        assert verify_entries(db_session) == []
+
+    def test_repeat_request_is_served_from_cache(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that an unchanged list is built once and then hit."""
+        user_id = sample_users["creator1"].id
+
+        first = client.get(f"/my-projects/test/applications/{user_id}").json()
+        second = client.get(f"/my-projects/test/applications/{user_id}").json()
+
+        assert first == second
+        assert projects_cache.stats()["hits"] == 1
+
+
+class TestApplicationCounters:
+    """Test the materialized per-campaign application counters."""
+
+    def test_counters_follow_participation_writes(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that creates, status changes and deletes keep counters exact."""
+        approved = db_session.get(CampaignParticipation, 1)
+        approved.is_pending = False
+        approved.is_approved = True
+        db_session.delete(db_session.get(CampaignParticipation, 3))
+        db_session.add(CampaignParticipation(
+            id=5,
+            user_id=sample_users["creator2"].id,
+            campaign_id=sample_campaigns["campaign2"].id,
+            reason_for_participation="Second try",
+            is_pending=True,
+            is_approved=False,
+            terms_accepted=True,
+        ))
+        db_session.commit()
+
+        assert verify_counters(db_session) == []
+
+        counter = db_session.get(CampaignApplicationCounter, 1)
+        assert (counter.total, counter.pending, counter.approved, counter.rejected) == (1, 0, 1, 0)
+
+    def test_rebuild_reports_and_fixes_drift(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that verify finds tampered counters and rebuild repairs them."""
+        counter = db_session.get(CampaignApplicationCounter, 2)
+        counter.approved = 7
+        db_session.commit()
+
+        drift = verify_counters(db_session)
+        assert [(d.campaign_id, d.actual) for d in drift] == [(2, (1, 0, 1, 0))]
+
+        assert rebuild_counters(db_session) == drift
+        assert verify_counters(db_session) == []
+
+    def test_refresh_overwrites_counters_in_place(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that a refresh fixes stale rows and zeroes campaigns left without applications."""
+        connection = db_session.connection()
+        connection.execute(update(CampaignApplicationCounter).values(total=9))
+        connection.execute(
+            CampaignParticipation.__table__.delete().where(CampaignParticipation.campaign_id == 2)
+        )
+        refresh_counters(connection, [1, 2, 3])
+        db_session.commit()
+
+        assert verify_counters(db_session) == []
+        counter = db_session.get(CampaignApplicationCounter, 2)
+        assert (counter.total, counter.pending, counter.approved, counter.rejected) == (0, 0, 0, 0)
+
+    @pytest.mark.parametrize("table_exists", [False, True])
+    def test_migration_backfills_counters(
+        self, db_session, sample_users, sample_campaigns, sample_participations, table_exists
+    ):
+        """Test that the migration creates (or fills the empty) counters table on an existing database."""
+        counters = CampaignApplicationCounter.__table__
+        MyProjectsMigration.__table__.drop(bind=engine)
+        if table_exists:
+            db_session.execute(counters.delete())
+            db_session.commit()
+        else:
+            counters.drop(bind=engine)
+
+        assert migrate(engine) == ["0001_application_counters", "0002_user_project_entries"]
+        assert verify_counters(db_session) == []
+        assert db_session.get(CampaignApplicationCounter, 1).total == 2
+        assert migrate(engine) == []
+
+    def test_startup_applies_migrations(
+        self, db_session, sample_users, sample_campaigns, sample_participations, monkeypatch
+    ):
+        """Test that starting the app backfills the counters and entries."""
+        monkeypatch.setattr(core.database, "engine", engine)
+        db_session.execute(CampaignApplicationCounter.__table__.delete())
+        db_session.execute(UserProjectEntry.__table__.delete())
+        db_session.commit()
+
+        with TestClient(app):
+            pass
+
+        assert db_session.get(MyProjectsMigration, "0001_application_counters") is not None
+        assert db_session.get(MyProjectsMigration, "0002_user_project_entries") is not None
+        assert verify_counters(db_session) == []
+        assert verify_entries(db_session) == []
+        assert db_session.get(CampaignApplicationCounter, 1).total == 2
+
+
+class TestProjectEntries:
+    """Test the user_project_entries read model behind the list."""
+
+    @staticmethod
+    def _titles(user_id):
+        response = client.get(f"/my-projects/test/applications/{user_id}")
+        assert response.status_code == 200
+        return {c["id"]: (c["user_role"], c["title"]) for c in response.json()["campaigns"]}
+
+    def test_entries_follow_campaign_and_participation_writes(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that edits, status changes, moves and deletes keep every entry exact."""
+        assert verify_entries(db_session) == []
+
+        db_session.get(Campaign, 1).title = "Renamed Launch"
+        approved = db_session.get(CampaignParticipation, 1)
+        approved.is_pending = False
+        approved.is_approved = True
+        db_session.get(CampaignParticipation, 4).campaign_id = 2
+        db_session.commit()
+        assert verify_entries(db_session) == []
+
+        creator1 = self._titles(sample_users["creator1"].id)
+        assert creator1["1"] == ("applicant", "Renamed Launch")
+        assert "3" in creator1
+        assert self._titles(sample_users["creator2"].id) == {
+            "1": ("applicant", "Renamed Launch"),
+            "2": ("applicant", "Software Launch Campaign"),
+        }
+
+        db_session.delete(db_session.get(CampaignParticipation, 3))
+        db_session.delete(db_session.get(CampaignParticipation, 4))
+        db_session.commit()
+        assert verify_entries(db_session) == []
+        assert self._titles(sample_users["creator2"].id) == {}
+
+    @pytest.mark.parametrize("table_exists", [False, True])
+    def test_migration_backfills_entries(
+        self, db_session, sample_users, sample_campaigns, sample_participations, table_exists
+    ):
+        """Test that the migration creates (or fills the empty) entries table on an existing database."""
+        before = {user: self._titles(sample_users[user].id) for user in sample_users}
+        entries = UserProjectEntry.__table__
+        MyProjectsMigration.__table__.drop(bind=engine)
+        if table_exists:
+            db_session.execute(entries.delete())
+            db_session.commit()
+            projects_cache.clear()
+            assert self._titles(sample_users["brand"].id) == {}
+        else:
+            entries.drop(bind=engine)
+
+        assert migrate(engine) == ["0001_application_counters", "0002_user_project_entries"]
+        assert verify_entries(db_session) == []
+        projects_cache.clear()
+        assert {user: self._titles(sample_users[user].id) for user in sample_users} == before
+        assert migrate(engine) == []
+
+    def test_owner_entry_carries_current_stats(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that an application updates the stats on the owner's entry."""
+        db_session.add(CampaignParticipation(
+            id=5,
+            user_id=sample_users["creator2"].id,
+            campaign_id=2,
+            reason_for_participation="Another one",
+            is_pending=True,
+            is_approved=False,
+            terms_accepted=True,
+        ))
+        db_session.commit()
+
+        entry = db_session.query(UserProjectEntry).filter(
+            UserProjectEntry.user_id == sample_users["brand"].id, UserProjectEntry.campaign_id == 2
+        ).one()
+        assert (entry.user_role, entry.stats_total, entry.stats_pending) == ("owner", 2, 1)
+        assert verify_entries(db_session) == []
+
+    def test_deleted_campaign_removes_entries(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that deleting a campaign drops the entries of owner and applicants."""
+        for participation in db_session.query(CampaignParticipation).filter_by(campaign_id=3):
+            db_session.delete(participation)
+        db_session.delete(db_session.get(Campaign, 3))
+        db_session.commit()
+
+        assert db_session.query(UserProjectEntry).filter_by(campaign_id=3).count() == 0
+        assert verify_entries(db_session) == []
+
+    def test_rebuild_reports_and_fixes_drift(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that writes the session never sees are found and repaired."""
+        db_session.connection().execute(
+            update(Campaign.__table__).where(Campaign.id == 2).values(title="Bulk edit")
+        )
+        db_session.commit()
+
+        drift = verify_entries(db_session)
+        assert {(d.user_id, d.campaign_id) for d in drift} == {
+            (sample_users["brand"].id, 2), (sample_users["creator1"].id, 2),
+        }
+
+        assert rebuild_entries(db_session) == drift
+        assert verify_entries(db_session) == []
+        assert self._titles(sample_users["creator1"].id)["2"] == ("applicant", "Bulk edit")
+
+    def test_campaign_edits_update_entries_in_place(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that campaign edits update entries without deleting and re-inserting them."""
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if "user_project_entries" in statement:
+                statements.append(statement.split()[0].upper())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            db_session.get(Campaign, 1).title = "Renamed Launch"
+            db_session.get(Campaign, 1).budget = 6000.0
+            db_session.commit()
+            assert statements == ["UPDATE"]
+
+            statements.clear()
+            db_session.get(Campaign, 2).updated_at = datetime.utcnow()
+            db_session.commit()
+            assert statements == []
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert verify_entries(db_session) == []
+        assert self._titles(sample_users["creator2"].id)["1"] == ("applicant", "Renamed Launch")
+
+    def test_bulk_writes_through_the_session_are_tracked(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that ORM bulk and Core UPDATE/DELETE statements keep counters, entries and caches exact."""
+        creator1 = sample_users["creator1"].id
+        assert self._titles(creator1)["2"] == ("applicant", "Software Launch Campaign")
+
+        db_session.execute(update(Campaign).where(Campaign.id == 2).values(title="Bulk edit"))
+        db_session.execute(update(Campaign), [{"id": 1, "title": "By primary key"}])
+        db_session.execute(
+            update(CampaignParticipation).where(CampaignParticipation.id == 1)
+            .values(is_pending=False, is_approved=True)
+        )
+        db_session.execute(CampaignParticipation.__table__.delete().where(CampaignParticipation.id.in_([3, 4])))
+        db_session.execute(Campaign.__table__.delete().where(Campaign.id == 3))
+        db_session.commit()
+
+        assert verify_entries(db_session) == []
+        assert verify_counters(db_session) == []
+        # Cached lists of the affected users were invalidated
+        assert self._titles(creator1) == {
+            "1": ("applicant", "By primary key"),
+            "2": ("applicant", "Bulk edit"),
+        }
+        assert self._titles(sample_users["creator2"].id) == {}
+
+    def test_list_is_one_index_range(self, db_session, sample_users):
+        """Test that a filtered list page is read in index order from the read model."""
+        statement = service_module._entries_statement(
+            "brand_user_001", after=(datetime.utcnow(), 10), limit=20,
+            filters=ProjectFilters(status="active"),
+        ).compile(engine)
+        parameters = tuple(statement.params[name] for name in statement.positiontup)
+        with engine.connect() as connection:
+            plan = [row.detail for row in connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )]
+
+        assert len(plan) == 1
+        assert "ix_user_project_entries_user_id_created_at" in plan[0]
+
+
+class TestMyProjectsETag:
+    """Test conditional GET support on the my-projects endpoints."""
+
+    def test_unchanged_list_returns_304(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that a matching If-None-Match yields 304 without a body."""
+        url = f"/my-projects/test/applications/{sample_users['creator1'].id}"
+        first = client.get(url)
+        etag = first.headers["ETag"]
+
+        second = client.get(url, headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+
+    def test_status_change_changes_list_etag(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that rejecting an application produces a new ETag."""
+        url = f"/my-projects/test/applications/{sample_users['brand'].id}"
+        etag = client.get(url).headers["ETag"]
+
+        participation = db_session.get(CampaignParticipation, 1)
+        participation.is_pending = False
+        participation.rejection_reason = "Campaign is full"
+        db_session.commit()
+
+        response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_view_and_page_have_distinct_etags(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that each representation of the list has its own ETag."""
+        url = f"/my-projects/test/applications/{sample_users['creator1'].id}"
+        full = client.get(url).headers["ETag"]
+        card = client.get(url, params={"view": "card"}).headers["ETag"]
+        page = client.get(url, params={"limit": 1}).headers["ETag"]
+
+        assert len({full, card, page}) == 3
+
+    def test_unchanged_click_view_returns_304(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test conditional GET on the campaign click view."""
+        user_id = sample_users["brand"].id
+        url = f"/my-projects/test/applications/{user_id}/campaign/1"
+        etag = client.get(url).headers["ETag"]
+
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+        db_session.add(CampaignParticipation(
+            id=5,
+            user_id=sample_users["creator1"].id,
+            campaign_id=1,
+            reason_for_participation="Applying again",
+            is_pending=True,
+            is_approved=False,
+            terms_accepted=True,
+        ))
+        db_session.commit()
+
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+
+    def test_wildcard_etag_does_not_hide_missing_or_forbidden(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that If-None-Match: * gets 404/403 where the resource is missing or not the user's."""
+        wildcard = {"If-None-Match": "*"}
+        creator2 = sample_users["creator2"].id
+
+        assert client.get("/my-projects/test/applications/missing_user", headers=wildcard).status_code == 404
+        assert client.get(
+            f"/my-projects/test/applications/{creator2}/campaign/99", headers=wildcard
+        ).status_code == 404
+        assert client.get(
+            f"/my-projects/test/applications/{creator2}/campaign/2", headers=wildcard
+        ).status_code == 403
+
+        # A campaign the user can see still matches
+        assert client.get(
+            f"/my-projects/test/applications/{creator2}/campaign/1", headers=wildcard
+        ).status_code == 304
+
+
+class TestMyProjectsPagination:
+    """Test cursor pagination of the unified my-projects list."""
+
+    def test_pages_cover_full_list_in_order(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that walking pages yields the same campaigns as the full list."""
+        user_id = sample_users["creator1"].id
+        full = client.get(f"/my-projects/test/applications/{user_id}").json()
+        assert full["next_cursor"] is None
+
+        page1 = client.get(f"/my-projects/test/applications/{user_id}?limit=2").json()
+        assert len(page1["campaigns"]) == 2
+        assert page1["total_campaigns"] == 3
+        assert page1["campaigns_as_owner"] == 1
+        assert page1["campaigns_as_applicant"] == 2
+        assert page1["next_cursor"] is not None
+
+        page2 = client.get(
+            f"/my-projects/test/applications/{user_id}",
+            params={"limit": 2, "cursor": page1["next_cursor"]},
+        ).json()
+        assert len(page2["campaigns"]) == 1
+        assert page2["total_campaigns"] == 3
+        assert page2["next_cursor"] is None
+
+        paged_ids = [c["id"] for c in page1["campaigns"] + page2["campaigns"]]
+        assert paged_ids == [c["id"] for c in full["campaigns"]]
+
+    def test_applicant_pages_for_owner(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that the owner click view pages through applicants with a total."""
+        user_id = sample_users["brand"].id
+        campaign_id = sample_campaigns["campaign1"].id
+        url = f"/my-projects/test/applications/{user_id}/campaign/{campaign_id}"
+
+        full = client.get(url).json()
+        assert full["total_applicants"] == 2
+        assert full["next_cursor"] is None
+
+        page1 = client.get(url, params={"limit": 1}).json()
+        assert len(page1["applicants"]) == 1
+        assert page1["total_applicants"] == 2
+        assert page1["next_cursor"] is not None
+
+        page2 = client.get(url, params={"limit": 1, "cursor": page1["next_cursor"]}).json()
+        assert len(page2["applicants"]) == 1
+        assert page2["next_cursor"] is None
+
+        paged_ids = [a["participation_id"] for a in page1["applicants"] + page2["applicants"]]
+        assert paged_ids == [a["participation_id"] for a in full["applicants"]]
+
+    @staticmethod
+    def _walk_pages(url, key, limit=1):
+        """Follow next_cursor from the first page to the last; returns every item"""
+        items, params = [], {"limit": limit}
+        for _ in range(20):
+            page = client.get(url, params=params)
+            assert page.status_code == 200
+            items += page.json()[key]
+            if page.json()["next_cursor"] is None:
+                return items
+            params["cursor"] = page.json()["next_cursor"]
+        raise AssertionError("pagination did not end")
+
+    def test_duplicate_applications_are_paged_once_each(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that two entries for the same campaign (applied twice) both get their own page."""
+        user_id = sample_users["creator2"].id
+        db_session.add(CampaignParticipation(
+            id=5,
+            user_id=user_id,
+            campaign_id=sample_campaigns["campaign3"].id,
+            reason_for_participation="Applying again",
+            is_pending=True,
+            is_approved=False,
+            terms_accepted=True,
+        ))
+        db_session.commit()
+        url = f"/my-projects/test/applications/{user_id}"
+
+        full = client.get(url).json()["campaigns"]
+        paged = self._walk_pages(url, "campaigns")
+
+        assert [c["id"] for c in full] == ["3", "3", "1"]
+        assert paged == full
+
+    def test_null_sort_keys_are_paged_last(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that rows without applied_at are paged after the others and their cursor round-trips."""
+        db_session.get(CampaignParticipation, 1).applied_at = None
+        db_session.commit()
+
+        cursor = service_module._encode_cursor(None, 3, 7)
+        assert service_module._decode_cursor(cursor) == (None, 3, 7)
+
+        # Serializing such a row fails validation (see TestMyProjectsFastSerialization),
+        # so walk the pages at the statement level
+        ids, after = [], None
+        for _ in range(5):
+            rows = db_session.execute(service_module._applicants_statement("1", after, 1)).all()
+            ids.append(rows[0][0].id)
+            if len(rows) == 1:
+                break
+            after = (rows[0][0].applied_at, rows[0][0].id)
+        assert ids == [3, 1]
+
+    def test_invalid_cursor_returns_400(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that a malformed cursor is rejected."""
+        user_id = sample_users["creator1"].id
+        response = client.get(
+            f"/my-projects/test/applications/{user_id}",
+            params={"limit": 2, "cursor": "not-a-cursor"},
+        )
+
+        assert response.status_code == 400
+
+
+class TestMyProjectsStreaming:
+    """Test the NDJSON streaming mode of the unified my-projects list."""
+
+    def test_ndjson_lines_match_full_list(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that each line is one campaign, in the same order as the JSON list."""
+        user_id = sample_users["creator1"].id
+        full = client.get(f"/my-projects/test/applications/{user_id}").json()
+
+        response = client.get(
+            f"/my-projects/test/applications/{user_id}",
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == full["campaigns"]
+
+    def test_ndjson_card_view_and_empty_list(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test the card view streams without descriptions and an empty list streams nothing."""
+        headers = {"Accept": "application/x-ndjson"}
+        response = client.get(
+            f"/my-projects/test/applications/{sample_users['brand'].id}?view=card", headers=headers
+        )
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 2
+        assert all("description" not in line for line in lines)
+
+        db_session.add(User(id="lonely", username="lonely", email="l@test.com", hashed_password="x"))
+        db_session.commit()
+        response = client.get("/my-projects/test/applications/lonely", headers=headers)
+        assert response.status_code == 200
+        assert response.text == ""
+
+    def test_ndjson_errors(self, db_session, sample_users):
+        """Test that unknown users get 404 and pagination is rejected before streaming."""
+        headers = {"Accept": "application/x-ndjson"}
+        assert client.get("/my-projects/test/applications/nobody", headers=headers).status_code == 404
+        response = client.get(
+            f"/my-projects/test/applications/{sample_users['brand'].id}?limit=1", headers=headers
+        )
+        assert response.status_code == 400
+
+
+class TestMyProjectsBatchClick:
+    """Test the batch click endpoint."""
+
+    def test_batch_matches_single_click_views(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that each item equals the single endpoint's status and body, in request order."""
+        user_id = sample_users["creator1"].id
+        campaign_ids = ["2", "1", "999", "3", "abc"]
+
+        response = client.post(
+            f"/my-projects/test/applications/{user_id}/batch",
+            json={"campaign_ids": campaign_ids},
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [item["campaign_id"] for item in results] == campaign_ids
+        for item in results:
+            single = client.get(f"/my-projects/test/applications/{user_id}/campaign/{item['campaign_id']}")
+            assert item["status_code"] == single.status_code
+            if single.status_code == 200:
+                assert item["data"] == single.json()
+                assert item["detail"] is None
+            else:
+                assert item["data"] is None
+                assert item["detail"]
+
+    def test_batch_uses_fixed_number_of_queries(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that the query count does not grow with the number of ids."""
+        response = client.post(
+            f"/my-projects/test/applications/{sample_users['brand'].id}/batch",
+            json={"campaign_ids": ["1", "2", "3"]},
+        )
+
+        assert response.status_code == 200
+        assert [item["status_code"] for item in response.json()["results"]] == [200, 200, 403]
+        assert_max_queries(response, 4)
+
+    def test_batch_rejects_empty_and_oversized_requests(self, db_session, sample_users):
+        """Test request validation of the id list."""
+        url = f"/my-projects/test/applications/{sample_users['brand'].id}/batch"
+        assert client.post(url, json={"campaign_ids": []}).status_code == 422
+        assert client.post(url, json={"campaign_ids": ["1"] * 51}).status_code == 422
+
+
+class TestMyProjectsFilters:
+    """Test server-side filtering of the unified my-projects list."""
+
+    def test_role_applicant_skips_owned_campaigns_and_stats(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that role=applicant never reads owned campaigns or their counters, list or ETag."""
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        user_id = sample_users["creator1"].id
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            data = client.get(f"/my-projects/test/applications/{user_id}?role=applicant").json()
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert {c["id"] for c in data["campaigns"]} == {"1", "2"}
+        assert data["campaigns_as_owner"] == 0
+        assert data["campaigns_as_applicant"] == 2
+        list_statements = [s for s in statements if "UNION" in s or "user_role" in s]
+        assert list_statements
+        version_statements = [s for s in statements if "EXISTS" in s]
+        assert len(version_statements) == 1
+        assert "campaign_participations.user_id = ?" in version_statements[0]
+        assert all("campaign_application_counters" not in s for s in statements)
+        assert all("count(campaigns.id)" not in s for s in version_statements)
+
+    def test_application_status_and_category_filters(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test status filters on the applicant rows and category on both roles."""
+        url = f"/my-projects/test/applications/{sample_users['creator1'].id}"
+
+        approved = client.get(url, params={"application_status": "approved"}).json()
+        assert [c["id"] for c in approved["campaigns"]] == ["2"]
+        assert approved["total_campaigns"] == 1
+
+        lifestyle = client.get(url, params={"category": "LIFESTYLE"}).json()
+        assert [c["id"] for c in lifestyle["campaigns"]] == ["3"]
+        assert lifestyle["campaigns_as_owner"] == 1
+        assert lifestyle["campaigns_as_applicant"] == 0
+
+        assert client.get(url, params={"role": "owner", "application_status": "pending"}).json()[
+            "total_campaigns"
+        ] == 0
+
+    def test_filtered_pages_report_filtered_counts(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that paginated counts come from the filtered list."""
+        campaign = db_session.query(Campaign).filter(Campaign.id == 2).one()
+        campaign.is_active = False
+        db_session.commit()
+
+        url = f"/my-projects/test/applications/{sample_users['creator1'].id}"
+        page = client.get(url, params={"status": "active", "limit": 1}).json()
+
+        assert len(page["campaigns"]) == 1
+        assert page["total_campaigns"] == 2
+        assert page["campaigns_as_owner"] == 1
+        assert page["campaigns_as_applicant"] == 1
+        assert page["next_cursor"] is not None
+
+    def test_filters_change_the_etag(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that a filtered list is a separate representation."""
+        url = f"/my-projects/test/applications/{sample_users['creator1'].id}"
+        etag = client.get(url).headers["ETag"]
+        response = client.get(url, params={"role": "owner"}, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["total_campaigns"] == 1
+
+
+class TestMyProjectsQueryBudget:
+    """Test per-request SQL instrumentation and query budgets of each endpoint."""
+
+    def test_server_timing_header_reports_queries(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that responses carry db/app timings and the query count."""
+        response = client.get(f"/my-projects/test/applications/{sample_users['creator1'].id}")
+
+        timing = response.headers["Server-Timing"]
+        assert timing.startswith("db;dur=")
+        assert "db-slowest;dur=" in timing
+        assert "app;dur=" in timing
+        # ETag version + UNION list
+        assert query_count(response) == 2
+
+    def test_error_responses_report_queries(
+        self, db_session, sample_users, sample_campaigns, sample_participations, caplog
+    ):
+        """Test that HTTPException responses keep the Server-Timing header and the stats log record."""
+        url = f"/my-projects/test/applications/{sample_users['creator2'].id}/campaign/2"
+        with caplog.at_level(logging.INFO, logger="src.campaign.my_projects.instrumentation"):
+            response = client.get(url)
+
+        assert response.status_code == 403
+        assert response.json()["detail"].endswith("has no relationship with campaign 2")
+        assert query_count(response) >= 1
+        records = [r for r in caplog.records if getattr(r, "route", None) is not None]
+        assert [(r.status_code, r.db_queries) for r in records] == [(403, query_count(response))]
+
+    def test_endpoint_query_budgets(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test upper bounds on queries per endpoint."""
+        brand = sample_users["brand"].id
+        creator = sample_users["creator1"].id
+
+        assert_max_queries(client.get(f"/my-projects/test/applications/{brand}"), 2)
+        assert_max_queries(client.get(f"/my-projects/test/applications/{brand}?limit=1"), 3)
+        assert_max_queries(client.get(f"/my-projects/test/applications/{brand}/campaign/1"), 5)
+        assert_max_queries(client.get(f"/my-projects/test/applications/{creator}/campaign/1"), 4)
+
+    def test_budget_violation_fails(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that the helper fails when an endpoint exceeds its budget."""
+        response = client.get(f"/my-projects/test/applications/{sample_users['brand'].id}/campaign/1")
+        with pytest.raises(AssertionError, match="expected at most 1"):
+            assert_max_queries(response, 1)
+
+    def test_track_queries_counts_service_calls(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test counting queries of a direct service call."""
+        user_id = sample_users["creator1"].id
+        with TestingSessionLocal() as db, track_queries() as stats:
+            my_projects_service.get_campaign_click_data(db, user_id, "1")
+
+        assert stats.count == 3
+        assert stats.db_time >= stats.slowest_time > 0
+        assert stats.slowest_statement.lower().startswith("select")
+
+
+class TestMyProjectsMetrics:
+    """Test the metrics exposition endpoint."""
+
+    def test_metrics_endpoint_is_off_by_default(self):
+        """Test that the unauthenticated endpoint is hidden unless enabled."""
+        assert router_module.ENABLE_METRICS_ENDPOINT is False
+        assert client.get("/my-projects/metrics").status_code == 404
+
+    def test_metrics_are_labelled_by_route_and_role(
+        self, db_session, sample_users, sample_campaigns, sample_participations, monkeypatch
+    ):
+        """Test that requests and service calls show up with route and user_role labels."""
+        monkeypatch.setattr(router_module, "ENABLE_METRICS_ENDPOINT", True)
+        metrics_registry.clear()
+        brand = sample_users["brand"].id
+        creator = sample_users["creator1"].id
+        client.get(f"/my-projects/test/applications/{brand}")
+        client.get(f"/my-projects/test/applications/{creator}/campaign/1")
+        client.get(f"/my-projects/test/applications/{brand}/campaign/999")
+
+        response = client.get("/my-projects/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        text = response.text
+        assert (
+            'my_projects_request_duration_seconds_count{route="/my-projects/test/applications/{user_id}",'
+            'method="GET",status_code="200",user_role="owner"} 1'
+        ) in text
+        assert (
+            'route="/my-projects/test/applications/{user_id}/campaign/{campaign_id}",'
+            'method="GET",status_code="200",user_role="applicant"} 1'
+        ) in text
+        assert 'status_code="404",user_role="none"} 1' in text
+        assert 'my_projects_service_duration_seconds_count{method="get_user_projects",user_role="owner"} 1' in text
+        assert 'my_projects_service_duration_seconds_count{method="_get_application_details",user_role="applicant"} 1' in text
+        assert 'my_projects_result_count_sum{method="get_user_projects",user_role="owner"} 2' in text
+        assert 'my_projects_response_size_bytes_count{route="/my-projects/test/applications/{user_id}",user_role="owner"} 1' in text
+
+
+# Bodies the endpoints rendered before this series, captured from the
+# original implementation for the pinned_timestamps data. Keys added
+# since (_ADDED_KEYS) are removed from responses before comparing.
+_PRE_SERIES_BODIES = {
+    'list/brand': (
+        '{"user_id":"brand_user_001","total_campaigns":3,"campaigns_as_owner":3,'
+        '"campaigns_as_applicant":0,"campaigns":[{"id":"4","title":"Café ☕ — “launch” 🚀",'
+        '"summary":"Quotes \\" and \\\\ backslashes","description":"Línea 1\\nLínea 2 \u2028 end",'
+        '"budget":1234.5,"target_views":7,"poster_url":null,"category":"FOOD",'
+        '"status":"inactive","created_at":"2024-01-04T12:30:45.123456",'
+        '"user_role":"owner","application_stats":{"total":1,"pending":0,"approved":1,'
+        '"rejected":0},"application_status":null,"applied_at":null,"approved_at":null,'
+        '"review_message":null,"rejection_reason":null},{"id":"2",'
+        '"title":"Software Launch Campaign","summary":"Launch our new software",'
+        '"description":"Another campaign description","budget":3000.0,'
+        '"target_views":5000,"poster_url":null,"category":"SOFTWARE","status":"active",'
+        '"created_at":"2024-01-02T09:30:00","user_role":"owner",'
+        '"application_stats":{"total":1,"pending":0,"approved":1,"rejected":0},'
+        '"application_status":null,"applied_at":null,"approved_at":null,'
+        '"review_message":null,"rejection_reason":null},{"id":"1",'
+        '"title":"Tech Product Launch","summary":"Promote our new tech gadget",'
+        '"description":"Full campaign description here","budget":5000.0,'
+        '"target_views":10000,"poster_url":null,"category":"TECH","status":"active",'
+        '"created_at":"2024-01-01T09:30:00","user_role":"owner",'
+        '"application_stats":{"total":2,"pending":1,"approved":0,"rejected":1},'
+        '"application_status":null,"applied_at":null,"approved_at":null,'
+        '"review_message":null,"rejection_reason":null}],'
+        '"message":"Found 3 campaigns for user brand_user_001"}'
+    ),
+    'list/creator1': (
+        '{"user_id":"creator_user_001","total_campaigns":3,"campaigns_as_owner":1,'
+        '"campaigns_as_applicant":2,"campaigns":[{"id":"3",'
+        '"title":"Creator\'s Own Campaign","summary":"Creator is the brand here",'
+        '"description":"Creator-owned campaign","budget":1000.0,"target_views":2000,'
+        '"poster_url":null,"category":"LIFESTYLE","status":"active",'
+        '"created_at":"2024-01-03T09:30:00","user_role":"owner",'
+        '"application_stats":{"total":1,"pending":1,"approved":0,"rejected":0},'
+        '"application_status":null,"applied_at":null,"approved_at":null,'
+        '"review_message":null,"rejection_reason":null},{"id":"2",'
+        '"title":"Software Launch Campaign","summary":"Launch our new software",'
+        '"description":"Another campaign description","budget":3000.0,'
+        '"target_views":5000,"poster_url":null,"category":"SOFTWARE","status":"active",'
+        '"created_at":"2024-01-02T09:30:00","user_role":"applicant",'
+        '"application_stats":null,"application_status":"approved",'
+        '"applied_at":"2024-02-02T08:00:00","approved_at":"2024-03-02T18:15:00",'
+        '"review_message":"Welcome to the team!","rejection_reason":null},{"id":"1",'
+        '"title":"Tech Product Launch","summary":"Promote our new tech gadget",'
+        '"description":"Full campaign description here","budget":5000.0,'
+        '"target_views":10000,"poster_url":null,"category":"TECH","status":"active",'
+        '"created_at":"2024-01-01T09:30:00","user_role":"applicant",'
+        '"application_stats":null,"application_status":"pending",'
+        '"applied_at":"2024-02-01T08:00:00","approved_at":null,"review_message":null,'
+        '"rejection_reason":null}],'
+        '"message":"Found 3 campaigns for user creator_user_001"}'
+    ),
+    'list/creator2': (
+        '{"user_id":"creator_user_002","total_campaigns":3,"campaigns_as_owner":0,'
+        '"campaigns_as_applicant":3,"campaigns":[{"id":"4","title":"Café ☕ — “launch” 🚀",'
+        '"summary":"Quotes \\" and \\\\ backslashes","description":"Línea 1\\nLínea 2 \u2028 end",'
+        '"budget":1234.5,"target_views":7,"poster_url":null,"category":"FOOD",'
+        '"status":"inactive","created_at":"2024-01-04T12:30:45.123456",'
+        '"user_role":"applicant","application_stats":null,'
+        '"application_status":"approved","applied_at":"2024-02-05T08:00:00",'
+        '"approved_at":"2024-03-05T18:15:00","review_message":"¡Bienvenido!",'
+        '"rejection_reason":null},{"id":"3","title":"Creator\'s Own Campaign",'
+        '"summary":"Creator is the brand here","description":"Creator-owned campaign",'
+        '"budget":1000.0,"target_views":2000,"poster_url":null,"category":"LIFESTYLE",'
+        '"status":"active","created_at":"2024-01-03T09:30:00","user_role":"applicant",'
+        '"application_stats":null,"application_status":"pending",'
+        '"applied_at":"2024-02-04T08:00:00","approved_at":null,"review_message":null,'
+        '"rejection_reason":null},{"id":"1","title":"Tech Product Launch",'
+        '"summary":"Promote our new tech gadget",'
+        '"description":"Full campaign description here","budget":5000.0,'
+        '"target_views":10000,"poster_url":null,"category":"TECH","status":"active",'
+        '"created_at":"2024-01-01T09:30:00","user_role":"applicant",'
+        '"application_stats":null,"application_status":"rejected",'
+        '"applied_at":"2024-02-03T08:00:00","approved_at":null,"review_message":null,'
+        '"rejection_reason":"Not enough followers"}],'
+        '"message":"Found 3 campaigns for user creator_user_002"}'
+    ),
+    'click/brand/1': (
+        '{"campaign_id":"1","campaign_title":"Tech Product Launch","user_role":"owner",'
+        '"applicants":[{"user_id":"creator_user_002","username":"creator_jane",'
+        '"email":"jane@test.com","profile_image_url":null,"rating":0.0,"user_level":1,'
+        '"is_verified":true,"participation_id":"3","status":"rejected",'
+        '"applied_at":"2024-02-03T08:00:00","approved_at":null,'
+        '"reason_for_participation":"Tech enthusiast here","review_message":null,'
+        '"rejection_reason":"Not enough followers"},{"user_id":"creator_user_001",'
+        '"username":"creator_john","email":"creator@test.com","profile_image_url":null,'
+        '"rating":0.0,"user_level":1,"is_verified":true,"participation_id":"1",'
+        '"status":"pending","applied_at":"2024-02-01T08:00:00","approved_at":null,'
+        '"reason_for_participation":"I love tech content!","review_message":null,'
+        '"rejection_reason":null}],"application_details":null}'
+    ),
+    'click/brand/4': (
+        '{"campaign_id":"4","campaign_title":"Café ☕ — “launch” 🚀","user_role":"owner",'
+        '"applicants":[{"user_id":"creator_user_002","username":"creator_jane",'
+        '"email":"jane@test.com","profile_image_url":null,"rating":0.0,"user_level":1,'
+        '"is_verified":true,"participation_id":"5","status":"approved",'
+        '"applied_at":"2024-02-05T08:00:00","approved_at":"2024-03-05T18:15:00",'
+        '"reason_for_participation":"Ünïcödé reason","review_message":"¡Bienvenido!",'
+        '"rejection_reason":null}],"application_details":null}'
+    ),
+    'click/creator1/1': (
+        '{"campaign_id":"1","campaign_title":"Tech Product Launch",'
+        '"user_role":"applicant","applicants":null,'
+        '"application_details":{"participation_id":"1","status":"pending",'
+        '"applied_at":"2024-02-01T08:00:00","approved_at":null,'
+        '"reason_for_participation":"I love tech content!","review_message":null,'
+        '"rejection_reason":null,"campaign_owner_id":"brand_user_001",'
+        '"campaign_owner_username":"techbrand"}}'
+    ),
+    'click/creator1/2': (
+        '{"campaign_id":"2","campaign_title":"Software Launch Campaign",'
+        '"user_role":"applicant","applicants":null,'
+        '"application_details":{"participation_id":"2","status":"approved",'
+        '"applied_at":"2024-02-02T08:00:00","approved_at":"2024-03-02T18:15:00",'
+        '"reason_for_participation":"Software is my passion",'
+        '"review_message":"Welcome to the team!","rejection_reason":null,'
+        '"campaign_owner_id":"brand_user_001","campaign_owner_username":"techbrand"}}'
+    ),
+    'click/creator2/4': (
+        '{"campaign_id":"4","campaign_title":"Café ☕ — “launch” 🚀",'
+        '"user_role":"applicant","applicants":null,'
+        '"application_details":{"participation_id":"5","status":"approved",'
+        '"applied_at":"2024-02-05T08:00:00","approved_at":"2024-03-05T18:15:00",'
+        '"reason_for_participation":"Ünïcödé reason","review_message":"¡Bienvenido!",'
+        '"rejection_reason":null,"campaign_owner_id":"brand_user_001",'
+        '"campaign_owner_username":"techbrand"}}'
+    ),
+}
+
+# Top-level keys added to the list and click responses since (paging cursors, applicant totals)
+_ADDED_KEYS = ("next_cursor", "total_applicants")
+
+
+class TestMyProjectsFastSerialization:
+    """Pre-encoded responses are byte-for-byte what the response_model path renders, and what it rendered before."""
+
+    @staticmethod
+    def _reference_bodies(result):
+        """
+        Bodies for a fully validated copy of `result`: rendered through a
+        route with response_model (FastAPI's default path) and through the
+        stdlib JSONResponse encoder.
+        """
+        model = type(result)
+        validated = model.model_validate(result.model_dump())
+        reference = FastAPI()
+
+        @reference.get("/", response_model=model)
+        def render():
+            return validated
+
+        rendered = TestClient(reference).get("/").content
+        return rendered, JSONResponse(jsonable_encoder(validated)).body
+
+    @pytest.fixture
+    def unicode_campaign(self, db_session, sample_users, sample_participations):
+        """A campaign with non-ASCII text, no poster and an applicant without rating."""
+        db_session.add(Campaign(
+            id=4,
+            user_id=sample_users["brand"].id,
+            title="Café ☕ — “launch” 🚀",
+            summary='Quotes " and \\ backslashes',
+            description="Línea 1\nLínea 2 \u2028 end",
+            budget=1234.5,
+            target_views=7,
+            category="FOOD",
+            is_active=False,
+        ))
+        db_session.add(CampaignParticipation(
+            id=5,
+            user_id=sample_users["creator2"].id,
+            campaign_id=4,
+            reason_for_participation="Ünïcödé reason",
+            is_pending=False,
+            is_approved=True,
+            terms_accepted=True,
+            review_message="¡Bienvenido!",
+        ))
+        db_session.commit()
+
+    @pytest.fixture
+    def pinned_timestamps(self, db_session, unicode_campaign):
+        """Fixed timestamps on every campaign and application, so bodies can be pinned."""
+        for campaign_id, day in ((1, 1), (2, 2), (3, 3), (4, 4)):
+            db_session.get(Campaign, campaign_id).created_at = datetime(2024, 1, day, 9, 30)
+        db_session.get(Campaign, 4).created_at = datetime(2024, 1, 4, 12, 30, 45, 123456)
+        for participation_id in range(1, 6):
+            participation = db_session.get(CampaignParticipation, participation_id)
+            participation.applied_at = datetime(2024, 2, participation_id, 8, 0)
+            participation.approved_at = (
+                datetime(2024, 3, participation_id, 18, 15) if participation.is_approved else None
+            )
+        db_session.commit()
+
+    @pytest.mark.parametrize("key", sorted(_PRE_SERIES_BODIES))
+    def test_bodies_unchanged(self, db_session, sample_users, pinned_timestamps, key):
+        """Test that list and click bodies are the pre-series bytes plus only the added keys."""
+        users = {name: user.id for name, user in sample_users.items()}
+        kind, user, *campaign_id = key.split("/")
+        url = f"/my-projects/test/applications/{users[user]}"
+        if kind == "click":
+            url += f"/campaign/{campaign_id[0]}"
+        response = client.get(url)
+        assert response.status_code == 200
+
+        def encode(data):
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+        data = json.loads(response.content)
+        # Same encoding as before (separators, escapes, number and date formats) ...
+        assert response.content.decode() == encode(data)
+        # ... and, apart from the added keys, the same keys, order and values
+        for added in _ADDED_KEYS:
+            data.pop(added, None)
+        assert encode(data) == _PRE_SERIES_BODIES[key]
+
+    @pytest.mark.parametrize("params", [{}, {"view": "card"}, {"limit": 1}, {"role": "owner"}])
+    def test_list_bytes_match_validated_rendering(self, db_session, sample_users, unicode_campaign, params):
+        """Test that the list endpoint renders the bytes of a validated response for each variant."""
+        for user in ("brand", "creator1", "creator2"):
+            user_id = sample_users[user].id
+            response = client.get(f"/my-projects/test/applications/{user_id}", params=params)
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/json"
+            assert "ETag" in response.headers
+
+            limit = params.get("limit")
+            view = params.get("view", "full")
+            filters = ProjectFilters(role=params.get("role"))
+            expected = my_projects_service.get_user_projects(
+                db_session, user_id, limit=limit, view=view, filters=filters
+            )
+            rendered, stdlib = self._reference_bodies(expected)
+            assert response.content == rendered == stdlib
+
+    @pytest.mark.parametrize("user,campaign_id", [
+        ("brand", "1"), ("brand", "4"), ("creator1", "1"), ("creator1", "2"), ("creator2", "4"),
+    ])
+    def test_click_bytes_match_validated_rendering(self, db_session, sample_users, unicode_campaign, user, campaign_id):
+        """Test that owner and applicant click views render the bytes of a validated response."""
+        user_id = sample_users[user].id
+        response = client.get(f"/my-projects/test/applications/{user_id}/campaign/{campaign_id}")
+        assert response.status_code == 200
+        assert "ETag" in response.headers
+
+        expected = my_projects_service.get_campaign_click_data(db_session, user_id, campaign_id)
+        rendered, stdlib = self._reference_bodies(expected)
+        assert response.content == rendered == stdlib
+
+    def test_legacy_null_columns_fail_validation_as_before(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that NULL required columns raise the response model's ValidationError, not a TypeError."""
+        campaign = db_session.get(Campaign, sample_campaigns["campaign1"].id)
+        campaign.budget = None
+        campaign.target_views = None
+        campaign.summary = None
+        db_session.commit()
+
+        for user in ("brand", "creator1"):
+            user_id = sample_users[user].id
+            for view in ("full", "card"):
+                with pytest.raises(ValidationError) as error:
+                    my_projects_service.get_user_projects(db_session, user_id, view=view)
+                assert {e["loc"] for e in error.value.errors()} == {("summary",), ("budget",), ("target_views",)}
+            # A ValidationError is a ValueError, which the router has always mapped to 404
+            assert client.get(f"/my-projects/test/applications/{user_id}").status_code == 404
+
+        # Nullable legacy columns still serialize as null
+        campaign.budget, campaign.target_views, campaign.summary = 10.0, 5, "s"
+        campaign.poster_url = None
+        db_session.commit()
+        response = client.get(f"/my-projects/test/applications/{sample_users['brand'].id}")
+        assert response.status_code == 200
+        assert response.json()["campaigns"][-1]["poster_url"] is None
+
+    def test_legacy_null_applicant_columns_fail_validation_as_before(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that NULL required applicant columns raise ValidationError in every click builder."""
+        participation = db_session.get(CampaignParticipation, 1)
+        participation.applied_at = None
+        db_session.get(User, participation.user_id).username = None
+        db_session.commit()
+        owner_id = sample_users["brand"].id
+        applicant_id = participation.user_id
+
+        with pytest.raises(ValidationError) as error:
+            my_projects_service.get_campaign_click_data(db_session, owner_id, "1")
+        assert {e["loc"] for e in error.value.errors()} == {("username",), ("applied_at",)}
+        with pytest.raises(ValidationError) as error:
+            my_projects_service.get_campaign_click_data(db_session, applicant_id, "1")
+        assert {e["loc"] for e in error.value.errors()} == {("applied_at",)}
+        with pytest.raises(ValidationError):
+            my_projects_service.get_changes(db_session, owner_id)
+
+        batch = my_projects_service.get_campaign_click_data_batch(db_session, owner_id, ["1"])
+        assert batch.results[0].status_code == 400
+        response = client.get(f"/my-projects/test/applications/{owner_id}/campaign/1")
+        assert response.status_code == 400
+
+    def test_batch_bytes_match_validated_rendering(self, db_session, sample_users, unicode_campaign):
+        """Test that batch results, including error items, render the bytes of a validated response."""
+        user_id = sample_users["creator2"].id
+        campaign_ids = ["1", "3", "4", "2", "999", "abc"]
+        response = client.post(
+            f"/my-projects/test/applications/{user_id}/batch",
+            json={"campaign_ids": campaign_ids},
+        )
+        assert response.status_code == 200
+
+        expected = my_projects_service.get_campaign_click_data_batch(db_session, user_id, campaign_ids)
+        rendered, stdlib = self._reference_bodies(expected)
+        assert response.content == rendered == stdlib
+
+
+class TestMyProjectsChanges:
+    """Test delta sync via the changes endpoint."""
+
+    @staticmethod
+    def _age_rows(db_session, seconds=3600):
+        """Move every campaign/participation updated_at into the past."""
+        past = datetime.utcnow() - timedelta(seconds=seconds)
+        db_session.execute(update(Campaign).values(updated_at=past))
+        db_session.execute(update(CampaignParticipation).values(updated_at=past))
+        db_session.commit()
+
+    @staticmethod
+    def _changes(user_id, since=None):
+        params = {"since": since} if since is not None else {}
+        response = client.get(f"/my-projects/test/applications/{user_id}/changes", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        return data, {c["id"] for c in data["campaigns"]}, {a["participation_id"] for a in data["applicants"]}
+
+    def _tokens(self, sample_users):
+        """Current sync token per user, after the seed data has aged."""
+        return {name: self._changes(user.id)[0]["next_since"] for name, user in sample_users.items()}
+
+    def test_initial_sync_returns_everything(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that polling without a token returns the whole list and all applicants."""
+        brand, campaigns, applicants = self._changes(sample_users["brand"].id)
+        assert campaigns == {"1", "2"}
+        assert applicants == {"1", "2", "3"}
+        assert brand["next_since"]
+
+        full = client.get(f"/my-projects/test/applications/{sample_users['creator1'].id}").json()
+        creator, campaigns, applicants = self._changes(sample_users["creator1"].id)
+        assert creator["campaigns"] == full["campaigns"]
+        assert applicants == {"4"}
+
+    def test_quiet_poll_returns_nothing(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that nothing is returned when nothing changed since the token."""
+        self._age_rows(db_session)
+        tokens = self._tokens(sample_users)
+
+        for name, user in sample_users.items():
+            data, campaigns, applicants = self._changes(user.id, tokens[name])
+            assert campaigns == set() and applicants == set()
+            assert data["next_since"]
+
+    def test_approval_is_seen_by_owner_and_applicant(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that an approval shows up as a changed entry for both sides."""
+        self._age_rows(db_session)
+        tokens = self._tokens(sample_users)
+
+        participation = db_session.get(CampaignParticipation, 1)
+        participation.is_pending = False
+        participation.is_approved = True
+        db_session.commit()
+
+        brand, campaigns, applicants = self._changes(sample_users["brand"].id, tokens["brand"])
+        assert campaigns == {"1"} and applicants == {"1"}
+        assert brand["campaigns"][0]["application_stats"]["approved"] == 1
+        assert brand["applicants"][0]["status"] == "approved"
+        assert brand["applicants"][0]["campaign_id"] == "1"
+
+        creator, campaigns, applicants = self._changes(sample_users["creator1"].id, tokens["creator1"])
+        assert campaigns == {"1"} and applicants == set()
+        assert creator["campaigns"][0]["application_status"] == "approved"
+
+        _, campaigns, applicants = self._changes(sample_users["creator2"].id, tokens["creator2"])
+        assert campaigns == set() and applicants == set()
+
+    def test_campaign_edit_and_new_application(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that campaign edits reach applicants and new applications reach the owner."""
+        self._age_rows(db_session)
+        tokens = self._tokens(sample_users)
+
+        db_session.get(Campaign, 2).title = "Renamed campaign"
+        db_session.add(CampaignParticipation(
+            id=5,
+            user_id=sample_users["creator2"].id,
+            campaign_id=3,
+            reason_for_participation="Second try",
+            is_pending=True,
+            is_approved=False,
+            terms_accepted=True,
+        ))
+        db_session.commit()
+
+        _, campaigns, applicants = self._changes(sample_users["brand"].id, tokens["brand"])
+        assert campaigns == {"2"} and applicants == set()
+
+        creator1, campaigns, applicants = self._changes(sample_users["creator1"].id, tokens["creator1"])
+        assert campaigns == {"2", "3"} and applicants == {"5"}
+        titles = {c["id"]: c["title"] for c in creator1["campaigns"]}
+        assert titles["2"] == "Renamed campaign"
+
+        _, campaigns, applicants = self._changes(sample_users["creator2"].id, tokens["creator2"])
+        assert campaigns == {"3"} and applicants == set()
+
+    def test_overlap_window_catches_late_commits(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that rows stamped shortly before the token are returned again."""
+        self._age_rows(db_session)
+        token = self._tokens(sample_users)["creator1"]
+        issued = service_module._decode_since(token)
+
+        db_session.execute(
+            update(CampaignParticipation).where(CampaignParticipation.id == 4)
+            .values(updated_at=issued - timedelta(seconds=service_module.CHANGES_OVERLAP_SECONDS / 2))
+        )
+        db_session.execute(
+            update(CampaignParticipation).where(CampaignParticipation.id == 2)
+            .values(updated_at=issued - timedelta(seconds=service_module.CHANGES_OVERLAP_SECONDS * 2))
+        )
+        db_session.commit()
+
+        _, campaigns, applicants = self._changes(sample_users["creator1"].id, token)
+        assert campaigns == {"3"}
+        assert applicants == {"4"}
+
+    def test_errors(self, db_session, sample_users, sample_campaigns):
+        """Test bad tokens and unknown users."""
+        url = f"/my-projects/test/applications/{sample_users['brand'].id}/changes"
+        assert client.get(url, params={"since": "garbage"}).status_code == 400
+        assert client.get("/my-projects/test/applications/nobody/changes").status_code == 404
+
+    def test_changes_route_precedes_campaign_route(self):
+        """Test that /applications/changes is not captured by /applications/{campaign_id}."""
+        for my_projects_router in (router, async_router):
+            paths = [route.path for route in my_projects_router.routes]
+            assert paths.index("/my-projects/applications/changes") < paths.index(
+                "/my-projects/applications/{campaign_id}"
+            )
+
+    def test_poll_query_budget(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that a poll costs entries + applicants statements, plus the user check when empty."""
+        self._age_rows(db_session)
+        token = self._tokens(sample_users)["brand"]
+        response = client.get(
+            f"/my-projects/test/applications/{sample_users['brand'].id}/changes", params={"since": token}
+        )
+        assert_max_queries(response, 3)
+
+    def test_create_indexes_restores_missing_index(self):
+        """Test that create_indexes only creates indexes that are missing."""
+        assert create_indexes(engine) == []
+        participations_user_updated_at.drop(engine)
+
+        assert create_indexes(engine) == [participations_user_updated_at.name]
+        index_names = {ix["name"] for ix in inspect(engine).get_indexes("campaign_participations")}
+        assert participations_user_updated_at.name in index_names
+
+
+class TestMyProjectsEvents:
+    """Test that committed writes are published as server-sent events."""
+
+    @staticmethod
+    def _events_after(user_id, last_event_id):
+        async def replay():
+            subscription = event_broker.subscribe(user_id, last_event_id)
+            subscription.close()
+            return subscription.replay
+        return asyncio.run(replay())
+
+    def test_status_change_and_new_applicant_are_published(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test application_status to the applicant and new_applicant to the owner."""
+        marker = event_broker.publish("marker", "marker", {}).id
+
+        participation = db_session.get(CampaignParticipation, 1)
+        participation.is_pending = False
+        participation.is_approved = True
+        participation.review_message = "Welcome!"
+        db_session.add(CampaignParticipation(
+            id=5,
+            user_id=sample_users["creator2"].id,
+            campaign_id=2,
+            reason_for_participation="Me too",
+            is_pending=True,
+            is_approved=False,
+            terms_accepted=True,
+        ))
+        db_session.commit()
+
+        applicant_events = self._events_after(sample_users["creator1"].id, marker)
+        assert [(e.event, e.data) for e in applicant_events] == [("application_status", {
+            "campaign_id": "1",
+            "participation_id": "1",
+            "status": "approved",
+            "review_message": "Welcome!",
+            "rejection_reason": None,
+        })]
+        owner_events = self._events_after(sample_users["brand"].id, marker)
+        assert [(e.event, e.data) for e in owner_events] == [("new_applicant", {
+            "campaign_id": "2",
+            "participation_id": "5",
+            "user_id": sample_users["creator2"].id,
+            "status": "pending",
+        })]
+
+    def test_rolled_back_and_unrelated_writes_are_not_published(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that rollbacks and non-status edits publish nothing."""
+        marker = event_broker.publish("marker", "marker", {}).id
+
+        db_session.get(CampaignParticipation, 1).is_pending = False
+        db_session.flush()
+        db_session.rollback()
+        db_session.get(CampaignParticipation, 2).terms_accepted = False
+        db_session.commit()
+
+        assert self._events_after(sample_users["creator1"].id, marker) == []
+
+    def test_stream_endpoint_replays_after_last_event_id(
+        self, db_session, sample_users, sample_campaigns, sample_participations, monkeypatch
+    ):
+        """Test the SSE endpoint: headers, replay after Last-Event-ID and the end of the stream."""
+        monkeypatch.setattr(router_module, "ENABLE_TEST_EVENT_STREAM", True)
+        monkeypatch.setattr(events_module, "STREAM_SECONDS", 0.05)
+        monkeypatch.setattr(events_module, "HEARTBEAT_SECONDS", 0.01)
+        marker = event_broker.publish("marker", "marker", {}).id
+        participation = db_session.get(CampaignParticipation, 3)
+        participation.rejection_reason = "Still not enough followers"
+        db_session.commit()
+
+        user_id = sample_users["creator2"].id
+        response = client.get(
+            f"/my-projects/test/events/{user_id}", headers={"Last-Event-ID": str(marker)}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["cache-control"] == "no-cache"
+        assert "event: application_status" in response.text
+        assert '"rejection_reason":"Still not enough followers"' in response.text
+        assert ": heartbeat" in response.text
+
+        bad = client.get(f"/my-projects/test/events/{user_id}", headers={"Last-Event-ID": "nope"})
+        assert bad.status_code == 400
+
+    def test_test_stream_is_off_by_default(self, sample_users):
+        """Test that the unauthenticated event stream needs its own flag on top of the test endpoints."""
+        assert router_module.ENABLE_TEST_EVENT_STREAM is False
+        response = client.get(f"/my-projects/test/events/{sample_users['creator1'].id}")
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize("stream_router", [router, async_router], ids=["sync", "async"])
+    def test_stream_releases_db_connection(self, stream_router, tmp_path, monkeypatch):
+        """Test that an open stream does not keep a pooled connection checked out."""
+        monkeypatch.setattr(events_module, "STREAM_SECONDS", 0.05)
+        monkeypatch.setattr(events_module, "HEARTBEAT_SECONDS", 0.01)
+        file_engine = create_engine(f"sqlite:///{tmp_path / 'events.db'}", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=file_engine)
+        FileSession = sessionmaker(autocommit=False, autoflush=False, bind=file_engine)
+        with FileSession() as db:
+            db.add(User(id="u1", username="u1", email="u1@test.com", hashed_password="x"))
+            db.commit()
+
+        def file_get_db():
+            db = FileSession()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        def current_user(db=Depends(get_db)):
+            return db.get(User, "u1")
+
+        stream_app = FastAPI()
+        stream_app.include_router(stream_router)
+        stream_app.dependency_overrides[get_db] = file_get_db
+        stream_app.dependency_overrides[get_current_user] = current_user
+        checked_out = []
+
+        async def receive():
+            await asyncio.sleep(5)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                checked_out.append(file_engine.pool.checkedout())
+
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": "/my-projects/events", "raw_path": b"/my-projects/events",
+            "root_path": "", "query_string": b"", "headers": [], "server": ("test", 80), "client": ("test", 1),
+        }
+        asyncio.run(stream_app(scope, receive, send))
+        file_engine.dispose()
+
+        assert checked_out and set(checked_out) == {0}
+
+
+class TestMyProjectsCounts:
+    """Test the badge-count endpoint."""
+
+    @pytest.mark.parametrize("user,as_owner,as_applicant", [
+        ("brand", (3, 1, 1, 1), (0, 0, 0, 0)),
+        ("creator1", (1, 1, 0, 0), (2, 1, 1, 0)),
+        ("creator2", (0, 0, 0, 0), (2, 1, 0, 1)),
+    ])
+    def test_counts_per_role_and_status(
+        self, db_session, sample_users, sample_campaigns, sample_participations, user, as_owner, as_applicant
+    ):
+        """Test owner-side totals and applicant-side counts per status."""
+        user_id = sample_users[user].id
+        response = client.get(f"/my-projects/test/counts/{user_id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        fields = ("total", "pending", "approved", "rejected")
+        assert data == {
+            "user_id": user_id,
+            "as_owner": dict(zip(fields, as_owner)),
+            "as_applicant": dict(zip(fields, as_applicant)),
+        }
+
+    def test_counts_match_the_full_list(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that the counts agree with what clients used to tally from the list."""
+        user_id = sample_users["creator1"].id
+        counts = client.get(f"/my-projects/test/counts/{user_id}").json()
+        campaigns = client.get(f"/my-projects/test/applications/{user_id}").json()["campaigns"]
+
+        owned = [c["application_stats"] for c in campaigns if c["user_role"] == "owner"]
+        assert counts["as_owner"]["pending"] == sum(stats["pending"] for stats in owned)
+        applied = [c["application_status"] for c in campaigns if c["user_role"] == "applicant"]
+        assert counts["as_applicant"]["total"] == len(applied)
+        assert counts["as_applicant"]["approved"] == applied.count("approved")
+
+    def test_counts_are_one_query_without_building_campaigns(
+        self, db_session, sample_users, sample_campaigns, sample_participations, monkeypatch
+    ):
+        """Test that counts never load campaigns into response models."""
+        def fail(*args, **kwargs):
+            raise AssertionError("counts must not build campaign entries")
+
+        monkeypatch.setattr(service_module, "_row_to_campaign", fail)
+        response = client.get(f"/my-projects/test/counts/{sample_users['brand'].id}")
+
+        assert response.status_code == 200
+        assert query_count(response) == 1
+
+    def test_unknown_user_is_404(self, db_session, sample_users):
+        """Test that counts for a missing user are 404, and all-zero counts for a known user are not."""
+        assert client.get("/my-projects/test/counts/nobody").status_code == 404
+        response = client.get(f"/my-projects/test/counts/{sample_users['creator2'].id}")
+        assert response.status_code == 200
+        assert response.json()["as_owner"]["total"] == 0
+
+
+class TestMyProjectsQueryPlans:
+    """Every service query uses an index: no plan falls back to a full table scan."""
+
+    # "SCAN <table>" without "USING ... INDEX" reads the whole table;
+    # "SCAN <subquery>" (the UNION merge) and "SEARCH" are fine
+    FULL_SCAN = re.compile(r"\bSCAN (\w+)(?! USING)")
+
+    @staticmethod
+    def _service_statements(sample_users):
+        """(statement, parameters) of each query the service issues for the read paths"""
+        brand = sample_users["brand"].id
+        creator = sample_users["creator1"].id
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            with TestingSessionLocal() as db:
+                for user_id in (brand, creator):
+                    my_projects_service.get_user_projects(db, user_id)
+                    my_projects_service.get_user_projects(db, user_id, limit=1)
+                    my_projects_service.get_user_projects(
+                        db, user_id, limit=1, filters=ProjectFilters(status="active", category="TECH")
+                    )
+                    list(my_projects_service.stream_user_projects(db, user_id, view="card"))
+                    my_projects_service.get_projects_version(db, user_id)
+                    my_projects_service.get_project_counts(db, user_id)
+                    my_projects_service.get_changes(db, user_id)
+                    my_projects_service.get_campaign_version(db, user_id, "1")
+                    my_projects_service.get_campaign_click_data_batch(db, user_id, ["1", "2", "3"])
+                first = my_projects_service.get_campaign_click_data(db, brand, "1", limit=1)
+                my_projects_service.get_campaign_click_data(db, brand, "1", limit=1, cursor=first.next_cursor)
+                my_projects_service.get_campaign_click_data(db, creator, "1")
+                my_projects_service.get_changes(
+                    db, creator, service_module._encode_since(datetime.utcnow() - timedelta(hours=1))
+                )
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+        return statements
+
+    def test_service_queries_use_indexes(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that the plan of each read query searches indexes instead of scanning tables."""
+        tables = set(Base.metadata.tables)
+        statements = self._service_statements(sample_users)
+        assert len(statements) > 30
+
+        full_scans = []
+        with engine.connect() as connection:
+            for statement, parameters in statements:
+                plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+                for row in plan:
+                    match = self.FULL_SCAN.search(row.detail)
+                    if match and match.group(1) in tables:
+                        full_scans.append((row.detail, statement))
+
+        assert not full_scans, "\n\n".join(f"{detail}\n{statement}" for detail, statement in full_scans)
+
+    def test_applicant_pages_are_read_in_index_order(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Test that paging applicants by applied_at needs no sort step."""
+        statement = service_module._applicants_statement(
+            "1", after=(datetime.utcnow(), 10), limit=20
+        ).compile(engine)
+        parameters = tuple(statement.params[name] for name in statement.positiontup)
+        with engine.connect() as connection:
+            plan = [row.detail for row in connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )]
+
+        assert any("ix_campaign_participations_campaign_id_applied_at" in detail for detail in plan)
+        assert not any("TEMP B-TREE" in detail for detail in plan)
+
+    def test_full_scan_is_detected(self, db_session, sample_users):
+        """Test that the check catches a query no index serves."""
+        with engine.connect() as connection:
+            plan = connection.exec_driver_sql(
+                "EXPLAIN QUERY PLAN SELECT * FROM campaigns WHERE title = ?", ("x",)
+            ).all()
+        assert any(
+            self.FULL_SCAN.search(row.detail) and self.FULL_SCAN.search(row.detail).group(1) == "campaigns"
+            for row in plan
+        )
+
+
+class TestMyProjectsSingleFlight:
+    """Test coalescing of identical concurrent service calls."""
+
+    @pytest.fixture
+    def gated_service(self):
+        """A service whose list loads wait for `release`, counting loads per user."""
+        service = MyProjectsService(flights=SingleFlight(enabled=True))
+        release = threading.Event()
+        loads = []
+        load = service._load_user_projects
+
+        def gated_load(db, user_id, *args):
+            loads.append(user_id)
+            release.wait(5)
+            return load(db, user_id, *args)
+
+        service._load_user_projects = gated_load
+        return service, release, loads
+
+    @staticmethod
+    def _start(service, user_id, results):
+        def call():
+            with TestingSessionLocal() as db:
+                results.append(service.get_user_projects(db, user_id))
+
+        thread = threading.Thread(target=call)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _wait_for(condition):
+        deadline = time.monotonic() + 5
+        while not condition():
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+
+    def test_concurrent_list_loads_share_one_computation(
+        self, db_session, sample_users, sample_campaigns, sample_participations, gated_service
+    ):
+        """Test that callers arriving while a load runs get its result."""
+        service, release, loads = gated_service
+        user_id = sample_users["creator1"].id
+        results = []
+        threads = [self._start(service, user_id, results) for _ in range(4)]
+        self._wait_for(lambda: service.flights.in_flight() == 1 and len(loads) == 1)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert loads == [user_id]
+        assert len(results) == 4
+        assert all(result is results[0] for result in results)
+        assert results[0].total_campaigns == 3
+
+    def test_calls_after_a_commit_start_a_new_computation(
+        self, db_session, sample_users, sample_campaigns, sample_participations, gated_service
+    ):
+        """Test that a write committed during a load is seen by later callers."""
+        service, release, loads = gated_service
+        user_id = sample_users["creator1"].id
+        before, after = [], []
+        first = self._start(service, user_id, before)
+        self._wait_for(lambda: len(loads) == 1)
+
+        db_session.get(Campaign, 1).title = "Renamed while loading"
+        db_session.commit()
+        second = self._start(service, user_id, after)
+        self._wait_for(lambda: len(loads) == 2)
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        titles = {c.id: c.title for c in after[0].campaigns}
+        assert titles["1"] == "Renamed while loading"
+
 
 class TestMyProjectsResponseStructure:
     """Test the response structure matches the expected schema."""
@@ -561,6 +2404,43 @@ class TestMyProjectsResponseStructure:
         assert "approved" in campaign["application_stats"]
         assert "rejected" in campaign["application_stats"]
 
+    def test_card_view_omits_description(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Verify view=card returns compact entries without description."""
+        user_id = sample_users["creator1"].id
+        full = client.get(f"/my-projects/test/applications/{user_id}").json()
+        response = client.get(f"/my-projects/test/applications/{user_id}?view=card")
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["total_campaigns"] == full["total_campaigns"]
+        assert all("description" in c for c in full["campaigns"])
+        for card, campaign in zip(data["campaigns"], full["campaigns"]):
+            assert "description" not in card
+            campaign.pop("description")
+            assert card == campaign
+
+    def test_campaign_field_order(
+        self, db_session, sample_users, sample_campaigns, sample_participations
+    ):
+        """Verify campaign keys keep their original order in both views."""
+        user_id = sample_users["creator1"].id
+        full = client.get(f"/my-projects/test/applications/{user_id}").json()
+        card = client.get(f"/my-projects/test/applications/{user_id}?view=card").json()
+
+        expected = [
+            "id", "title", "summary", "description", "budget", "target_views",
+            "poster_url", "category", "status", "created_at", "user_role",
+            "application_stats", "application_status", "applied_at",
+            "approved_at", "review_message", "rejection_reason",
+        ]
+        for campaign in full["campaigns"]:
+            assert list(campaign) == expected
+        for campaign in card["campaigns"]:
+            assert list(campaign) == [key for key in expected if key != "description"]
+
     def test_campaign_schema_for_applicant(
         self, db_session, sample_users, sample_campaigns, sample_participations
     ):
@@ -0,0 +1,226 @@
+"""
+Tests for the async my-projects router and AsyncMyProjectsService.
+
+The async endpoints must return exactly what the sync service returns for
+the same data, so every check compares against MyProjectsService output.
+"""
+
+import json
+import pytest
+from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("aiosqlite")
+
+from core.database import Base, get_db
+from core.models import User, Campaign, CampaignParticipation
+from src.campaign.my_projects.async_database import (
+    async_session_dependency,
+    get_async_current_user,
+    get_async_db,
+)
+from src.campaign.my_projects.async_router import async_router
+from src.campaign.my_projects.cache import projects_cache
+from src.campaign.my_projects.instrumentation import assert_max_queries, query_count
+from src.campaign.my_projects import migrations
+from src.campaign.my_projects.service import my_projects_service
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """A SQLite file shared by a sync session (seeding, reference) and the async app."""
+    # Startup migrations target core.database's engine, not this file
+    monkeypatch.setattr(migrations, "MY_PROJECTS_MIGRATE_ON_STARTUP", False)
+    path = tmp_path / "my_projects.db"
+    engine = create_engine(f"sqlite:///{path}")
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    projects_cache.clear()
+
+    AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    db = sessionmaker(bind=engine)()
+    db.add_all([
+        User(id="brand", username="brand", email="brand@test.com", hashed_password="x"),
+        User(id="creator", username="creator", email="creator@test.com", hashed_password="x"),
+    ])
+    db.add_all([
+        Campaign(id=1, user_id="brand", title="Launch", summary="s", description="d",
+                 budget=100.0, target_views=10, category="TECH"),
+        Campaign(id=2, user_id="creator", title="Vlog", summary="s", description="d",
+                 budget=50.0, target_views=5, category="LIFE"),
+    ])
+    db.add(CampaignParticipation(
+        id=1, user_id="creator", campaign_id=1, reason_for_participation="hi",
+        is_pending=False, is_approved=True, review_message="welcome",
+    ))
+    db.commit()
+
+    with TestClient(app) as client:
+        yield client, db
+
+    db.close()
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+class TestAsyncMyProjects:
+    """The async router mirrors the sync service and router."""
+
+    @pytest.mark.parametrize("view", ["full", "card"])
+    def test_list_matches_sync_service(self, database, view):
+        client, db = database
+        for user_id in ("brand", "creator"):
+            response = client.get(f"/my-projects/test/applications/{user_id}", params={"view": view})
+            assert response.status_code == 200
+            projects_cache.clear()
+            expected = my_projects_service.get_user_projects(db, user_id, view=view)
+            assert response.json() == expected.model_dump(mode="json")
+
+    def test_paginated_list_matches_sync_service(self, database):
+        client, db = database
+        response = client.get("/my-projects/test/applications/creator", params={"limit": 1})
+        assert response.status_code == 200
+        expected = my_projects_service.get_user_projects(db, "creator", limit=1)
+        assert response.json() == expected.model_dump(mode="json")
+        assert response.json()["next_cursor"] is not None
+
+    @pytest.mark.parametrize("user_id", ["brand", "creator"])
+    def test_click_view_matches_sync_service(self, database, user_id):
+        client, db = database
+        response = client.get(f"/my-projects/test/applications/{user_id}/campaign/1")
+        assert response.status_code == 200
+        expected = my_projects_service.get_campaign_click_data(db, user_id, "1")
+        assert response.json() == expected.model_dump(mode="json")
+        assert response.headers["ETag"] == my_projects_service.get_campaign_version(
+            db, user_id, "1", None, None
+        )
+
+    def test_ndjson_stream_matches_sync_service(self, database):
+        client, db = database
+        response = client.get(
+            "/my-projects/test/applications/creator",
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        expected = my_projects_service.get_user_projects(db, "creator")
+        assert lines == expected.model_dump(mode="json")["campaigns"]
+
+    def test_batch_matches_sync_service(self, database):
+        client, db = database
+        response = client.post(
+            "/my-projects/test/applications/creator/batch",
+            json={"campaign_ids": ["1", "2", "3"]},
+        )
+        assert response.status_code == 200
+        expected = my_projects_service.get_campaign_click_data_batch(db, "creator", ["1", "2", "3"])
+        assert response.json() == expected.model_dump(mode="json")
+
+    @pytest.mark.parametrize("user_id", ["brand", "creator"])
+    def test_changes_match_sync_service(self, database, user_id):
+        client, db = database
+        response = client.get(f"/my-projects/test/applications/{user_id}/changes")
+        assert response.status_code == 200
+        expected = my_projects_service.get_changes(db, user_id).model_dump(mode="json")
+        data = response.json()
+        assert data.pop("next_since")
+        expected.pop("next_since")
+        assert data == expected
+
+        since = my_projects_service.get_changes(db, user_id).next_since
+        response = client.get(f"/my-projects/test/applications/{user_id}/changes", params={"since": since})
+        expected = my_projects_service.get_changes(db, user_id, since).model_dump(mode="json")
+        data = response.json()
+        data.pop("next_since")
+        expected.pop("next_since")
+        assert data == expected
+
+    @pytest.mark.parametrize("user_id", ["brand", "creator"])
+    def test_counts_match_sync_service(self, database, user_id):
+        client, db = database
+        response = client.get(f"/my-projects/test/counts/{user_id}")
+        assert response.status_code == 200
+        expected = my_projects_service.get_project_counts(db, user_id)
+        assert response.json() == expected.model_dump(mode="json")
+        assert query_count(response) == 1
+
+    def test_error_mapping(self, database):
+        client, _ = database
+        assert client.get("/my-projects/test/applications/missing").status_code == 404
+        assert client.get("/my-projects/test/counts/missing").status_code == 404
+        assert client.get("/my-projects/test/applications/brand/campaign/99").status_code == 404
+        assert client.get("/my-projects/test/applications/brand/campaign/2").status_code == 403
+        assert client.get(
+            "/my-projects/test/applications/brand", params={"cursor": "garbage"}
+        ).status_code == 400
+        assert client.get(
+            "/my-projects/test/applications/brand/changes", params={"since": "garbage"}
+        ).status_code == 400
+
+    def test_queries_are_counted_on_the_async_path(self, database):
+        client, _ = database
+        response = client.get("/my-projects/test/applications/creator/campaign/1")
+        assert_max_queries(response, 4)
+        assert query_count(response) > 0
+
+    def test_unchanged_list_returns_304(self, database):
+        client, _ = database
+        first = client.get("/my-projects/test/applications/brand")
+        second = client.get(
+            "/my-projects/test/applications/brand",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+        assert second.status_code == 304
+
+    def test_wildcard_etag_does_not_hide_missing_or_forbidden(self, database):
+        client, _ = database
+        wildcard = {"If-None-Match": "*"}
+        assert client.get("/my-projects/test/applications/missing", headers=wildcard).status_code == 404
+        assert client.get(
+            "/my-projects/test/applications/brand/campaign/99", headers=wildcard
+        ).status_code == 404
+        assert client.get(
+            "/my-projects/test/applications/brand/campaign/2", headers=wildcard
+        ).status_code == 403
+
+    def test_authenticated_routes_look_up_the_user_on_the_async_session(self, database):
+        client, db = database
+
+        def current_user(x_test_user: str = Header(None), session: Session = Depends(get_db)):
+            user = session.query(User).filter(User.id == x_test_user).first()
+            if not user:
+                raise HTTPException(status_code=401)
+            return user
+
+        def no_sync_session():
+            raise AssertionError("the async routes must not open a sync session")
+
+        client.app.dependency_overrides[get_async_current_user] = async_session_dependency(current_user)
+        client.app.dependency_overrides[get_db] = no_sync_session
+
+        response = client.get("/my-projects/applications", headers={"X-Test-User": "creator"})
+        assert response.status_code == 200
+        assert response.json() == my_projects_service.get_user_projects(db, "creator").model_dump(mode="json")
+
+        response = client.get("/my-projects/applications/1", headers={"X-Test-User": "brand"})
+        assert response.status_code == 200
+        assert response.json()["user_role"] == "owner"
+
+        assert client.get("/my-projects/counts", headers={"X-Test-User": "nobody"}).status_code == 401
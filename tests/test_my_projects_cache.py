@@ -0,0 +1,95 @@
+"""
+Unit tests for the my-projects in-process result cache.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.campaign.my_projects.cache import ProjectsCache
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return ProjectsCache(maxsize=3, ttl=10, clock=clock)
+
+
+class TestProjectsCache:
+    """Test LRU, TTL and invalidation behavior."""
+
+    def test_miss_then_hit(self, cache):
+        """Test that a stored value is returned and counted."""
+        assert cache.get("u1", "full") is None
+        cache.set("u1", "full", "response")
+
+        assert cache.get("u1", "full") == "response"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entry_expires_after_ttl(self, cache, clock):
+        """Test that entries older than the TTL are dropped."""
+        cache.set("u1", "full", "response")
+        clock.now = 10
+
+        assert cache.get("u1", "full") is None
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["size"] == 0
+
+    def test_least_recently_used_entry_is_evicted(self, cache):
+        """Test that the LRU entry goes first when the cache is full."""
+        cache.set("u1", "full", 1)
+        cache.set("u2", "full", 2)
+        cache.set("u3", "full", 3)
+        cache.get("u1", "full")
+        cache.set("u4", "full", 4)
+
+        assert cache.get("u2", "full") is None
+        assert cache.get("u1", "full") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate_drops_every_variant_of_user(self, cache):
+        """Test that invalidating a user removes all their views."""
+        cache.set("u1", "full", 1)
+        cache.set("u1", "card", 2)
+        cache.set("u2", "full", 3)
+
+        assert cache.invalidate("u1") == 2
+        assert cache.get("u1", "full") is None
+        assert cache.get("u1", "card") is None
+        assert cache.get("u2", "full") == 3
+
+    def test_stale_compute_is_not_stored(self, cache):
+        """Test that a value computed before an invalidation is discarded."""
+        version = cache.version()
+        cache.invalidate("u1")
+
+        assert cache.set("u1", "full", "stale", version) is False
+        assert cache.get("u1", "full") is None
+
+    def test_disabled_cache(self, clock):
+        """Test that maxsize=0 disables caching."""
+        cache = ProjectsCache(maxsize=0, ttl=10, clock=clock)
+
+        assert cache.set("u1", "full", 1) is False
+        assert cache.get("u1", "full") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
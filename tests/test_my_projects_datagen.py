@@ -0,0 +1,33 @@
+"""
+Tests for the deterministic benchmark data generator.
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.datagen import FOCUS_USER_ID, SizeTier, generate_rows
+
+TINY = SizeTier("tiny", users=20, owned_campaigns=3, applicants_per_campaign=4,
+                applications=2, background_campaigns=5, background_applicants=2)
+
+
+def test_same_seed_generates_identical_rows():
+    assert generate_rows(TINY, seed=1) == generate_rows(TINY, seed=1)
+    assert generate_rows(TINY, seed=1) != generate_rows(TINY, seed=2)
+
+
+def test_focus_user_shape_follows_tier():
+    rows = generate_rows(TINY)
+    owned = {c["id"] for c in rows["campaigns"] if c["user_id"] == FOCUS_USER_ID}
+    applied = [p for p in rows["participations"] if p["user_id"] == FOCUS_USER_ID]
+
+    assert len(rows["users"]) == TINY.users
+    assert len(rows["campaigns"]) == TINY.owned_campaigns + TINY.applications + TINY.background_campaigns
+    assert len(owned) == TINY.owned_campaigns
+    assert len(applied) == TINY.applications
+    for campaign_id in owned:
+        applicants = [p for p in rows["participations"] if p["campaign_id"] == campaign_id]
+        assert len(applicants) == TINY.applicants_per_campaign
@@ -0,0 +1,169 @@
+"""
+Unit tests for the my-projects event broker and SSE stream.
+"""
+
+import asyncio
+import json
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.campaign.my_projects.events import (
+    EventBackend,
+    EventBroker,
+    event_stream,
+    parse_last_event_id,
+)
+
+
+def parse_messages(chunks):
+    """Split SSE output into (fields dict) messages, comments as {"comment": ...}"""
+    messages = []
+    for block in b"".join(chunks).decode().split("\n\n"):
+        if not block:
+            continue
+        fields = {}
+        for line in block.split("\n"):
+            if line.startswith(":"):
+                fields["comment"] = line[1:].strip()
+            else:
+                name, _, value = line.partition(": ")
+                fields[name] = value
+        messages.append(fields)
+    return messages
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+@pytest.fixture
+def broker():
+    return EventBroker(replay_size=3)
+
+
+class TestEventBroker:
+    """Test fan-out, replay and gap detection."""
+
+    def test_live_events_reach_only_the_users_streams(self, broker):
+        async def scenario():
+            mine = broker.subscribe("u1")
+            other = broker.subscribe("u2")
+            broker.publish("u1", "new_applicant", {"campaign_id": "1"})
+            await asyncio.sleep(0)
+            assert mine.queue.get_nowait().data == {"campaign_id": "1"}
+            assert other.queue.empty()
+            mine.close()
+            other.close()
+
+        asyncio.run(scenario())
+        assert broker.subscriber_count() == 0
+
+    def test_event_ids_increase(self, broker):
+        ids = [broker.publish("u1", "application_status", {}).id for _ in range(5)]
+        assert ids == sorted(set(ids))
+
+    def test_replay_after_last_event_id(self, broker):
+        first = broker.publish("u1", "application_status", {"n": 1})
+        broker.publish("u1", "application_status", {"n": 2})
+        broker.publish("u1", "application_status", {"n": 3})
+
+        async def scenario():
+            subscription = broker.subscribe("u1", first.id)
+            subscription.close()
+            return subscription
+
+        subscription = asyncio.run(scenario())
+        assert [event.data["n"] for event in subscription.replay] == [2, 3]
+        assert not subscription.missed
+
+    def test_gap_beyond_replay_buffer_is_missed(self, broker):
+        first = broker.publish("u1", "application_status", {"n": 1})
+        for n in range(2, 6):
+            broker.publish("u1", "application_status", {"n": n})
+
+        async def scenario():
+            subscription = broker.subscribe("u1", first.id)
+            subscription.close()
+            return subscription
+
+        subscription = asyncio.run(scenario())
+        assert [event.data["n"] for event in subscription.replay] == [3, 4, 5]
+        assert subscription.missed
+
+    def test_ids_from_before_the_broker_are_missed(self, broker):
+        async def scenario():
+            subscription = broker.subscribe("u1", 1)
+            subscription.close()
+            return subscription
+
+        assert asyncio.run(scenario()).missed
+
+    def test_pluggable_backend_carries_events(self):
+        class RecordingBackend(EventBackend):
+            """Stands in for a shared channel: records, then delivers"""
+            def __init__(self):
+                self.sent = []
+
+            def start(self, deliver):
+                self.deliver = deliver
+
+            def publish(self, event):
+                self.sent.append(event)
+                self.deliver(event)
+
+        backend = RecordingBackend()
+        broker = EventBroker(backend=backend)
+        published = broker.publish("u1", "new_applicant", {})
+
+        assert backend.sent == [published]
+
+
+class TestEventStream:
+    """Test the SSE message sequence of one connection."""
+
+    def test_replay_then_heartbeat_until_duration(self, broker):
+        first = broker.publish("u1", "application_status", {"status": "approved"})
+        second = broker.publish("u1", "new_applicant", {"user_id": "u2"})
+
+        chunks = asyncio.run(collect(event_stream(
+            "u1", first.id, broker=broker, heartbeat=0.01, duration=0.05
+        )))
+        messages = parse_messages(chunks)
+
+        assert messages[0] == {"retry": "3000"}
+        assert messages[1] == {"id": str(second.id), "event": "new_applicant", "data": '{"user_id":"u2"}'}
+        assert {"comment": "heartbeat"} in messages[2:]
+        assert broker.subscriber_count() == 0
+
+    def test_live_events_are_streamed(self, broker):
+        async def scenario():
+            stream = event_stream("u1", broker=broker, heartbeat=1, duration=1)
+            assert await stream.__anext__() == b"retry: 3000\n\n"
+            # The subscription exists once the stream has started
+            event = broker.publish("u1", "application_status", {"status": "rejected"})
+            chunk = await stream.__anext__()
+            await stream.aclose()
+            return event, chunk
+
+        event, chunk = asyncio.run(scenario())
+        assert chunk == event.encode()
+        assert json.loads(parse_messages([chunk])[0]["data"]) == {"status": "rejected"}
+        assert broker.subscriber_count() == 0
+
+    def test_missed_events_send_resync(self, broker):
+        messages = parse_messages(asyncio.run(collect(event_stream(
+            "u1", 1, broker=broker, heartbeat=1, duration=0
+        ))))
+        assert messages[1]["event"] == "resync"
+        assert int(messages[1]["id"]) > 1
+
+    def test_parse_last_event_id(self):
+        assert parse_last_event_id(None) is None
+        assert parse_last_event_id(" ") is None
+        assert parse_last_event_id("42") == 42
+        with pytest.raises(ValueError, match="Invalid Last-Event-ID"):
+            parse_last_event_id("abc")
@@ -0,0 +1,84 @@
+"""
+Unit tests for the my-projects metrics registry.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.campaign.my_projects.metrics import MetricsRegistry, request_labels, service_duration, timed_service_method
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestHistogram:
+    """Test histogram bookkeeping and text exposition."""
+
+    def test_buckets_are_cumulative(self, registry):
+        histogram = registry.histogram("latency_seconds", "Latency", ("route",), (0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value, route="/a")
+
+        (cumulative, count, total), = histogram.snapshot().values()
+        assert cumulative == (1, 3, 4)
+        assert count == 4
+        assert total == pytest.approx(6.05)
+
+    def test_render_exposition_format(self, registry):
+        histogram = registry.histogram("latency_seconds", "Latency", ("route", "user_role"), (0.1,))
+        histogram.observe(0.05, route="/a", user_role="owner")
+        histogram.observe(0.2, route='/b"', user_role="applicant")
+
+        text = registry.render()
+
+        assert "# HELP latency_seconds Latency\n# TYPE latency_seconds histogram\n" in text
+        assert 'latency_seconds_bucket{route="/a",user_role="owner",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{route="/a",user_role="owner",le="+Inf"} 1' in text
+        assert 'latency_seconds_bucket{route="/b\\"",user_role="applicant",le="0.1"} 0' in text
+        assert 'latency_seconds_count{route="/b\\"",user_role="applicant"} 1' in text
+        assert text.endswith("\n")
+
+    def test_clear_keeps_definitions(self, registry):
+        histogram = registry.histogram("x", "X", ("a",))
+        histogram.observe(1, a="1")
+        registry.clear()
+        assert registry.histogram("x", "X", ("a",)) is histogram
+        assert histogram.snapshot() == {}
+
+
+class TestTimedServiceMethod:
+    """Test the service method decorator for sync and async methods."""
+
+    def test_sync_and_async_methods_record_role(self):
+        @timed_service_method("sync_method", lambda result: (result, 1))
+        def sync_method(role):
+            return role
+
+        @timed_service_method("async_method", lambda result: (result, 1))
+        async def async_method(role):
+            return role
+
+        with request_labels() as labels:
+            assert sync_method("owner") == "owner"
+            assert labels["user_role"] == "owner"
+            assert asyncio.run(async_method("applicant")) == "applicant"
+
+        snapshot = service_duration.snapshot()
+        assert ("sync_method", "owner") in snapshot
+        assert ("async_method", "applicant") in snapshot
+
+    def test_failures_are_recorded_as_errors(self):
+        @timed_service_method("failing_method", lambda result: ("owner", 1))
+        def failing_method():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            failing_method()
+        assert ("failing_method", "error") in service_duration.snapshot()
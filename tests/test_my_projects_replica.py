@@ -0,0 +1,264 @@
+"""
+Tests for read-replica routing of the my-projects reads.
+
+Two SQLite files stand in for the primary and the replica. Both are
+seeded with the same rows; the primary then gets writes the replica has
+not "replicated", so each response shows which database served it.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import Base, get_db
+from core.models import User, Campaign, CampaignParticipation
+from src.campaign.my_projects import migrations
+from src.campaign.my_projects.async_database import get_async_db
+from src.campaign.my_projects.async_router import async_router
+from src.campaign.my_projects.cache import projects_cache
+from src.campaign.my_projects.read_database import ReplicaRouter, replica_router
+from src.campaign.my_projects.router import router
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def seed(engine):
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        db.add_all([
+            User(id="brand", username="brand", email="brand@test.com", hashed_password="x"),
+            User(id="creator", username="creator", email="creator@test.com", hashed_password="x"),
+        ])
+        db.add(Campaign(id=1, user_id="brand", title="Launch", summary="s", description="d",
+                        budget=100.0, target_views=10, category="TECH"))
+        db.add(CampaignParticipation(id=1, user_id="creator", campaign_id=1,
+                                     reason_for_participation="hi", is_pending=True, is_approved=False))
+        db.commit()
+
+
+@pytest.fixture
+def databases(tmp_path):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}", connect_args={"check_same_thread": False})
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}", connect_args={"check_same_thread": False})
+    seed(primary)
+    seed(replica)
+    PrimarySession = sessionmaker(autocommit=False, autoflush=False, bind=primary)
+    # A write the replica has not caught up with
+    with PrimarySession() as db:
+        db.get(Campaign, 1).title = "Launch (primary)"
+        db.commit()
+
+    def override_get_db():
+        db = PrimarySession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = override_get_db
+    clock = FakeClock()
+    replica_router.configure(replica, sticky_seconds=10, check_seconds=1, retry_seconds=30, clock=clock)
+    projects_cache.clear()
+    projects_cache.maxsize, cache_size = 0, projects_cache.maxsize
+
+    yield TestClient(app), PrimarySession, replica, clock
+
+    projects_cache.maxsize = cache_size
+    replica_router.configure(None)
+    primary.dispose()
+    replica.dispose()
+
+
+@pytest.fixture
+def async_databases(databases, tmp_path, monkeypatch):
+    """The same primary and replica behind the async router, with aiosqlite engines"""
+    pytest.importorskip("aiosqlite")
+    _, PrimarySession, replica, clock = databases
+    primary_async = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica_async = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    AsyncPrimarySession = async_sessionmaker(primary_async, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncPrimarySession() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    monkeypatch.setattr(migrations, "MY_PROJECTS_MIGRATE_ON_STARTUP", False)
+    replica_router.configure(
+        replica, sticky_seconds=10, check_seconds=1, retry_seconds=30, clock=clock,
+        async_replica_engine=replica_async,
+    )
+
+    with TestClient(app) as client:
+        yield client, PrimarySession, replica, clock
+
+
+def served_title(client, user_id="brand"):
+    response = client.get(f"/my-projects/test/applications/{user_id}")
+    assert response.status_code == 200
+    return response.json()["campaigns"][0]["title"]
+
+
+class TestReplicaRouting:
+    """Reads go to the replica unless it is unsafe."""
+
+    def test_reads_use_the_replica(self, databases):
+        client, _, _, _ = databases
+        assert served_title(client) == "Launch"
+        click = client.get("/my-projects/test/applications/brand/campaign/1").json()
+        assert click["campaign_title"] == "Launch"
+        counts = client.get("/my-projects/test/counts/brand")
+        assert counts.status_code == 200
+
+    def test_changes_stay_on_the_primary(self, databases):
+        client, _, _, _ = databases
+        response = client.get("/my-projects/test/applications/brand/changes")
+        assert response.json()["campaigns"][0]["title"] == "Launch (primary)"
+
+    def test_own_write_reads_primary_for_the_window(self, databases):
+        client, PrimarySession, _, clock = databases
+        with PrimarySession() as db:
+            participation = db.get(CampaignParticipation, 1)
+            participation.is_pending = False
+            participation.is_approved = True
+            db.commit()
+
+        # Both the applicant and the campaign owner see their write
+        assert served_title(client, "brand") == "Launch (primary)"
+        response = client.get("/my-projects/test/applications/creator")
+        assert response.json()["campaigns"][0]["application_status"] == "approved"
+
+        clock.now += 11
+        assert served_title(client, "brand") == "Launch"
+
+    def test_unreachable_replica_falls_back_to_primary(self, databases, tmp_path):
+        client, _, _, clock = databases
+        missing = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        replica_router.configure(missing, clock=clock)
+        assert served_title(client) == "Launch (primary)"
+        missing.dispose()
+
+    def test_failed_replica_is_retried_after_the_retry_time(self, databases):
+        client, _, replica, clock = databases
+        down = {"value": True}
+
+        def probe(connection):
+            if down["value"]:
+                raise OperationalError("SELECT 1", {}, Exception("replica down"))
+            return 0.0
+
+        replica_router.configure(replica, retry_seconds=30, lag_probe=probe, clock=clock)
+        assert served_title(client) == "Launch (primary)"
+
+        # Not probed again before the retry time, even once it is back
+        down["value"] = False
+        assert served_title(client) == "Launch (primary)"
+        clock.now += 31
+        assert served_title(client) == "Launch"
+
+    def test_lagging_replica_falls_back_to_primary(self, databases):
+        client, _, replica, clock = databases
+        lag = {"seconds": 12.0}
+        replica_router.configure(
+            replica, max_lag=5, check_seconds=1, lag_probe=lambda connection: lag["seconds"], clock=clock
+        )
+        assert served_title(client) == "Launch (primary)"
+
+        lag["seconds"] = 0.5
+        assert served_title(client) == "Launch (primary)"  # cached until the next check
+        clock.now += 1
+        assert served_title(client) == "Launch"
+
+
+class TestAsyncReplicaRouting:
+    """The async router applies the same routing with AsyncSessions."""
+
+    def test_reads_use_the_replica(self, async_databases):
+        client, _, _, _ = async_databases
+        assert served_title(client) == "Launch"
+        click = client.get("/my-projects/test/applications/brand/campaign/1").json()
+        assert click["campaign_title"] == "Launch"
+        assert client.get("/my-projects/test/counts/brand").status_code == 200
+
+    def test_changes_stay_on_the_primary(self, async_databases):
+        client, _, _, _ = async_databases
+        response = client.get("/my-projects/test/applications/brand/changes")
+        assert response.json()["campaigns"][0]["title"] == "Launch (primary)"
+
+    def test_own_write_reads_primary_for_the_window(self, async_databases):
+        client, PrimarySession, _, clock = async_databases
+        with PrimarySession() as db:
+            db.get(CampaignParticipation, 1).is_pending = False
+            db.commit()
+
+        assert served_title(client, "brand") == "Launch (primary)"
+        clock.now += 11
+        assert served_title(client, "brand") == "Launch"
+
+    def test_unhealthy_or_lagging_replica_falls_back_to_primary(self, async_databases, tmp_path):
+        client, _, replica, clock = async_databases
+        lag = {"seconds": 12.0}
+        replica_router.configure(
+            replica, max_lag=5, check_seconds=1, lag_probe=lambda connection: lag["seconds"], clock=clock,
+            async_replica_engine=create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"),
+        )
+        assert served_title(client) == "Launch (primary)"
+        lag["seconds"] = 0.5
+        clock.now += 1
+        assert served_title(client) == "Launch"
+
+        missing = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        replica_router.configure(
+            missing, clock=clock,
+            async_replica_engine=create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}"),
+        )
+        assert served_title(client) == "Launch (primary)"
+        missing.dispose()
+
+
+class TestReplicaRouter:
+    """Unit checks of the routing decision."""
+
+    def test_without_replica_everything_reads_primary(self):
+        router = ReplicaRouter(None)
+        router.mark_written("u1")
+        assert not router.use_replica("u1")
+        assert not router.use_replica(None)
+
+    def test_stickiness_is_per_user(self, tmp_path):
+        clock = FakeClock()
+        engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+        router = ReplicaRouter(engine, sticky_seconds=5, clock=clock)
+        router.mark_written("u1")
+
+        assert not router.use_replica("u1")
+        assert router.use_replica("u2")
+        clock.now += 5
+        assert router.use_replica("u1")
+        engine.dispose()
+
+    def test_async_engine_is_derived_from_the_replica_url(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+        router = ReplicaRouter(engine)
+        assert router.async_replica_engine().url.drivername == "sqlite+aiosqlite"
+        assert router.async_replica_engine().url.database == engine.url.database
+        engine.dispose()
@@ -12,7 +12,7 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.campaign.my_projects.service import MyProjectsService
+from src.campaign.my_projects.service import MyProjectsService, _application_status
 from src.campaign.my_projects.schemas import (
     MyProjectCampaign,
     MyProjectsResponse,
@@ -361,6 +361,14 @@ class TestStatusDetermination:
 
         assert status == "rejected"
 
+    def test_service_status_helper(self):
+        """Test the service's status helper, including NULL flags."""
+        assert _application_status(True, False) == "pending"
+        assert _application_status(True, True) == "pending"
+        assert _application_status(False, True) == "approved"
+        assert _application_status(False, False) == "rejected"
+        assert _application_status(None, None) == "rejected"
+
 
 class TestRoleDetermination:
     """Test role determination logic."""
@@ -0,0 +1,184 @@
+"""
+Unit tests for single-flight coalescing of my-projects service calls.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.campaign.my_projects.metrics import metrics_registry
+from src.campaign.my_projects.singleflight import SingleFlight, singleflight_calls
+
+
+@pytest.fixture
+def flights():
+    metrics_registry.clear()
+    return SingleFlight(enabled=True)
+
+
+def wait_for_waiters(flights, key, count):
+    """Block until `count` callers are waiting on the in-flight call of `key`"""
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        with flights._lock:
+            call = flights._calls.get(("load", key))
+            if call is not None and call.waiters >= count:
+                return
+        time.sleep(0.001)
+    raise AssertionError(f"{count} waiters never joined")
+
+
+def run_threads(flights, key, fn, count):
+    """Start `count` callers of `key`; returns (threads, results, errors)"""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flights.do("load", key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+class TestSingleFlightThreads:
+    """Test coalescing of concurrent calls from threads."""
+
+    def test_concurrent_callers_share_one_computation(self, flights):
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            release.wait(5)
+            return {"campaigns": []}
+
+        threads, results, errors = run_threads(flights, "u1", load, 5)
+        wait_for_waiters(flights, "u1", 4)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert len(results) == 5 and not errors
+        assert all(result is results[0] for result in results)
+        assert singleflight_calls.snapshot() == {("load", "executed"): 1, ("load", "coalesced"): 4}
+        assert flights.in_flight() == 0
+
+    def test_errors_reach_every_caller(self, flights):
+        release = threading.Event()
+
+        def load():
+            release.wait(5)
+            raise ValueError("User not found: u1")
+
+        threads, results, errors = run_threads(flights, "u1", load, 3)
+        wait_for_waiters(flights, "u1", 2)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert not results
+        assert [str(e) for e in errors] == ["User not found: u1"] * 3
+
+    def test_finished_calls_and_other_keys_are_not_shared(self, flights):
+        calls = []
+
+        def load():
+            calls.append(1)
+            return len(calls)
+
+        assert flights.do("load", "u1", load) == 1
+        assert flights.do("load", "u1", load) == 2
+        assert flights.do("load", "u2", load) == 3
+        assert singleflight_calls.snapshot() == {("load", "executed"): 3}
+
+    def test_disabled_runs_every_call(self):
+        flights = SingleFlight(enabled=False)
+        assert flights.do("load", "u1", lambda: 1) == 1
+        assert flights.in_flight() == 0
+
+
+class TestSingleFlightAsync:
+    """Test coalescing of concurrent tasks on one event loop."""
+
+    def test_concurrent_tasks_share_one_computation(self, flights):
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return object()
+
+        async def scenario():
+            return await asyncio.gather(*(flights.do_async("load", "u1", load) for _ in range(5)))
+
+        results = asyncio.run(scenario())
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert singleflight_calls.snapshot() == {("load", "executed"): 1, ("load", "coalesced"): 4}
+        assert flights.in_flight() == 0
+
+    def test_errors_reach_every_task(self, flights):
+        async def load():
+            await asyncio.sleep(0.01)
+            raise ValueError("Campaign not found: 9")
+
+        async def scenario():
+            return await asyncio.gather(
+                *(flights.do_async("load", "u1", load) for _ in range(3)), return_exceptions=True
+            )
+
+        assert [str(e) for e in asyncio.run(scenario())] == ["Campaign not found: 9"] * 3
+
+    def test_cancelled_leader_hands_over_to_a_waiter(self, flights):
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return len(calls)
+
+        async def scenario():
+            leader = asyncio.ensure_future(flights.do_async("load", "u1", load))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(flights.do_async("load", "u1", load))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await waiter
+
+        assert asyncio.run(scenario()) == 2
+        assert flights.in_flight() == 0
+
+    def test_cancelled_waiter_leaves_the_call_running(self, flights):
+        async def load():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def scenario():
+            leader = asyncio.ensure_future(flights.do_async("load", "u1", load))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(flights.do_async("load", "u1", load))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            return await leader
+
+        assert asyncio.run(scenario()) == "done"
+
+
+def test_counter_is_rendered(flights):
+    flights.do("load", "u1", lambda: None)
+    rendered = metrics_registry.render()
+    assert "# TYPE my_projects_singleflight_calls_total counter" in rendered
+    assert 'my_projects_singleflight_calls_total{method="load",outcome="executed"} 1' in rendered